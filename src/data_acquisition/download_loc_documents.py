@@ -5,6 +5,7 @@ This script uses the improved LoC scraper to download actual PDF/text files
 from Library of Congress pages.
 """
 
+import logging
 import sys
 from pathlib import Path
 
@@ -27,9 +28,6 @@ def main():
     print("Improved LoC Document Downloader")
     print("=" * 70)
     
-    # Initialize improved scraper
-    scraper = LoCScraperImproved()
-    
     # The 5 LoC URLs we need
     loc_urls = [
         "https://www.loc.gov/item/mal0440500/",  # Election night 1860
@@ -42,8 +40,9 @@ def main():
     print(f"\nDownloading {len(loc_urls)} documents...")
     print("This may take a few minutes as we download PDFs/text files.\n")
     
-    # Scrape documents
-    documents = scraper.scrape_all_documents(loc_urls)
+    # Scrape documents (one scraper, and one browser, for all URLs)
+    with LoCScraperImproved() as scraper:
+        documents = scraper.scrape_all_documents(loc_urls)
     
     print(f"\n{'='*70}")
     print(f"Download Summary")
@@ -66,5 +65,6 @@ def main():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     main()
 
@@ -5,16 +5,81 @@ This script will help diagnose why this specific document isn't being extracted.
 
 import sys
 import json
-import requests
+import logging
+import traceback
+import xml.sax
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from bs4 import BeautifulSoup
+from typing import Optional
+from bs4 import BeautifulSoup, SoupStrainer
 
 # Add project root to path
 script_dir = Path(__file__).parent
 project_root = script_dir.parent.parent
 sys.path.insert(0, str(project_root))
 
-from src.data_acquisition.loc_scraper_improved import LoCScraperImproved
+from src.data_acquisition.loc_scraper_improved import LoCScraperImproved, _url_part
+
+# Lower-cased @title, for case-insensitive XPath matching
+_LC_TITLE = "translate(@title, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')"
+# Buttons/links whose title mentions the text view
+_XPATH_TEXT_VIEW_BUTTONS = f"//button[contains({_LC_TITLE}, 'text')] | //a[contains({_LC_TITLE}, 'text')]"
+# Timeout (seconds) for each direct-download probe in method 3
+PROBE_TIMEOUT = 15
+
+
+class _TextCollector(xml.sax.ContentHandler):
+    """SAX handler that keeps every text node, in document order."""
+    
+    def __init__(self):
+        super().__init__()
+        self.parts = []
+    
+    def characters(self, content):
+        self.parts.append(content)
+
+
+def _xml_to_text(stream) -> str:
+    """
+    Extract all text from an XML document in a single streaming pass.
+    
+    Equivalent to ET.tostring(root, method='text') but never builds a tree.
+    """
+    collector = _TextCollector()
+    xml.sax.parse(stream, collector)
+    return ''.join(collector.parts)
+
+
+def _xml_response_to_text(response) -> str:
+    """Extract text from a streamed (stream=True) XML response, undoing any gzip encoding."""
+    response.raw.decode_content = True
+    return _xml_to_text(response.raw)
+
+
+def _download_fulltext(scraper: LoCScraperImproved, url: str) -> Optional[str]:
+    """
+    Download a LoC fulltext file (XML or plain text) and return its text.
+    
+    Runs in a probe thread, so it uses that thread's own scraper session, with a
+    short timeout so a slow probe does not hold up the others for long.
+    
+    Returns:
+        The text if the download succeeded with real content (>100 chars), otherwise None
+    """
+    try:
+        response = scraper._get(url, timeout=PROBE_TIMEOUT, stream=True)
+        response.raise_for_status()
+        if '.xml' in url:
+            text_content = _xml_response_to_text(response)
+        else:
+            text_content = response.text
+        print(f"    {url}: {len(text_content)} chars extracted")
+        if len(text_content) > 100:
+            print(f"    SUCCESS! Extracted text from {url}")
+            return text_content
+    except Exception as e:
+        print(f"    Error downloading {url}: {e}")
+    return None
 
 
 def extract_election_night():
@@ -28,196 +93,143 @@ def extract_election_night():
     print("=" * 70)
     print(f"URL: {url}\n")
     
-    scraper = LoCScraperImproved()
-    
-    # Method 1: Try JSON API to get fulltext_file URL
-    print("[METHOD 1] Trying JSON API...")
-    try:
-        api_url = url.rstrip('/') + '/?fo=json'
-        print(f"  Fetching: {api_url}")
-        response = requests.get(api_url, headers=scraper.session.headers, timeout=30)
-        print(f"  Status: {response.status_code}")
+    with LoCScraperImproved() as scraper:
+        # Method 1: Try JSON API to get fulltext_file URL
+        print("[METHOD 1] Trying JSON API...")
+        try:
+            api_url = url.rstrip('/') + '/?fo=json'
+            print(f"  Fetching: {api_url}")
+            response = scraper._get(api_url, timeout=30)
+            print(f"  Status: {response.status_code}")
         
-        if response.status_code == 200:
-            data = response.json()
+            if response.status_code == 200:
+                data = response.json()
             
-            # Check for fulltext_file in resources
-            print("\n  Checking for fulltext_file URL...")
-            resources = data.get('resources', [])
-            if not resources:
-                item = data.get('item', {})
-                resources = item.get('resources', [])
+                # Check for fulltext_file in resources
+                print("\n  Checking for fulltext_file URL...")
+                resources = data.get('resources', [])
+                if not resources:
+                    item = data.get('item', {})
+                    resources = item.get('resources', [])
             
-            print(f"  Found {len(resources)} resource(s)")
+                print(f"  Found {len(resources)} resource(s)")
             
-            for i, resource in enumerate(resources):
-                print(f"\n  Resource {i+1}:")
-                fulltext_file = resource.get('fulltext_file')
-                print(f"    fulltext_file: {fulltext_file}")
+                for i, resource in enumerate(resources):
+                    print(f"\n  Resource {i+1}:")
+                    fulltext_file = resource.get('fulltext_file')
+                    print(f"    fulltext_file: {fulltext_file}")
                 
-                if fulltext_file:
-                    # Check if it's XML or TXT
-                    if '.xml' in fulltext_file:
-                        print(f"    Type: XML file")
-                        # Try to download and extract text
-                        print(f"    Downloading XML...")
-                        try:
-                            xml_response = requests.get(fulltext_file, timeout=30)
-                            if xml_response.status_code == 200:
-                                print(f"    XML downloaded ({len(xml_response.content)} bytes)")
-                                # Parse XML to extract text
-                                from xml.etree import ElementTree as ET
-                                root = ET.fromstring(xml_response.content)
-                                # Try to find text content
-                                text_content = ET.tostring(root, encoding='unicode', method='text')
-                                print(f"    Extracted text length: {len(text_content)} chars")
-                                if len(text_content) > 100:
-                                    print(f"    SUCCESS! Text extracted from XML")
-                                    return text_content
-                        except Exception as e:
-                            print(f"    Error downloading XML: {e}")
-                    elif '.txt' in fulltext_file:
-                        print(f"    Type: TXT file")
-                        print(f"    Downloading TXT...")
-                        try:
-                            txt_response = requests.get(fulltext_file, timeout=30)
-                            if txt_response.status_code == 200:
-                                text_content = txt_response.text
-                                print(f"    Text downloaded ({len(text_content)} chars)")
-                                if len(text_content) > 100:
-                                    print(f"    SUCCESS! Text extracted")
-                                    return text_content
-                        except Exception as e:
-                            print(f"    Error downloading TXT: {e}")
+                    if fulltext_file and ('.xml' in fulltext_file or '.txt' in fulltext_file):
+                        text_content = _download_fulltext(scraper, fulltext_file)
+                        if text_content:
+                            return text_content
             
-            # Also check for fulltext in page array
-            print("\n  Checking page array for fulltext...")
-            pages = data.get('page', [])
-            print(f"  Found {len(pages)} page(s)")
-            for i, page in enumerate(pages):
-                if 'fulltext' in page:
-                    fulltext = page.get('fulltext', '')
-                    print(f"  Page {i+1} has fulltext field ({len(fulltext)} chars)")
-                    if len(fulltext) > 100:
-                        print(f"  SUCCESS! Found fulltext in page array")
-                        return fulltext
+                # Also check for fulltext in page array
+                print("\n  Checking page array for fulltext...")
+                pages = data.get('page', [])
+                print(f"  Found {len(pages)} page(s)")
+                for i, page in enumerate(pages):
+                    if 'fulltext' in page:
+                        fulltext = page.get('fulltext', '')
+                        print(f"  Page {i+1} has fulltext field ({len(fulltext)} chars)")
+                        if len(fulltext) > 100:
+                            print(f"  SUCCESS! Found fulltext in page array")
+                            return fulltext
             
-            # Check item.resources
-            print("\n  Checking item.resources...")
-            item = data.get('item', {})
-            item_resources = item.get('resources', [])
-            for resource in item_resources:
-                fulltext_file = resource.get('fulltext_file')
-                if fulltext_file:
-                    print(f"    Found fulltext_file: {fulltext_file}")
-                    # Try to download
-                    try:
-                        file_response = requests.get(fulltext_file, timeout=30)
-                        if file_response.status_code == 200:
-                            if '.xml' in fulltext_file:
-                                from xml.etree import ElementTree as ET
-                                root = ET.fromstring(file_response.content)
-                                text_content = ET.tostring(root, encoding='unicode', method='text')
-                                if len(text_content) > 100:
-                                    print(f"    SUCCESS! Extracted from XML")
-                                    return text_content
-                            else:
-                                text_content = file_response.text
-                                if len(text_content) > 100:
-                                    print(f"    SUCCESS! Extracted text")
-                                    return text_content
-                    except Exception as e:
-                        print(f"    Error: {e}")
+                # Check item.resources
+                print("\n  Checking item.resources...")
+                item = data.get('item', {})
+                item_resources = item.get('resources', [])
+                for resource in item_resources:
+                    fulltext_file = resource.get('fulltext_file')
+                    if fulltext_file:
+                        print(f"    Found fulltext_file: {fulltext_file}")
+                        text_content = _download_fulltext(scraper, fulltext_file)
+                        if text_content:
+                            return text_content
         
-    except Exception as e:
-        print(f"  JSON API method failed: {e}")
-        import traceback
-        traceback.print_exc()
+        except Exception as e:
+            print(f"  JSON API method failed: {e}")
+            traceback.print_exc()
     
-    # Method 2: Try Selenium to interact with page
-    print("\n[METHOD 2] Trying Selenium...")
-    if scraper.driver:
-        try:
-            print(f"  Loading page with Selenium...")
-            scraper.driver.get(url)
-            import time
-            time.sleep(3)
+        # Method 2: Try Selenium to interact with page
+        print("\n[METHOD 2] Trying Selenium...")
+        if scraper.driver:
+            try:
+                print(f"  Loading page with Selenium...")
+                from selenium.webdriver.common.by import By
+                from selenium.webdriver.support.ui import WebDriverWait
+                from selenium.webdriver.support import expected_conditions as EC
+                scraper.driver.get(url)
+                # Wait for the download links / text view button rather than a fixed delay
+                WebDriverWait(scraper.driver, 15).until(
+                    EC.presence_of_element_located(
+                        (By.CSS_SELECTOR, "a[href*='tile.loc.gov'], button[title*='Text' i]")
+                    )
+                )
             
-            # Check page source
-            page_source = scraper.driver.page_source
-            print(f"  Page loaded ({len(page_source)} chars)")
+                # Check page source
+                page_source = scraper.driver.page_source
+                print(f"  Page loaded ({len(page_source)} chars)")
             
-            # Try to find download links
-            soup = BeautifulSoup(page_source, 'html.parser')
-            download_links = scraper.find_download_links(soup, url)
-            print(f"  Found download links: {download_links}")
+                # Try to find download links (find_download_links only reads <a>/<button>)
+                soup = BeautifulSoup(page_source, 'lxml', parse_only=SoupStrainer(['a', 'button']))
+                download_links = scraper.find_download_links(soup, url)
+                print(f"  Found download links: {download_links}")
             
-            if download_links:
-                for format_type, link_url in download_links.items():
-                    print(f"  Trying to download {format_type} from {link_url}")
-                    url_part = url.split('/')[-1].replace('.html', '').replace('/', '_')
-                    if not url_part or url_part == 'loc':
-                        url_part = 'mal0440500'
-                    output_path = scraper.output_dir / f"loc_{url_part}.txt"
+                if download_links:
+                    for format_type, link_url in download_links.items():
+                        print(f"  Trying to download {format_type} from {link_url}")
+                        url_part = _url_part(url)
+                        if not url_part or url_part == 'loc':
+                            url_part = 'mal0440500'
+                        output_path = scraper.output_dir / f"loc_{url_part}.txt"
                     
-                    if scraper.download_file(link_url, output_path):
-                        content = output_path.read_text(encoding='utf-8', errors='ignore')
-                        if len(content) > 100:
+                        content = scraper.download_text(link_url, output_path)
+                        if content and len(content) > 100:
                             print(f"  SUCCESS! Downloaded {format_type}")
                             return content
             
-            # Try text view button
-            print("  Looking for text view button...")
-            text_buttons = scraper.driver.find_elements(
-                scraper.driver.find_element.__self__.By.XPATH,
-                "//button[contains(translate(@title, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'text')] | "
-                "//a[contains(translate(@title, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'text')]"
-            )
-            print(f"  Found {len(text_buttons)} text view buttons")
+                # Try text view button
+                print("  Looking for text view button...")
+                text_buttons = scraper.driver.find_elements(By.XPATH, _XPATH_TEXT_VIEW_BUTTONS)
+                print(f"  Found {len(text_buttons)} text view buttons")
             
-        except Exception as e:
-            print(f"  Selenium method failed: {e}")
-            import traceback
-            traceback.print_exc()
-    else:
-        print("  Selenium not available")
+            except Exception as e:
+                print(f"  Selenium method failed: {e}")
+                traceback.print_exc()
+        else:
+            print("  Selenium not available")
     
-    # Method 3: Try direct download from known URL pattern
-    print("\n[METHOD 3] Trying direct download URLs...")
-    direct_urls = [
-        "https://tile.loc.gov/storage-services/service/mss/mal/044/0440500/0440500.xml",
-        "https://tile.loc.gov/storage-services/service/mss/mal/044/0440500/0440500.txt",
-        "https://tile.loc.gov/storage-services/service/gdc/gdccrowd/mss/mal/044/0440500/0440500.txt",
-    ]
+        # Method 3: Try direct download from known URL pattern
+        print("\n[METHOD 3] Trying direct download URLs...")
+        direct_urls = [
+            "https://tile.loc.gov/storage-services/service/mss/mal/044/0440500/0440500.xml",
+            "https://tile.loc.gov/storage-services/service/mss/mal/044/0440500/0440500.txt",
+            "https://tile.loc.gov/storage-services/service/gdc/gdccrowd/mss/mal/044/0440500/0440500.txt",
+        ]
     
-    for direct_url in direct_urls:
-        try:
-            print(f"  Trying: {direct_url}")
-            response = requests.get(direct_url, timeout=30)
-            print(f"    Status: {response.status_code}")
-            if response.status_code == 200:
-                if '.xml' in direct_url:
-                    from xml.etree import ElementTree as ET
-                    root = ET.fromstring(response.content)
-                    text_content = ET.tostring(root, encoding='unicode', method='text')
-                    if len(text_content) > 100:
-                        print(f"    SUCCESS! Extracted from XML")
-                        return text_content
-                else:
-                    text_content = response.text
-                    if len(text_content) > 100:
-                        print(f"    SUCCESS! Extracted text")
-                        return text_content
-        except Exception as e:
-            print(f"    Error: {e}")
+        # Only one of these URLs holds the document, so probe them concurrently
+        # and take the first that yields text (worst case is the slowest probe, not the sum)
+        # The with block waits for every probe, so none is still using the scraper
+        # when it is closed
+        with ThreadPoolExecutor(max_workers=len(direct_urls)) as executor:
+            futures = [executor.submit(_download_fulltext, scraper, direct_url) for direct_url in direct_urls]
+            for future in as_completed(futures):
+                text_content = future.result()
+                if text_content:
+                    return text_content
     
-    print("\n" + "=" * 70)
-    print("FAILED: Could not extract text")
-    print("=" * 70)
-    return None
+        print("\n" + "=" * 70)
+        print("FAILED: Could not extract text")
+        print("=" * 70)
+        return None
 
 
 if __name__ == "__main__":
+    # This is a diagnostic script, so show the scraper's step-by-step detail too
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    logging.getLogger(LoCScraperImproved.__module__).setLevel(logging.DEBUG)
     text = extract_election_night()
     
     if text:
@@ -17,13 +17,33 @@ or https://www.gutenberg.org/cache/epub/{book_id}/pg{book_id}.txt
 """
 
 import requests
+import gzip
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+import html
 import re
 from tqdm import tqdm
-from tenacity import retry, stop_after_attempt, wait_exponential
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Brotli lets the server send smaller bodies; only advertise it if we can decode it
+try:
+    import brotli  # noqa: F401 - registers the br decoder with urllib3
+    ACCEPT_ENCODING = 'gzip, br, deflate'
+except ImportError:
+    ACCEPT_ENCODING = 'gzip, deflate'
+
+try:
+    from .http_session import create_session
+except ImportError:
+    # Fallback for when running as script
+    import sys
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+    from src.data_acquisition.http_session import create_session
 
 
 class GutenbergScraper:
@@ -37,13 +57,25 @@ class GutenbergScraper:
     """
     
     BASE_URL = "https://www.gutenberg.org"
+    # Politeness limit shared by all worker threads
+    MAX_REQUESTS_PER_SECOND = 4
+    # Author links on ebook pages look like /ebooks/author/1234
+    _AUTHOR_HREF_RE = re.compile(r'/ebooks/author/')
+    _TITLE_RE = re.compile(rb'<title>([^<]+)</title>', re.I)
+    # Only the tags get_book_metadata inspects
+    _METADATA_STRAINER = SoupStrainer(['title', 'span', 'a'])
+    # Text files in a /files/{book_id}/ directory listing
+    _TEXT_FILE_HREF_RE = re.compile(r'href="(\d+(?:-0)?\.txt)"')
+    # book_id -> resolved text URL, shared across instances
+    _text_url_cache: Dict[str, str] = {}
     
-    def __init__(self, output_dir: str = None):
+    def __init__(self, output_dir: str = None, max_workers: int = 4):
         """
         Initialize the scraper.
         
         Args:
             output_dir: Directory to save downloaded books (relative to project root)
+            max_workers: Number of books to download concurrently
         """
         if output_dir is None:
             # Default to project root/data/raw/gutenberg
@@ -54,19 +86,60 @@ class GutenbergScraper:
         
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
-        self.session = requests.Session()
+        self.session = self._build_session()
+        # Book texts are streamed to disk, so they bypass the HTTP cache (which
+        # would read each body into memory to store it). This is a separate
+        # session because the cached one is shared by all worker threads, and
+        # toggling its cache_disabled() would affect their requests too.
+        self._download_session = self._build_session(use_cache=False)
+        self.max_workers = max_workers
+        # Caps in-flight requests to gutenberg.org across all worker threads
+        self._request_slots = threading.Semaphore(max_workers)
+        self._rate_lock = threading.Lock()
+        self._next_request_at = 0.0
+    
+    def _wait_for_rate_limit(self):
+        """Block until this thread may issue its next request (MAX_REQUESTS_PER_SECOND)."""
+        with self._rate_lock:
+            now = time.monotonic()
+            slot = max(now, self._next_request_at)
+            self._next_request_at = slot + 1.0 / self.MAX_REQUESTS_PER_SECOND
+        if slot > now:
+            time.sleep(slot - now)
+    
+    @staticmethod
+    def _build_session(use_cache: bool = True) -> requests.Session:
+        """Create an HTTP session with a polite user agent and a retrying, pooled adapter."""
+        session = create_session(use_cache=use_cache)
         # Set a user agent to be respectful
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Educational Research - ML Evals Project)'
+        session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Educational Research - ML Evals Project)',
+            # Book texts are 1-5 MB of prose and compress ~3x over the wire
+            'Accept-Encoding': ACCEPT_ENCODING
         })
+        # Retry inside the transport so pooled connections survive retries
+        retry = Retry(
+            total=3,
+            backoff_factor=1.0,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=("GET", "HEAD"),
+        )
+        adapter = HTTPAdapter(max_retries=retry, pool_connections=4, pool_maxsize=16)
+        session.mount("https://", adapter)
+        return session
     
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
-    def _fetch_with_retry(self, url: str) -> requests.Response:
+    def _fetch_with_retry(self, url: str, stream: bool = False) -> requests.Response:
         """
         Fetch a URL with retry logic and rate limiting.
         
+        Requests are spaced by the shared rate limiter. Transient failures
+        (429/5xx, connection errors) are retried with backoff by the session's
+        transport adapter, which also honours Retry-After.
+        
         Args:
             url: URL to fetch
+            stream: Defer downloading the body (read it with iter_content); streamed
+                responses are not cached
             
         Returns:
             Response object
@@ -74,10 +147,11 @@ class GutenbergScraper:
         Raises:
             requests.RequestException: If request fails after retries
         """
-        response = self.session.get(url, timeout=30)
+        session = self._download_session if stream else self.session
+        with self._request_slots:
+            self._wait_for_rate_limit()
+            response = session.get(url, timeout=30, stream=stream)
         response.raise_for_status()
-        # Be respectful - wait a bit between requests
-        time.sleep(1)
         return response
     
     def get_book_metadata(self, book_id: str) -> Dict[str, str]:
@@ -94,18 +168,22 @@ class GutenbergScraper:
         
         try:
             response = self._fetch_with_retry(url)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml', parse_only=self._METADATA_STRAINER)
             
-            # Extract title (usually in <title> tag or h1)
-            title_elem = soup.find('title')
-            title = title_elem.text.strip() if title_elem else f"Book {book_id}"
+            # Extract title (usually in <title> tag) - cheap regex first, soup as fallback
+            title_match = self._TITLE_RE.search(response.content)
+            if title_match:
+                title = html.unescape(title_match.group(1).decode('utf-8', errors='replace')).strip()
+            else:
+                title_elem = soup.find('title')
+                title = title_elem.text.strip() if title_elem else f"Book {book_id}"
             
             # Try to extract author from metadata
             author = "Unknown"
             # Look for author in various places
             author_elem = soup.find('span', {'property': 'schema:author'})
             if not author_elem:
-                author_elem = soup.find('a', href=re.compile(r'/ebooks/author/'))
+                author_elem = soup.find('a', href=self._AUTHOR_HREF_RE)
             if author_elem:
                 author = author_elem.text.strip()
             
@@ -124,37 +202,73 @@ class GutenbergScraper:
                 'url': url
             }
     
-    def download_book_text(self, book_id: str) -> Optional[str]:
+    def _resolve_text_url(self, book_id: str) -> Optional[str]:
         """
-        Download the plain text version of a book.
+        Find a book's plain-text file from its /files/{book_id}/ directory listing.
         
-        Project Gutenberg books are available in multiple formats. We'll try:
-        1. https://www.gutenberg.org/files/{book_id}/{book_id}-0.txt
-        2. https://www.gutenberg.org/cache/epub/{book_id}/pg{book_id}.txt
+        Prefers the UTF-8 {book_id}-0.txt over {book_id}.txt. Resolved URLs are
+        cached on the class so repeated runs in one process skip the listing.
         
         Args:
             book_id: Gutenberg book ID
             
         Returns:
-            Book text content, or None if download fails
+            URL of the text file, or None if the listing is missing or has no .txt
         """
-        # Try different URL patterns
-        urls_to_try = [
-            f"{self.BASE_URL}/files/{book_id}/{book_id}-0.txt",
-            f"{self.BASE_URL}/files/{book_id}/{book_id}.txt",
-            f"{self.BASE_URL}/cache/epub/{book_id}/pg{book_id}.txt",
-        ]
-        
-        for url in urls_to_try:
-            try:
-                response = self._fetch_with_retry(url)
-                # Check if we got actual text content
-                if response.status_code == 200 and len(response.text) > 1000:
-                    return response.text
-            except Exception as e:
-                continue
-        
-        print(f"Warning: Could not download book {book_id} from any URL")
+        if book_id in self._text_url_cache:
+            return self._text_url_cache[book_id]
+        
+        try:
+            response = self._fetch_with_retry(f"{self.BASE_URL}/files/{book_id}/")
+        except requests.RequestException:
+            return None
+        
+        listed_files = set(self._TEXT_FILE_HREF_RE.findall(response.text))
+        for filename in (f"{book_id}-0.txt", f"{book_id}.txt"):
+            if filename in listed_files:
+                url = f"{self.BASE_URL}/files/{book_id}/{filename}"
+                self._text_url_cache[book_id] = url
+                return url
+        return None
+    
+    def download_book_text(self, book_id: str, output_file: Path) -> Optional[int]:
+        """
+        Download the plain text version of a book straight to disk.
+        
+        The text file is picked from the book's /files/{book_id}/ listing
+        (see _resolve_text_url); books without one fall back to
+        https://www.gutenberg.org/cache/epub/{book_id}/pg{book_id}.txt
+        
+        The body is streamed chunk by chunk into a gzip-compressed file
+        (book_{book_id}.txt.gz), so the full book is never held in memory and
+        the on-disk copy is roughly a third of the plain-text size.
+        
+        Args:
+            book_id: Gutenberg book ID
+            output_file: Destination .txt.gz path
+            
+        Returns:
+            Number of (uncompressed) text bytes written, or None if download fails
+        """
+        url = (self._resolve_text_url(book_id)
+               or f"{self.BASE_URL}/cache/epub/{book_id}/pg{book_id}.txt")
+        tmp_file = output_file.with_suffix('.gz.part')
+        
+        try:
+            response = self._fetch_with_retry(url, stream=True)
+            with gzip.open(tmp_file, 'wb', compresslevel=6) as f:
+                for chunk in response.iter_content(chunk_size=64 * 1024):
+                    f.write(chunk)
+                text_bytes = f.tell()  # uncompressed size
+            # Check if we got actual text content
+            if text_bytes > 1000:
+                tmp_file.replace(output_file)
+                return text_bytes
+        except Exception as e:
+            print(f"Warning: Error downloading {url}: {e}")
+        
+        tmp_file.unlink(missing_ok=True)
+        print(f"Warning: Could not download book {book_id} from {url}")
         return None
     
     def scrape_book(self, book_id: str) -> Optional[Dict]:
@@ -165,7 +279,8 @@ class GutenbergScraper:
             book_id: Gutenberg book ID
             
         Returns:
-            Dictionary with book data, or None if scraping fails
+            Dictionary with book metadata plus text_path (the saved .txt.gz)
+            and text_length, or None if scraping fails
         """
         print(f"\nScraping book {book_id}...")
         
@@ -174,43 +289,51 @@ class GutenbergScraper:
         print(f"  Title: {metadata['title']}")
         print(f"  Author: {metadata['author']}")
         
-        # Download text
-        text_content = self.download_book_text(book_id)
-        if not text_content:
+        # Download text straight to disk; consumers open text_path lazily
+        output_file = self.output_dir / f"book_{book_id}.txt.gz"
+        text_length = self.download_book_text(book_id, output_file)
+        if not text_length:
             return None
         
-        # Save raw text
-        output_file = self.output_dir / f"book_{book_id}.txt"
-        output_file.write_text(text_content, encoding='utf-8')
         print(f"  Saved to: {output_file}")
-        print(f"  Text length: {len(text_content):,} characters")
+        print(f"  Text length: {text_length:,} bytes")
         
         return {
             **metadata,
-            'text_content': text_content,
-            'text_length': len(text_content)
+            'text_path': str(output_file),
+            'text_length': text_length
         }
     
     def scrape_all_books(self, book_ids: List[str]) -> List[Dict]:
         """
-        Scrape multiple books.
+        Scrape multiple books concurrently.
+        
+        Downloads are network-bound, so books are fetched on a thread pool.
+        Politeness is enforced per request in _fetch_with_retry rather than
+        by sleeping between books.
         
         Args:
             book_ids: List of Gutenberg book IDs
             
         Returns:
-            List of book data dictionaries
+            List of book data dictionaries, in the same order as book_ids
         """
-        results = []
+        books_by_id = {}
         
-        for book_id in tqdm(book_ids, desc="Scraping books"):
-            book_data = self.scrape_book(book_id)
-            if book_data:
-                results.append(book_data)
-            # Be respectful - wait between books
-            time.sleep(2)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {executor.submit(self.scrape_book, book_id): book_id for book_id in book_ids}
+            with tqdm(total=len(book_ids), desc="Scraping books") as pbar:
+                for future in as_completed(futures):
+                    book_id = futures[future]
+                    try:
+                        book_data = future.result()
+                        if book_data:
+                            books_by_id[book_id] = book_data
+                    except Exception as e:
+                        print(f"Warning: Could not scrape book {book_id}: {e}")
+                    pbar.update(1)
         
-        return results
+        return [books_by_id[book_id] for book_id in book_ids if book_id in books_by_id]
 
 
 if __name__ == "__main__":
@@ -0,0 +1,73 @@
+"""
+HTTP Session Factory
+
+Builds the requests sessions shared by the scrapers. When requests-cache is
+installed, GET responses are stored in a sqlite cache under data/raw/ so that
+reruns of the pipeline don't re-download the same LoC and Gutenberg pages.
+"""
+
+from contextlib import nullcontext
+from datetime import timedelta
+from pathlib import Path
+import requests
+
+# Try to import requests-cache, fall back to a plain session if not available
+try:
+    import requests_cache
+    REQUESTS_CACHE_AVAILABLE = True
+except ImportError:
+    REQUESTS_CACHE_AVAILABLE = False
+    print("Warning: requests-cache not installed. Install with: pip install requests-cache")
+
+script_dir = Path(__file__).parent
+project_root = script_dir.parent.parent
+
+# Shared by all scrapers (sqlite appends the .sqlite suffix)
+DEFAULT_CACHE_NAME = project_root / "data" / "raw" / ".http_cache"
+CACHE_EXPIRE_AFTER = timedelta(days=30)
+
+
+def create_session(cache_name: Path = None, use_cache: bool = True) -> requests.Session:
+    """
+    Create a requests session, cached on disk when requests-cache is available.
+
+    Args:
+        cache_name: Path of the sqlite cache (defaults to data/raw/.http_cache)
+        use_cache: Set to False for a plain session that always goes to the server
+            (e.g. for large streamed downloads)
+
+    Returns:
+        A CachedSession if requests-cache is installed and use_cache is set,
+        otherwise a plain Session
+    """
+    if not (REQUESTS_CACHE_AVAILABLE and use_cache):
+        return requests.Session()
+
+    cache_name = Path(cache_name or DEFAULT_CACHE_NAME)
+    cache_name.parent.mkdir(parents=True, exist_ok=True)
+    return requests_cache.CachedSession(
+        cache_name=str(cache_name),
+        backend="sqlite",
+        expire_after=CACHE_EXPIRE_AFTER,
+        allowable_methods=("GET",),
+        # Revalidate with ETag/Last-Modified instead of re-downloading
+        cache_control=True,
+    )
+
+
+def cache_disabled(session: requests.Session):
+    """
+    Context manager under which a session's requests bypass the HTTP cache.
+
+    Streamed downloads should run under it: requests-cache reads the whole body
+    into memory to store it, and the file is written to disk anyway.
+
+    Args:
+        session: Session from create_session (plain sessions need no bypass)
+
+    Returns:
+        The session's cache_disabled() context, or a no-op context
+    """
+    if hasattr(session, 'cache_disabled'):
+        return session.cache_disabled()
+    return nullcontext()
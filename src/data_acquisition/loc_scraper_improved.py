@@ -5,15 +5,38 @@ This version handles downloading actual document files (PDF/text) from LoC pages
 LoC pages show handwritten documents with download options for different formats.
 """
 
+import base64
+import io
+import logging
+import shutil
 import requests
+from requests.adapters import HTTPAdapter
+import queue
+import threading
 import time
+from contextlib import contextmanager
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Optional
+from urllib.parse import urljoin
+from typing import Iterator, List, Dict, Optional
 from bs4 import BeautifulSoup
 import re
 from tqdm import tqdm
+from tqdm.contrib.logging import logging_redirect_tqdm
 import json
 
+try:
+    from .http_session import create_session, cache_disabled
+except ImportError:
+    # Fallback for when running as script
+    import sys
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+    from src.data_acquisition.http_session import create_session, cache_disabled
+
+# Per-document progress is logged (INFO), with the step-by-step detail at DEBUG
+logger = logging.getLogger(__name__)
+
 # Try to import Selenium for JavaScript-rendered pages
 try:
     from selenium import webdriver
@@ -21,7 +44,7 @@ try:
     from selenium.webdriver.support.ui import WebDriverWait, Select
     from selenium.webdriver.support import expected_conditions as EC
     from selenium.webdriver.chrome.options import Options
-    from selenium.common.exceptions import TimeoutException, WebDriverException
+    from selenium.common.exceptions import TimeoutException, WebDriverException, StaleElementReferenceException
     SELENIUM_AVAILABLE = True
 except ImportError:
     SELENIUM_AVAILABLE = False
@@ -29,11 +52,55 @@ except ImportError:
 
 # Try to import PDF processing libraries
 try:
-    import PyPDF2
+    import fitz  # PyMuPDF
     PDF_AVAILABLE = True
 except ImportError:
     PDF_AVAILABLE = False
-    print("Warning: PyPDF2 not installed. Install with: pip install PyPDF2")
+    print("Warning: PyMuPDF not installed. Install with: pip install PyMuPDF")
+
+# Try to import selectolax for the fast metadata and text passes, fall back to BeautifulSoup
+try:
+    from selectolax.parser import HTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+    print("Warning: selectolax not installed. Install with: pip install selectolax")
+
+# Precompiled patterns for metadata extraction
+_RE_DATE_ANY = re.compile(r'\d{4}-\d{2}-\d{2}|\d{1,2}[/-]\d{1,2}[/-]\d{4}|\w+ \d{1,2}, \d{4}|\d{4}')
+# Elements that usually hold an item's date on LoC pages
+_DATE_NODE_SELECTOR = 'dd, .item-date, .metadata, [class*="date"]'
+_RE_DATE_LABEL = re.compile(r'Date|date', re.I)
+_RE_STRUCTURED_DATE = re.compile(r'\d{4}-\d{2}-\d{2}|\w+ \d{1,2}, \d{4}')
+
+# Navigation/UI wording that marks a text block or line as page chrome, not document text
+_RE_UI_BLOCK = re.compile(r'menu|navigation|skip to|cookie', re.I)
+_RE_UI_LINE = re.compile(r'cookie|menu|skip|navigation|back to top', re.I)
+
+# An absolute URL inside an href/onclick attribute
+_RE_HTTP_URL = re.compile(r'https?://[^\s\'"]+')
+# Manuscript ID in a fulltext_file URL (e.g. mal.4361800)
+_RE_MAL_ID = re.compile(r'mal[.\d]+')
+# Lincoln Papers item/resource URLs (.../resource/mal.4361800, .../item/mal0440500)
+_RE_MAL_PAGE = re.compile(r'/(?:resource/mal\.|item/mal)(\d{7})')
+
+# Keywords that classify download links/buttons, found in a single scan per string
+_RE_LINK_KEYWORDS = re.compile(r'pdf|txt|text|download|format')
+
+
+@lru_cache(maxsize=256)
+def _url_part(url: str) -> str:
+    """
+    Identify a document by the last path segment of its URL (without .html).
+    
+    Names the per-document files (loc_<part>.txt/.pdf and the cache entry).
+    """
+    return url.split('?')[0].split('#')[0].rstrip('/').rsplit('/', 1)[-1].replace('.html', '')
+
+
+def _link_keywords(value: str) -> set:
+    """Return the set of link keywords occurring in value (case-insensitive)."""
+    return set(_RE_LINK_KEYWORDS.findall(value.lower())) if value else set()
 
 
 class LoCScraperImproved:
@@ -49,13 +116,201 @@ class LoCScraperImproved:
     """
     
     BASE_URL = "https://www.loc.gov"
+    # Cap on blocking requests in flight to LoC across scrape_items worker threads
+    MAX_CONCURRENT_LOC_REQUESTS = 8
+    # Requests per second sent to LoC across all worker threads (HTTP cache hits don't count)
+    MAX_REQUESTS_PER_SECOND = 2
+    # Most headless Chrome instances scrape_items keeps for the Selenium fallback
+    MAX_DRIVERS = 4
+    # Subresources the browser never needs to fetch: page images, web fonts and trackers
+    BLOCKED_URL_PATTERNS = (
+        '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg',
+        '*.woff', '*.woff2', '*.ttf',
+        '*google-analytics*', '*googletagmanager*', '*doubleclick*',
+    )
+    # Where the Lincoln Papers keep an item's transcription (see _fetch_predicted_fulltext)
+    MAL_FULLTEXT_URL = "https://tile.loc.gov/storage-services/service/mss/mal/{prefix}/{mal_id}/{mal_id}.txt"
+    # Per-request header override for binary PDF downloads
+    PDF_HEADERS = {'Accept-Encoding': 'identity'}
+    # Element lookups used by download_via_selenium, shared across calls.
+    # Case-insensitive matching uses CSS [attr*=... i] selectors and a JS text
+    # scan instead of XPath translate(), which the browser applies to every node.
+    # Buttons/options that switch the viewer to the text view
+    _TEXT_VIEW_CSS = (
+        'button[title*="text" i], a[title*="text" i], button[aria-label*="text" i], '
+        '[class*="text-view" i], [id*="text-view" i]'
+    )
+    _TEXT_VIEW_PHRASES = ('text with image', 'text and image')
+    # Buttons/icons that convert the viewer to PDF (plus links/buttons around "PDF" text)
+    _PDF_BTN_CSS = (
+        'button[title*="pdf" i], a[title*="pdf" i], button[aria-label*="pdf" i], '
+        '[class*="toolbar"] button, [class*="controls"] button, [class*="viewer-controls"] button, '
+        '[class*="icon"][class*="pdf" i]'
+    )
+    _PDF_BTN_PHRASES = ('pdf',)
+    # View mode tabs/buttons (Image, PDF, Text) in toolbar/control areas
+    _VIEW_MODE_CSS = (
+        '[class*="toolbar"] button, [class*="controls"] button, [class*="viewer-controls"] button, '
+        '[class*="view-mode"] button, [class*="tab"] button, [class*="view-tab"], [role="tab"]'
+    )
+    # Present once the viewer controls download_via_selenium uses have rendered
+    _VIEWER_READY_CSS = ", ".join((_TEXT_VIEW_CSS, _PDF_BTN_CSS, "select"))
+    # Document viewer container
+    _VIEWER_XPATHS = (
+        "//*[contains(@class, 'viewer')]",
+        "//*[contains(@id, 'viewer')]",
+        "//*[contains(@class, 'document')]",
+        "//*[contains(@class, 'image')]",
+        "//iframe",
+        "//*[@role='img']",
+    )
+    # Buttons next to the document viewer, relative to the viewer element
+    _VIEWER_BUTTONS_XPATH = (
+        ".//ancestor::*[contains(@class, 'toolbar')]//button | "
+        ".//preceding-sibling::*//button | "
+        ".//following-sibling::*//button"
+    )
+    # Transcription/text content in text view mode, best first
+    _TEXT_VIEW_SELECTORS = (
+        '.transcription',
+        '.text-content',
+        '.text-view',
+        '[itemprop="text"]',
+        '.item-description',
+        '.document-text',
+        '.manuscript-text',
+        'main',
+        'article',
+        # Look for divs containing transcribed text
+        'div[class*="text"]',
+        'div[class*="transcript"]',
+        'div[class*="content"]',
+    )
+    # Transcription areas for the HTML page fallback, best first
+    _CONTENT_SELECTORS = (
+        '.transcription',
+        '.text-content',
+        '[itemprop="text"]',
+        '.item-description',
+        'main',
+        'article',
+    )
+    # Scroll an element into view and click it, in one round-trip
+    _SCROLL_CLICK_JS = "arguments[0].scrollIntoView({block: 'center'}); arguments[0].click();"
+    # Text content that shows up once the text view is active
+    _TEXT_CONTENT_XPATH = "//*[contains(@class, 'text')] | //*[contains(@class, 'transcript')] | //pre | //p"
+    # Transcription areas read directly when the parsed page yields too little text
+    _TRANSCRIPTION_XPATH = (
+        "//*[contains(@class, 'transcription')] | "
+        "//*[contains(@class, 'text-content')] | "
+        "//pre | "
+        "//*[@role='textbox']"
+    )
+    # Embedded PDF viewer
+    _PDF_IFRAME_XPATH = "//iframe[contains(@src, '.pdf')]"
+    # Returns every visible match with the attributes used to filter it. Matches
+    # come from an XPath and/or a CSS selector, plus the elements (or their
+    # closest phraseTarget ancestor) whose text contains one of the phrases.
+    _CANDIDATES_JS = """
+        const [xpath, css, phrases, phraseTarget, context] = arguments;
+        const root = context || document;
+        const matches = new Set();
+        if (xpath) {
+            const snap = document.evaluate(xpath, root, null,
+                                           XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            for (let i = 0; i < snap.snapshotLength; i++) matches.add(snap.snapshotItem(i));
+        }
+        if (css) root.querySelectorAll(css).forEach(el => matches.add(el));
+        if (phrases && phrases.length) {
+            const walker = document.createTreeWalker(root, NodeFilter.SHOW_TEXT);
+            for (let node = walker.nextNode(); node; node = walker.nextNode()) {
+                const value = node.nodeValue.toLowerCase();
+                if (!phrases.some(phrase => value.includes(phrase))) continue;
+                const parent = node.parentElement;
+                const el = parent && phraseTarget ? parent.closest(phraseTarget) : parent;
+                if (el) matches.add(el);
+            }
+        }
+        const found = [];
+        for (const el of matches) {
+            if (el.nodeType !== 1 || !el.getClientRects().length) continue;
+            found.push({
+                el: el,
+                text: (el.innerText || '').trim(),
+                title: el.getAttribute('title') || '',
+                aria: el.getAttribute('aria-label') || '',
+                cls: el.getAttribute('class') || '',
+                view: el.getAttribute('data-view') || '',
+            });
+        }
+        return found;
+    """
+    # Download links/buttons in the rendered page, with the attributes used to classify them
+    _DOWNLOAD_LINKS_JS = """
+        return [...document.querySelectorAll('a, button')].filter(e => {
+            const text = (e.textContent || '').toLowerCase();
+            const href = (e.getAttribute('href') || '').toLowerCase();
+            return text.includes('download') || href.includes('download')
+                || href.includes('.pdf') || href.includes('.txt');
+        }).map(e => ({href: e.href || e.getAttribute('href') || '', text: (e.innerText || '').trim()}));
+    """
+    # href of the first link/button whose text mentions "go"
+    _GO_HREF_JS = """
+        const go = [...document.querySelectorAll('button, a')]
+            .find(e => e.href && (e.textContent || '').toLowerCase().includes('go'));
+        return go ? go.href : null;
+    """
+    # The download format <select> and its Go button, found in one pass:
+    # a select whose parent mentions "download" (format-named selects first),
+    # else a select beside a "Download" label; then the first visible Go
+    # button sharing the select's parent, else any button in that parent
+    _DOWNLOAD_CONTROLS_JS = """
+        const lc = el => (el.textContent || '').toLowerCase();
+        const visible = el => el.getClientRects().length > 0;
+        let select = null;
+        for (const css of ['select[name*="format"]', 'select[id*="format"]', 'select[class*="format"]', 'select']) {
+            select = [...document.querySelectorAll(css)].find(
+                el => el.parentElement && lc(el.parentElement).includes('download'));
+            if (select) break;
+        }
+        if (!select && document.body) {
+            const walker = document.createTreeWalker(document.body, NodeFilter.SHOW_TEXT);
+            for (let node = walker.nextNode(); node && !select; node = walker.nextNode()) {
+                const label = node.parentElement;
+                if (!label || !node.nodeValue.toLowerCase().includes('download')) continue;
+                let sibling = label.nextElementSibling;
+                while (sibling && sibling.tagName !== 'SELECT') sibling = sibling.nextElementSibling;
+                select = sibling || (label.parentElement && label.parentElement.querySelector(':scope > select'));
+            }
+        }
+        if (!select) return [null, null];
+        const candidates = [
+            ...[...document.querySelectorAll('button')].filter(el => lc(el).includes('go')),
+            ...[...document.querySelectorAll('input[type="submit"]')].filter(el => (el.value || '').toLowerCase().includes('go')),
+            ...[...document.querySelectorAll('a')].filter(el => lc(el).includes('go')),
+            ...document.querySelectorAll('button[type="submit"]'),
+        ];
+        let go = candidates.find(el => visible(el) && el.parentElement && el.parentElement.contains(select));
+        if (!go && select.parentElement) {
+            go = [...select.parentElement.querySelectorAll('button')].find(visible);
+        }
+        return [select, go || null];
+    """
+    # Links to a PDF rendition of the current item
+    _PDF_LINKS_JS = """
+        return [...document.querySelectorAll('a[href*=".pdf" i], a[href*="st=pdf" i]')].map(e => e.href);
+    """
     
-    def __init__(self, output_dir: str = None):
+    def __init__(self, output_dir: str = None, save_pdf: bool = False, concurrency: int = 16,
+                 use_cache: bool = True):
         """
         Initialize the scraper.
         
         Args:
             output_dir: Directory to save downloaded documents
+            save_pdf: Keep downloaded PDFs on disk instead of extracting them in memory
+            concurrency: Number of worker threads used by scrape_items
+            use_cache: Reuse documents scraped by earlier runs (see scrape_document)
         """
         if output_dir is None:
             script_dir = Path(__file__).parent
@@ -64,9 +319,158 @@ class LoCScraperImproved:
         
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
-        self.session = requests.Session()
+        self.save_pdf = save_pdf
+        self.concurrency = concurrency
+        # Scraped documents by URL, kept across runs as one JSON file each
+        self.use_cache = use_cache
+        self.cache_dir = self.output_dir / "cache"
+        # requests.Session isn't guaranteed thread-safe, so each worker thread
+        # gets its own (see the session property)
+        self._local = threading.local()
+        self._sessions = []
+        self._sessions_lock = threading.Lock()
+        self._request_slots = threading.Semaphore(self.MAX_CONCURRENT_LOC_REQUESTS)
+        self._rate_lock = threading.Lock()
+        self._next_request_at = 0.0
+        # Parsed JSON API records by item URL (see _fetch_json)
+        self._json_cache = {}
+        
+        # Selenium drivers are created lazily and lent to worker threads from a
+        # pool of at most MAX_DRIVERS (see _driver_checkout); each thread keeps
+        # its current driver, wait object and parsed page in self._local
+        self.selenium_enabled = SELENIUM_AVAILABLE
+        self._driver_pool = queue.Queue()
+        self._driver_slots = threading.BoundedSemaphore(self.MAX_DRIVERS)
+        self._drivers = []
+        self._drivers_lock = threading.Lock()
+    
+    def _create_driver(self):
+        """
+        Start a headless Chrome driver.
+        
+        Returns:
+            The driver, or None if Selenium couldn't start (Selenium is then
+            disabled for the rest of the run)
+        """
+        if not self.selenium_enabled:
+            return None
+        try:
+            chrome_options = Options()
+            chrome_options.add_argument('--headless=new')  # Run in background
+            chrome_options.add_argument('--no-sandbox')
+            chrome_options.add_argument('--disable-dev-shm-usage')
+            chrome_options.add_argument('--disable-gpu')
+            chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+            chrome_options.add_argument('--disable-blink-features=AutomationControlled')
+            chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+            chrome_options.add_experimental_option('useAutomationExtension', False)
+            # Only the DOM is needed - skip the large scanned page images
+            chrome_options.add_experimental_option("prefs", {
+                "profile.managed_default_content_settings.images": 2,
+                "profile.default_content_setting_values.notifications": 2,
+            })
+            # Return from driver.get() at DOMContentLoaded; explicit waits cover the rest
+            chrome_options.page_load_strategy = 'eager'
+            # Log network events so PDFs Chrome has loaded can be read back (_browser_pdf_bytes)
+            chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+            chrome_options.add_experimental_option('perfLoggingPrefs', {'enableNetwork': True, 'enablePage': False})
+            
+            # Try webdriver-manager first (auto-downloads chromedriver)
+            try:
+                from selenium.webdriver.chrome.service import Service
+                from webdriver_manager.chrome import ChromeDriverManager
+                service = Service(ChromeDriverManager().install())
+                driver = webdriver.Chrome(service=service, options=chrome_options)
+            except ImportError:
+                # Fallback to system chromedriver
+                driver = webdriver.Chrome(options=chrome_options)
+            
+            driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+            try:
+                # Downloads triggered by clicks land in output_dir (headless Chrome
+                # otherwise drops them in its own download folder)
+                driver.execute_cdp_cmd('Page.setDownloadBehavior',
+                                       {'behavior': 'allow', 'downloadPath': str(self.output_dir)})
+                driver.execute_cdp_cmd('Network.enable', {})
+                driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': list(self.BLOCKED_URL_PATTERNS)})
+            except Exception as e:
+                logger.warning("  Could not enable Chrome DevTools capture: %s", e)
+            with self._drivers_lock:
+                self._drivers.append(driver)
+            logger.info("  Selenium initialized successfully")
+            return driver
+        except Exception as e:
+            logger.warning("Could not initialize Selenium: %s", e)
+            logger.warning("  Falling back to requests-only mode")
+            self.selenium_enabled = False
+            return None
+    
+    def _bind_driver(self, driver) -> None:
+        """Make driver the calling thread's current driver."""
+        self._local.driver = driver
+        # One wait object reused for every explicit wait on this driver
+        self._local.wait = WebDriverWait(driver, 10) if driver else None
+        # (view key, page) of the last page parsed by _parse_page_source
+        self._local.parsed_page = None
+        # (url, select, go button) last found by _find_download_controls
+        self._local.download_controls = None
+        # PDF URL -> DevTools request id, for PDFs loaded by the current document
+        self._local.pdf_requests = {}
+        if driver:
+            try:
+                driver.get_log('performance')  # Drop the previous document's network log
+            except Exception:
+                pass
+    
+    @property
+    def driver(self):
+        """
+        Selenium driver for the calling thread, or None if Selenium is unavailable.
+        
+        Inside _driver_checkout this is the pooled driver lent to the thread;
+        outside it (direct, single-threaded use) the thread gets its own driver
+        on first access.
+        """
+        if not hasattr(self._local, 'driver'):
+            self._bind_driver(self._create_driver())
+        return self._local.driver
+    
+    @property
+    def wait(self):
+        """WebDriverWait for the calling thread's driver."""
+        return self.driver and self._local.wait
+    
+    @contextmanager
+    def _driver_checkout(self):
+        """
+        Lend the calling thread a driver from the pool for the duration of the block.
+        
+        At most MAX_DRIVERS drivers exist at once; threads beyond that wait for
+        one to be returned.
+        """
+        if getattr(self._local, 'driver', None) is not None:
+            # This thread already has a driver
+            yield self._local.driver
+            return
+        
+        with self._driver_slots:
+            try:
+                driver = self._driver_pool.get_nowait()
+            except queue.Empty:
+                driver = self._create_driver()
+            self._bind_driver(driver)
+            try:
+                yield driver
+            finally:
+                del self._local.driver
+                if driver:
+                    self._driver_pool.put(driver)
+    
+    def _build_session(self) -> requests.Session:
+        """Create an HTTP session with browser-like headers and a pooled adapter."""
+        session = create_session()
         # Use more realistic browser headers to avoid blocking
-        self.session.headers.update({
+        session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
@@ -75,48 +479,97 @@ class LoCScraperImproved:
             'Upgrade-Insecure-Requests': '1',
             'Sec-Fetch-Dest': 'document',
             'Sec-Fetch-Mode': 'navigate',
-            'Sec-Fetch-Site': 'none'
+            'Sec-Fetch-Site': 'none',
+            # LoC is friendlier to requests that look like in-site navigation
+            'Referer': 'https://www.loc.gov/',
         })
+        # Pool connections so repeated requests to www.loc.gov / tile.loc.gov reuse sockets
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        session.mount("https://", adapter)
+        return session
+    
+    @property
+    def session(self) -> requests.Session:
+        """HTTP session for the calling thread, created on first use."""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._build_session()
+            self._local.session = session
+            with self._sessions_lock:
+                self._sessions.append(session)
+        return session
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+    
+    def close(self):
+        """
+        Shut down the Selenium drivers and HTTP sessions.
         
-        # Initialize Selenium driver if available
-        self.driver = None
-        if SELENIUM_AVAILABLE:
-            try:
-                chrome_options = Options()
-                chrome_options.add_argument('--headless=new')  # Run in background
-                chrome_options.add_argument('--no-sandbox')
-                chrome_options.add_argument('--disable-dev-shm-usage')
-                chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-                chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-                chrome_options.add_experimental_option('useAutomationExtension', False)
-                
-                # Try webdriver-manager first (auto-downloads chromedriver)
+        Browser startup is the most expensive part of the scraper, so one
+        instance (and its drivers) should be reused for every URL and closed
+        once at the end - preferably via `with LoCScraperImproved() as scraper:`.
+        """
+        with self._drivers_lock:
+            for driver in self._drivers:
                 try:
-                    from selenium.webdriver.chrome.service import Service
-                    from webdriver_manager.chrome import ChromeDriverManager
-                    service = Service(ChromeDriverManager().install())
-                    self.driver = webdriver.Chrome(service=service, options=chrome_options)
-                except ImportError:
-                    # Fallback to system chromedriver
-                    self.driver = webdriver.Chrome(options=chrome_options)
-                
-                self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-                print("  Selenium initialized successfully")
-            except Exception as e:
-                print(f"Warning: Could not initialize Selenium: {e}")
-                print("  Falling back to requests-only mode")
-                self.driver = None
+                    driver.quit()
+                except Exception:
+                    pass
+            self._drivers.clear()
+        self._driver_pool = queue.Queue()
+        with self._sessions_lock:
+            for session in self._sessions:
+                session.close()
+            self._sessions.clear()
+        self._local = threading.local()
+    
+    def _wait_for_rate_limit(self):
+        """Block until this thread may send its next request to LoC (MAX_REQUESTS_PER_SECOND)."""
+        with self._rate_lock:
+            now = time.monotonic()
+            slot = max(now, self._next_request_at)
+            self._next_request_at = slot + 1.0 / self.MAX_REQUESTS_PER_SECOND
+        if slot > now:
+            time.sleep(slot - now)
+    
+    @staticmethod
+    def _is_cached(session: requests.Session, url: str) -> bool:
+        """Whether a GET of url will be answered from the session's HTTP cache."""
+        cache = getattr(session, 'cache', None)
+        return cache is not None and not session.settings.disabled and cache.contains(url=url)
+    
+    def _get(self, url: str, **kwargs) -> requests.Response:
+        """
+        Send a GET to LoC through the shared request slots and rate limiter.
+        
+        Every LoC request goes through here, so the limit holds across all
+        worker threads; responses already in the HTTP cache don't wait.
+        
+        Args:
+            url: URL to fetch
+            **kwargs: Passed on to session.get (timeout, stream, headers)
+            
+        Returns:
+            Response object
+        """
+        session = self.session
+        with self._request_slots:
+            if not self._is_cached(session, url):
+                self._wait_for_rate_limit()
+            return session.get(url, **kwargs)
     
     def _fetch_with_retry(self, url: str) -> requests.Response:
         """Fetch URL with retry logic and better error handling."""
         for attempt in range(3):
             try:
-                # Add referer header for LoC
-                headers = {'Referer': 'https://www.loc.gov/'}
-                response = self.session.get(url, timeout=30, headers=headers)
+                response = self._get(url, timeout=30)
                 
                 if response.status_code == 200:
-                    time.sleep(2)  # Be respectful
                     return response
                 elif response.status_code == 403:
                     # Try without session cookies, or try JSON API directly
@@ -130,7 +583,7 @@ class LoCScraperImproved:
                         if '/item/' in url or '/resource/' in url:
                             json_url = url.rstrip('/') + '/?fo=json'
                             try:
-                                json_response = self.session.get(json_url, timeout=30, headers=headers)
+                                json_response = self._get(json_url, timeout=30)
                                 if json_response.status_code == 200:
                                     return json_response
                             except:
@@ -146,13 +599,38 @@ class LoCScraperImproved:
                 time.sleep(2 ** attempt)
         raise requests.RequestException(f"Failed to fetch {url}")
     
-    def find_download_links(self, soup: BeautifulSoup, base_url: str) -> Dict[str, str]:
+    def _fetch_json(self, item_url: str) -> Optional[Dict]:
+        """
+        Fetch the LoC JSON API record for an item, cached per URL.
+        
+        The at= projection limits the response to the fields the scraper
+        reads (title and file resources) instead of the full item record.
+        
+        Args:
+            item_url: LoC item/resource URL
+            
+        Returns:
+            Parsed JSON, or None if the API didn't return JSON
+        """
+        if item_url not in self._json_cache:
+            api_url = item_url.rstrip('/') + '/?fo=json&at=item.title,item.resources,resources,resource'
+            response = self._fetch_with_retry(api_url)
+            data = None
+            if response.headers.get('content-type', '').startswith('application/json'):
+                data = response.json()
+            self._json_cache[item_url] = data
+        return self._json_cache[item_url]
+    
+    def find_download_links(self, soup: Optional[BeautifulSoup], base_url: str) -> Dict[str, str]:
         """
         Find download links for PDF and text formats.
-        Also tries using Selenium to click download buttons if available.
+        
+        Cheapest source first: the JSON API, then (only if that yields no links)
+        Selenium, then the page HTML. Stops as soon as both a PDF and a text
+        link are known.
         
         Args:
-            soup: BeautifulSoup object of the page
+            soup: BeautifulSoup object of the page, or None to fetch it only if needed
             base_url: Base URL of the page
             
         Returns:
@@ -160,86 +638,11 @@ class LoCScraperImproved:
         """
         download_links = {}
         
-        # Try using Selenium to find and click download buttons
-        if self.driver:
-            try:
-                # Look for download buttons/links using Selenium
-                download_buttons = self.driver.find_elements(By.XPATH, 
-                    "//a[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'download')] | "
-                    "//button[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'download')] | "
-                    "//a[contains(@href, 'download')] | "
-                    "//a[contains(@href, '.pdf')] | "
-                    "//a[contains(@href, '.txt')]"
-                )
-                
-                for btn in download_buttons:
-                    try:
-                        href = btn.get_attribute('href')
-                        text = btn.text.lower()
-                        
-                        if href:
-                            if 'pdf' in text or 'pdf' in href.lower():
-                                download_links['pdf'] = href if href.startswith('http') else self.BASE_URL + href
-                            elif 'text' in text or 'txt' in text or 'text' in href.lower():
-                                download_links['text'] = href if href.startswith('http') else self.BASE_URL + href
-                    except:
-                        continue
-                
-                # Also try to find format dropdowns
-                try:
-                    format_selects = self.driver.find_elements(By.TAG_NAME, "select")
-                    for select in format_selects:
-                        options = select.find_elements(By.TAG_NAME, "option")
-                        for option in options:
-                            option_text = option.text.lower()
-                            if 'text' in option_text or 'txt' in option_text:
-                                # Try to get download URL when this option is selected
-                                select.click()
-                                option.click()
-                                time.sleep(1)
-                                # Look for download button that appears
-                                go_buttons = self.driver.find_elements(By.XPATH, 
-                                    "//button[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'go')] | "
-                                    "//a[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'go')]"
-                                )
-                                for go_btn in go_buttons:
-                                    href = go_btn.get_attribute('href')
-                                    if href:
-                                        download_links['text'] = href if href.startswith('http') else self.BASE_URL + href
-                                        break
-                except:
-                    pass
-            except Exception as e:
-                print(f"      Selenium download link search failed: {e}")
-        
-        # Look for download buttons/links
-        # LoC often has download options in various places
-        
-        # Method 1: Look for download links in the page
-        download_elements = soup.find_all('a', href=re.compile(r'download|\.pdf|\.txt', re.I))
-        for elem in download_elements:
-            href = elem.get('href', '')
-            text = elem.get_text(strip=True).lower()
-            
-            if 'pdf' in text or 'pdf' in href.lower():
-                if href.startswith('http'):
-                    download_links['pdf'] = href
-                else:
-                    download_links['pdf'] = self.BASE_URL + href
-            elif 'text' in text or 'txt' in href.lower():
-                if href.startswith('http'):
-                    download_links['text'] = href
-                else:
-                    download_links['text'] = self.BASE_URL + href
-        
-        # Method 2: Try API format to get download URLs (most reliable)
-        # LoC JSON API often has file URLs including fulltext_file
+        # Method 1: JSON API (most reliable) - fulltext_file and files[].url
+        # usually cover everything the page itself would offer
         try:
-            api_url = base_url.rstrip('/') + '/?fo=json'
-            response = self._fetch_with_retry(api_url)
-            if response.headers.get('content-type', '').startswith('application/json'):
-                data = response.json()
-                
+            data = self._fetch_json(base_url)
+            if data:
                 # Check for fulltext_file directly in resources (most reliable)
                 resources = data.get('resources', [])
                 if not resources:
@@ -252,7 +655,7 @@ class LoCScraperImproved:
                     fulltext_file = resource.get('fulltext_file')
                     if fulltext_file and '.txt' in fulltext_file:
                         download_links['text'] = fulltext_file
-                        print(f"      Found fulltext_file URL: {fulltext_file}")
+                        logger.debug("      Found fulltext_file URL: %s", fulltext_file)
                     
                     # Also check files array
                     files = resource.get('files', [])
@@ -278,24 +681,83 @@ class LoCScraperImproved:
                     fulltext_file = resource_obj.get('fulltext_file')
                     if fulltext_file and '.txt' in fulltext_file:
                         download_links['text'] = fulltext_file
-                        print(f"      Found fulltext_file in resource: {fulltext_file}")
+                        logger.debug("      Found fulltext_file in resource: %s", fulltext_file)
         except Exception as e:
-            print(f"      JSON API method failed: {e}")
-        
-        # Method 3: Look for common LoC download patterns
-        # Check for download buttons with format dropdowns
-        download_buttons = soup.find_all(['button', 'a'], class_=re.compile(r'download|format', re.I))
-        for btn in download_buttons:
-            # Check parent elements for format info
-            parent = btn.parent
-            if parent:
-                text = parent.get_text().lower()
-                href = btn.get('href', '')
-                if 'pdf' in text or 'pdf' in href:
-                    if href and href.startswith('http'):
-                        download_links['pdf'] = href
-                    elif href:
-                        download_links['pdf'] = self.BASE_URL + href
+            logger.debug("      JSON API method failed: %s", e)
+        
+        if download_links:
+            return download_links
+        
+        # Nothing usable in the JSON - fall back to scraping the page itself
+        # Try using Selenium to find and click download buttons - only on a driver
+        # this thread already holds, since the property would start an unpooled one
+        driver = getattr(self._local, 'driver', None)
+        if driver:
+            try:
+                # Look for download buttons/links - one script returns every candidate
+                for link in driver.execute_script(self._DOWNLOAD_LINKS_JS) or []:
+                    href = link['href']
+                    if href:
+                        text_hits = _link_keywords(link['text'])
+                        href_hits = _link_keywords(href)
+                        if 'pdf' in text_hits or 'pdf' in href_hits:
+                            download_links['pdf'] = href if href.startswith('http') else self.BASE_URL + href
+                        elif text_hits & {'text', 'txt'} or 'text' in href_hits:
+                            download_links['text'] = href if href.startswith('http') else self.BASE_URL + href
+                
+                # Also try to find format dropdowns - clicking through them is slow, so
+                # only when the links above didn't already give a text URL
+                try:
+                    format_selects = [] if 'text' in download_links else driver.find_elements(By.TAG_NAME, "select")
+                    for select in format_selects:
+                        options = select.find_elements(By.TAG_NAME, "option")
+                        for option in options:
+                            if _link_keywords(option.text) & {'text', 'txt'}:
+                                # Try to get download URL when this option is selected
+                                select.click()
+                                option.click()
+                                time.sleep(1)
+                                # Look for download button that appears
+                                href = driver.execute_script(self._GO_HREF_JS)
+                                if href:
+                                    download_links['text'] = href if href.startswith('http') else self.BASE_URL + href
+                except:
+                    pass
+            except Exception as e:
+                logger.debug("      Selenium download link search failed: %s", e)
+        
+        if 'pdf' in download_links and 'text' in download_links:
+            return download_links
+        
+        # Look for download buttons/links
+        # LoC often has download options in various places
+        if soup is None:
+            try:
+                soup = BeautifulSoup(self._fetch_with_retry(base_url).content, 'lxml')
+            except Exception as e:
+                logger.debug("      Could not fetch page for download links: %s", e)
+                return download_links
+        
+        # Method 2: One pass over links/buttons in the page, one keyword scan per string
+        for elem in soup.select('a, button'):
+            if 'pdf' in download_links and 'text' in download_links:
+                break
+            href = elem.get('href', '')
+            href_hits = _link_keywords(href)
+            
+            # Direct download links
+            if elem.name == 'a' and href_hits & {'download', 'pdf', 'txt'}:
+                text_hits = _link_keywords(elem.get_text(strip=True))
+                if 'pdf' in text_hits or 'pdf' in href_hits:
+                    download_links['pdf'] = urljoin(self.BASE_URL, href)
+                elif 'text' in text_hits or 'txt' in href_hits:
+                    download_links['text'] = urljoin(self.BASE_URL, href)
+            
+            # Download/format buttons - format info lives in the parent element
+            if href and _link_keywords(' '.join(elem.get('class', []))) & {'download', 'format'}:
+                parent = elem.parent
+                if parent and ('pdf' in href_hits or 'pdf' in _link_keywords(parent.get_text())):
+                    download_links['pdf'] = urljoin(self.BASE_URL, href)
         
         return download_links
     
@@ -310,25 +772,82 @@ class LoCScraperImproved:
         Returns:
             True if successful, False otherwise
         """
+        # PDFs are already compressed; asking for gzip only costs server/client CPU
+        headers = self.PDF_HEADERS if Path(output_path).suffix == '.pdf' else None
         try:
-            response = self.session.get(url, timeout=60, stream=True)
+            with cache_disabled(self.session):
+                response = self._get(url, timeout=60, stream=True, headers=headers)
             response.raise_for_status()
             
+            response.raw.decode_content = True
             with open(output_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+                shutil.copyfileobj(response.raw, f, length=1 << 20)
             
             return True
         except Exception as e:
-            print(f"      Error downloading {url}: {e}")
+            logger.warning("      Error downloading %s: %s", url, e)
             return False
     
-    def extract_text_from_pdf(self, pdf_path: Path) -> str:
+    def download_text(self, url: str, output_path: Path) -> Optional[str]:
+        """
+        Download a text file to disk and return its contents.
+        
+        The body is written out chunk by chunk as it arrives and decoded from
+        the same chunks, so the file is never read back from disk.
+        
+        Args:
+            url: URL to download from
+            output_path: Path to save the file
+            
+        Returns:
+            The decoded text, or None on failure
+        """
+        try:
+            with cache_disabled(self.session):
+                response = self._get(url, timeout=60, stream=True)
+            response.raise_for_status()
+            
+            chunks = []
+            with open(output_path, 'wb') as f:
+                for chunk in response.iter_content(chunk_size=1 << 16):
+                    f.write(chunk)
+                    chunks.append(chunk)
+            
+            return b"".join(chunks).decode('utf-8', errors='ignore')
+        except Exception as e:
+            logger.warning("      Error downloading %s: %s", url, e)
+            return None
+    
+    def fetch_pdf_bytes(self, url: str) -> Optional[io.BytesIO]:
+        """
+        Download a PDF into memory.
+        
+        Args:
+            url: URL to download from
+            
+        Returns:
+            Buffer holding the PDF bytes, or None on failure
+        """
+        try:
+            with cache_disabled(self.session):
+                response = self._get(url, timeout=60, stream=True, headers=self.PDF_HEADERS)
+            response.raise_for_status()
+            
+            response.raw.decode_content = True
+            buf = io.BytesIO()
+            shutil.copyfileobj(response.raw, buf, length=1 << 20)
+            buf.seek(0)
+            return buf
+        except Exception as e:
+            logger.warning("      Error downloading %s: %s", url, e)
+            return None
+    
+    def extract_text_from_pdf(self, pdf_path) -> str:
         """
-        Extract text from a PDF file.
+        Extract text from a PDF file or in-memory buffer.
         
         Args:
-            pdf_path: Path to PDF file
+            pdf_path: Path to PDF file, or a BytesIO from fetch_pdf_bytes
             
         Returns:
             Extracted text
@@ -337,18 +856,217 @@ class LoCScraperImproved:
             return ""
         
         try:
-            text = ""
-            with open(pdf_path, 'rb') as f:
-                pdf_reader = PyPDF2.PdfReader(f)
-                for page in pdf_reader.pages:
-                    text += page.extract_text() + "\n"
-            return text
+            if isinstance(pdf_path, io.BytesIO):
+                doc = fitz.open(stream=pdf_path.getbuffer(), filetype="pdf")
+            else:
+                doc = fitz.open(pdf_path)
+            with doc:
+                return "\n".join(page.get_text("text") for page in doc)
         except Exception as e:
-            print(f"      Error extracting PDF text: {e}")
+            logger.warning("      Error extracting PDF text: %s", e)
+            return ""
+    
+    def download_pdf_text(self, url: str, pdf_path: Path) -> str:
+        """
+        Download a PDF and extract its text.
+        
+        The PDF is only written to pdf_path when save_pdf is set; otherwise it
+        is streamed into memory and handed straight to PyMuPDF.
+        
+        Args:
+            url: URL of the PDF
+            pdf_path: Where to save the PDF if save_pdf is set
+            
+        Returns:
+            Extracted text, or "" if the download failed
+        """
+        if self.save_pdf:
+            if self.download_file(url, pdf_path):
+                return self.extract_text_from_pdf(pdf_path)
+            return ""
+        
+        buf = self.fetch_pdf_bytes(url)
+        if buf is None:
             return ""
+        return self.extract_text_from_pdf(buf)
+    
+    def _browser_pdf_bytes(self, url: str) -> Optional[io.BytesIO]:
+        """
+        Read a PDF that Chrome has already loaded, via the DevTools protocol.
+        
+        Saves downloading the same bytes again over HTTP (and keeps the
+        browser's cookies for the request).
+        
+        Args:
+            url: URL of the PDF
+            
+        Returns:
+            Buffer holding the PDF bytes, or None if Chrome hasn't loaded it
+        """
+        try:
+            entries = self.driver.get_log('performance')
+        except Exception:
+            return None
+        
+        # The performance log is drained by each read, so remember the PDF responses seen
+        for entry in entries:
+            message = json.loads(entry['message'])['message']
+            if message.get('method') != 'Network.responseReceived':
+                continue
+            response = message['params']['response']
+            if response.get('mimeType') == 'application/pdf' or '.pdf' in response.get('url', '').lower():
+                self._local.pdf_requests[response['url']] = message['params']['requestId']
+        
+        request_id = self._local.pdf_requests.get(url)
+        if not request_id:
+            return None
+        try:
+            body = self.driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': request_id})
+        except Exception:
+            # Chrome has already evicted the body
+            return None
+        if body.get('base64Encoded'):
+            return io.BytesIO(base64.b64decode(body['body']))
+        return io.BytesIO(body['body'].encode('latin-1'))
+    
+    def _selenium_pdf_text(self, url: str, pdf_path: Path) -> str:
+        """
+        Extract text from a PDF shown in the browser, downloading it only if Chrome hasn't.
+        
+        Args:
+            url: URL of the PDF
+            pdf_path: Where to save the PDF if save_pdf is set
+            
+        Returns:
+            Extracted text, or "" if the PDF couldn't be read
+        """
+        buf = self._browser_pdf_bytes(url)
+        if buf is None:
+            return self.download_pdf_text(url, pdf_path)
+        
+        logger.debug("    Read PDF from the browser: %s", url)
+        if self.save_pdf:
+            pdf_path.write_bytes(buf.getbuffer())
+        return self.extract_text_from_pdf(buf)
+    
+    @staticmethod
+    def _parse_html(html):
+        """Parse HTML with selectolax if available, else BeautifulSoup (lxml)."""
+        if SELECTOLAX_AVAILABLE:
+            return HTMLParser(html)
+        return BeautifulSoup(html, 'lxml')
+    
+    @staticmethod
+    def _select(page, selector: str) -> List:
+        """All matches of a CSS selector in a page from _parse_html (or a BeautifulSoup object)."""
+        if SELECTOLAX_AVAILABLE and isinstance(page, HTMLParser):
+            return page.css(selector)
+        return page.select(selector)
+    
+    @staticmethod
+    def _select_first(page, selector: str):
+        """First match of a CSS selector in a page from _parse_html, or None."""
+        if SELECTOLAX_AVAILABLE and isinstance(page, HTMLParser):
+            return page.css_first(selector)
+        return page.select_one(selector)
+    
+    @staticmethod
+    def _css_matcher(page):
+        """Return matches(node, selector) for the nodes of a page from _parse_html."""
+        if SELECTOLAX_AVAILABLE and isinstance(page, HTMLParser):
+            return lambda node, selector: node.css_matches(selector)
+        return lambda node, selector: node.css.match(selector)
+    
+    @classmethod
+    def _ranked_matches(cls, page, selectors) -> Iterator:
+        """
+        Match a list of CSS selectors in one pass over the page.
+        
+        Args:
+            page: Page from _parse_html
+            selectors: CSS selectors, best first
+            
+        Yields:
+            (rank, node) for every match, ordered by the best selector the node
+            matches and then by document order - the order a selector-by-selector
+            loop would visit them in (nodes matching several selectors come once)
+        """
+        nodes = cls._select(page, ', '.join(selectors))
+        matches = cls._css_matcher(page)
+        
+        ranked = []
+        for position, node in enumerate(nodes):
+            rank = next((i for i, selector in enumerate(selectors) if matches(node, selector)), len(selectors))
+            ranked.append((rank, position, node))
+        ranked.sort(key=lambda item: item[:2])
+        for rank, _, node in ranked:
+            yield rank, node
+    
+    @staticmethod
+    def _node_text(node, separator: str = '', strip: bool = False) -> str:
+        """
+        Text of a node, like BeautifulSoup's get_text(separator, strip).
+        
+        Args:
+            node: BeautifulSoup element, selectolax node or parsed selectolax page
+            separator: Joins the text of the individual text nodes
+            strip: Strip each text node and drop the empty ones
+        """
+        if hasattr(node, 'get_text'):
+            return node.get_text(separator=separator, strip=strip)
+        if isinstance(node, HTMLParser):
+            node = node.body or node.root
+            if node is None:
+                return ""
+        text = node.text(separator=separator, strip=strip)
+        if strip and separator:
+            # selectolax keeps the empty text nodes
+            text = separator.join(part for part in text.split(separator) if part)
+        return text
+    
+    @classmethod
+    def _page_title(cls, page) -> str:
+        """Title of a page from _parse_html: its <h1>, else og:title, else <title> ("" if none)."""
+        title_elem = cls._select_first(page, 'h1')
+        title = cls._node_text(title_elem).strip() if title_elem else ""
+        if not title:
+            og_title = cls._select_first(page, 'meta[property="og:title"]')
+            title_elem = cls._select_first(page, 'title')
+            if og_title is not None and og_title.attrs.get('content'):
+                title = og_title.attrs['content'].strip()
+            elif title_elem:
+                title = cls._node_text(title_elem).strip()
+        return title
+    
+    @staticmethod
+    def _date_attribute(nodes: List) -> Optional[str]:
+        """
+        Return the date from a <time datetime> or date <meta> tag, if any.
+        
+        Args:
+            nodes: (tag name, attributes) pairs for time[datetime] and meta[name] elements
+            
+        Returns:
+            The datetime/content attribute value, or None
+        """
+        for tag, attrs in nodes:
+            if tag == 'time' and attrs.get('datetime'):
+                return attrs['datetime']
+            if tag == 'meta' and 'date' in (attrs.get('name') or '').lower() and attrs.get('content'):
+                return attrs['content']
+        return None
     
-    def extract_metadata(self, soup: BeautifulSoup, url: str) -> Dict:
-        """Extract metadata from the page."""
+    def extract_metadata(self, html, url: str) -> Dict:
+        """
+        Extract metadata from the page.
+        
+        Args:
+            html: Page HTML (str or bytes), or a page already parsed by _parse_html
+            url: URL of the page
+            
+        Returns:
+            Dictionary with date, place, from, to and document_type
+        """
         metadata = {
             'date': None,
             'place': None,
@@ -357,33 +1075,48 @@ class LoCScraperImproved:
             'document_type': None
         }
         
-        # Extract title
-        title_elem = soup.find('h1') or soup.find('title')
-        title = title_elem.text.strip() if title_elem else "Untitled Document"
-        
-        # Try to extract date from various places
-        date_patterns = [
-            r'\d{1,2}[/-]\d{1,2}[/-]\d{4}',
-            r'\w+ \d{1,2}, \d{4}',
-            r'\d{4}'
-        ]
-        
-        text = soup.get_text()
-        for pattern in date_patterns:
-            matches = re.findall(pattern, text)
-            if matches:
-                metadata['date'] = matches[0]
-                break
+        # Pull out the title, the date-bearing text and the text around a "Date" label.
+        # Dates come from <time>/<meta> or a few date-like nodes; the whole page
+        # text is only built if none of those hold one.
+        date_text = None
+        if SELECTOLAX_AVAILABLE:
+            tree = html if isinstance(html, HTMLParser) else HTMLParser(html)
+            title_elem = tree.css_first('h1') or tree.css_first('title')
+            title = title_elem.text().strip() if title_elem else "Untitled Document"
+            date_source = self._date_attribute(
+                [(node.tag, node.attributes) for node in tree.css('time[datetime], meta[name]')]
+            ) or ' '.join(node.text(separator=' ') for node in tree.css(_DATE_NODE_SELECTOR))
+            root = tree.body or tree.root
+            if root and not _RE_DATE_ANY.search(date_source):
+                date_source = root.text(separator=' ')
+            if root:
+                for node in root.traverse():
+                    if _RE_DATE_LABEL.search(node.text(deep=False)):
+                        date_text = node.text()
+                        break
+        else:
+            soup = html if isinstance(html, BeautifulSoup) else BeautifulSoup(html, 'lxml')
+            title_elem = soup.find('h1') or soup.find('title')
+            title = title_elem.text.strip() if title_elem else "Untitled Document"
+            date_source = self._date_attribute(
+                [(node.name, node.attrs) for node in soup.select('time[datetime], meta[name]')]
+            ) or ' '.join(node.get_text(' ') for node in soup.select(_DATE_NODE_SELECTOR))
+            if not _RE_DATE_ANY.search(date_source):
+                date_source = soup.get_text()
+            date_elem = soup.find(text=_RE_DATE_LABEL)
+            if date_elem and date_elem.parent:
+                date_text = date_elem.parent.get_text()
+        
+        # Try to extract date from the narrowed text
+        match = _RE_DATE_ANY.search(date_source)
+        if match:
+            metadata['date'] = match.group()
         
         # Look for date in structured data
-        date_elem = soup.find(text=re.compile(r'Date|date', re.I))
-        if date_elem:
-            parent = date_elem.parent
-            if parent:
-                date_text = parent.get_text()
-                date_match = re.search(r'\d{4}-\d{2}-\d{2}|\w+ \d{1,2}, \d{4}', date_text)
-                if date_match:
-                    metadata['date'] = date_match.group()
+        if date_text:
+            date_match = _RE_STRUCTURED_DATE.search(date_text)
+            if date_match:
+                metadata['date'] = date_match.group()
         
         # Determine document type
         title_lower = title.lower()
@@ -398,6 +1131,103 @@ class LoCScraperImproved:
         
         return metadata
     
+    def _view_key(self) -> tuple:
+        """Cheap fingerprint of the browser's current view: URL and body innerHTML length."""
+        return (
+            self.driver.current_url,
+            self.driver.execute_script("return document.body ? document.body.innerHTML.length : 0;"),
+        )
+    
+    def _wait_until(self, condition, timeout: float = None) -> bool:
+        """
+        Wait for a condition on the driver instead of sleeping a fixed time.
+        
+        Args:
+            condition: Callable taking the driver (e.g. an expected_conditions check)
+            timeout: Seconds to wait; defaults to the shared self.wait timeout
+            
+        Returns:
+            True if the condition held before the timeout, False otherwise
+        """
+        wait = self.wait if timeout is None else WebDriverWait(self.driver, timeout)
+        try:
+            wait.until(condition)
+            return True
+        except TimeoutException:
+            return False
+    
+    def _find_download_controls(self) -> tuple:
+        """
+        Find the download format <select> and its Go button on the current page.
+        
+        Both come back from a single script, and are remembered for the
+        current URL until the elements go stale (i.e. the page reloads).
+        
+        Returns:
+            (select element, Go button element); either may be None
+        """
+        current_url = self.driver.current_url
+        cached = self._local.download_controls
+        if cached and cached[0] == current_url and cached[1] is not None:
+            try:
+                cached[1].is_enabled()  # Raises if the page has been reloaded
+                return cached[1], cached[2]
+            except StaleElementReferenceException:
+                pass
+        
+        download_select, go_button = self.driver.execute_script(self._DOWNLOAD_CONTROLS_JS) or (None, None)
+        self._local.download_controls = (current_url, download_select, go_button)
+        return download_select, go_button
+    
+    def _parse_page_source(self):
+        """
+        Parse the browser's current page, reusing the last parse if the view hasn't changed.
+        
+        The page is parsed with _parse_html (selectolax if available).
+        
+        The view state is keyed by the current URL plus the length of the
+        body's innerHTML, which is cheap to read and changes whenever a view
+        switch loads new content.
+        """
+        view_key = self._view_key()
+        parsed_page = self._local.parsed_page
+        if parsed_page is None or parsed_page[0] != view_key:
+            parsed_page = (view_key, self._parse_html(self.driver.page_source))
+            self._local.parsed_page = parsed_page
+        return parsed_page[1]
+    
+    def _find_candidates(self, xpath: str = None, css: str = None, phrases=(),
+                         phrase_target: str = None, context=None) -> List[Dict]:
+        """
+        Find visible elements with their text/title/aria-label/class.
+        
+        Runs as one script, so all matches and their attributes come back in a
+        single WebDriver round-trip instead of one call per element attribute.
+        
+        Args:
+            xpath: XPath expression (relative if context is given)
+            css: CSS selector
+            phrases: Lowercase phrases; elements whose text contains one also match
+            phrase_target: CSS selector of the ancestor to take for a phrase match
+            context: Optional WebElement to search within
+            
+        Returns:
+            List of dicts with keys el, text, title, aria, cls, view
+        """
+        return self.driver.execute_script(
+            self._CANDIDATES_JS, xpath, css, list(phrases), phrase_target, context
+        ) or []
+    
+    def _dedupe_candidates(self, candidates: List[Dict]) -> List[Dict]:
+        """Drop candidates for the same element matched by more than one query."""
+        seen = set()
+        unique = []
+        for cand in candidates:
+            if cand['el'].id not in seen:
+                seen.add(cand['el'].id)
+                unique.append(cand)
+        return unique
+    
     def download_via_selenium(self, url: str, format_type: str = 'text') -> Optional[str]:
         """
         Download file using Selenium by interacting with download dropdown and Go button.
@@ -413,143 +1243,89 @@ class LoCScraperImproved:
         if not self.driver:
             return None
         
+        url_part = _url_part(url)
         try:
-            print(f"  Loading page with Selenium...")
+            logger.info("  Loading page with Selenium...")
             self.driver.get(url)
             
-            # Wait for page to load
-            WebDriverWait(self.driver, 15).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
-            time.sleep(3)  # Give JavaScript time to render
+            # Wait for the viewer controls to render rather than a fixed delay
+            if not self._wait_until(EC.presence_of_element_located((By.CSS_SELECTOR, self._VIEWER_READY_CSS))):
+                logger.info("  Viewer controls did not appear, continuing with what loaded")
             
             # Method 1: Try the "Text with Images" view option (best for text extraction)
-            print(f"  Looking for 'Text with Images' view option...")
+            logger.info("  Looking for 'Text with Images' view option...")
             try:
                 # Look for buttons/options that switch to text view
-                text_view_selectors = [
-                    "//button[contains(translate(@title, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'text')]",
-                    "//a[contains(translate(@title, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'text')]",
-                    "//button[contains(translate(@aria-label, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'text')]",
-                    "//*[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'text with image')]",
-                    "//*[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'text and image')]",
-                    "//*[contains(translate(@class, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'text-view')]",
-                    "//*[contains(translate(@id, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'text-view')]",
-                ]
-                
-                text_view_buttons = []
-                for selector in text_view_selectors:
-                    try:
-                        buttons = self.driver.find_elements(By.XPATH, selector)
-                        text_view_buttons.extend(buttons)
-                    except:
-                        continue
+                try:
+                    text_view_buttons = self._find_candidates(css=self._TEXT_VIEW_CSS, phrases=self._TEXT_VIEW_PHRASES)
+                except:
+                    text_view_buttons = []
                 
                 # Also look in toolbar/control areas and view mode tabs
                 try:
-                    # Look for view mode tabs/buttons (Image, PDF, Text)
-                    view_mode_elements = self.driver.find_elements(By.XPATH,
-                        "//*[contains(@class, 'toolbar')]//button | "
-                        "//*[contains(@class, 'controls')]//button | "
-                        "//*[contains(@class, 'viewer-controls')]//button | "
-                        "//*[contains(@class, 'view-mode')]//button | "
-                        "//*[contains(@class, 'tab')]//button | "
-                        "//*[contains(@class, 'view-tab')] | "
-                        "//*[@role='tab']"
-                    )
-                    for btn in view_mode_elements:
-                        btn_text = (btn.text or btn.get_attribute('title') or btn.get_attribute('aria-label') or btn.get_attribute('data-view') or '').lower()
+                    for cand in self._find_candidates(css=self._VIEW_MODE_CSS):
+                        btn_text = (cand['text'] or cand['title'] or cand['aria'] or cand['view']).lower()
                         # Look for text view options
                         if 'text' in btn_text and ('image' in btn_text or 'view' in btn_text or 'transcript' in btn_text):
-                            text_view_buttons.append(btn)
+                            text_view_buttons.append(cand)
                         # Also check for buttons that say just "Text" when other options are "Image" and "PDF"
                         elif btn_text.strip() == 'text' or btn_text == 'text view':
-                            text_view_buttons.append(btn)
+                            text_view_buttons.append(cand)
                 except:
                     pass
                 
-                # Remove duplicates
-                seen = set()
-                unique_text_buttons = []
-                for btn in text_view_buttons:
-                    try:
-                        btn_id = id(btn)
-                        if btn_id not in seen and btn.is_displayed():
-                            seen.add(btn_id)
-                            unique_text_buttons.append(btn)
-                    except:
-                        continue
-                
-                for btn in unique_text_buttons:
+                for cand in self._dedupe_candidates(text_view_buttons):
+                    btn = cand['el']
                     try:
-                        btn_text = (btn.text or btn.get_attribute('title') or btn.get_attribute('aria-label') or '').lower()
+                        btn_text = (cand['text'] or cand['title'] or cand['aria']).lower()
                         if 'text' in btn_text:
-                            print(f"    Found text view button: {btn_text}")
+                            logger.debug("    Found text view button: %s", btn_text)
                             
                             # Click to switch to text view
-                            self.driver.execute_script("arguments[0].scrollIntoView(true);", btn)
-                            time.sleep(0.5)
-                            self.driver.execute_script("arguments[0].click();", btn)
-                            time.sleep(4)  # Wait for view to change and content to load
+                            view_before = self._view_key()
+                            self.driver.execute_script(self._SCROLL_CLICK_JS, btn)
                             
-                            # Wait for text content to appear
-                            try:
-                                WebDriverWait(self.driver, 10).until(
-                                    lambda d: len(d.find_elements(By.XPATH, "//*[contains(@class, 'text')] | //*[contains(@class, 'transcript')] | //pre | //p")) > 0
-                                )
-                            except:
-                                pass
+                            # Wait for the view to change and text content to appear
+                            self._wait_until(lambda d: self._view_key() != view_before and len(
+                                d.find_elements(By.XPATH, self._TEXT_CONTENT_XPATH)
+                            ) > 0)
                             
                             # Now extract text from the page
-                            page_source = self.driver.page_source
-                            soup = BeautifulSoup(page_source, 'html.parser')
+                            page = self._parse_page_source()
                             
                             # Look for transcription/text content areas
-                            text_content = self._extract_text_from_text_view(soup)
+                            text_content = self._extract_text_from_text_view(page)
                             if text_content and len(text_content) > 100:
-                                print(f"    Extracted {len(text_content)} characters from text view")
+                                logger.debug("    Extracted %s characters from text view", len(text_content))
                                 return text_content
                             
                             # Also try getting text directly from the page if view changed
                             try:
                                 # Look for text elements that appeared after switching view
-                                text_elements = self.driver.find_elements(By.XPATH,
-                                    "//*[contains(@class, 'transcription')] | "
-                                    "//*[contains(@class, 'text-content')] | "
-                                    "//pre | "
-                                    "//*[@role='textbox']"
-                                )
+                                text_elements = self.driver.find_elements(By.XPATH, self._TRANSCRIPTION_XPATH)
                                 for elem in text_elements:
                                     if elem.is_displayed():
                                         elem_text = elem.text.strip()
                                         if len(elem_text) > 100:
-                                            print(f"    Extracted {len(elem_text)} characters from text element")
+                                            logger.debug("    Extracted %s characters from text element", len(elem_text))
                                             return elem_text
                             except:
                                 pass
                     except Exception as e:
-                        print(f"    Error with text view button: {e}")
+                        logger.debug("    Error with text view button: %s", e)
                         continue
             except Exception as e:
-                print(f"    Text view method failed: {e}")
+                logger.debug("    Text view method failed: %s", e)
             
             # Method 2: Try the PDF/image conversion button at the top of document viewer
-            print(f"  Looking for PDF/image conversion button at top of viewer...")
+            logger.info("  Looking for PDF/image conversion button at top of viewer...")
             try:
                 # Look for buttons/icons at the top of the document viewer area
                 # These are usually toolbar buttons that switch view modes
                 viewer_area = None
                 try:
                     # Try to find the document viewer container
-                    viewer_selectors = [
-                        "//*[contains(@class, 'viewer')]",
-                        "//*[contains(@id, 'viewer')]",
-                        "//*[contains(@class, 'document')]",
-                        "//*[contains(@class, 'image')]",
-                        "//iframe",
-                        "//*[@role='img']"
-                    ]
-                    for selector in viewer_selectors:
+                    for selector in self._VIEWER_XPATHS:
                         try:
                             viewers = self.driver.find_elements(By.XPATH, selector)
                             if viewers:
@@ -561,76 +1337,42 @@ class LoCScraperImproved:
                     pass
                 
                 # Look for buttons/icons that convert to PDF - check toolbar areas
-                pdf_button_selectors = [
-                    # Buttons with PDF in title/aria-label
-                    "//button[contains(translate(@title, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'pdf')]",
-                    "//a[contains(translate(@title, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'pdf')]",
-                    "//button[contains(translate(@aria-label, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'pdf')]",
-                    # Buttons in toolbar/control areas
-                    "//*[contains(@class, 'toolbar')]//button | //*[contains(@class, 'controls')]//button",
-                    "//*[contains(@class, 'viewer-controls')]//button",
-                    # Icon buttons (SVG, img, etc.)
-                    "//*[contains(@class, 'icon') and contains(translate(@class, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'pdf')]",
-                    # Links/buttons near "PDF" text
-                    "//*[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'pdf')]/ancestor::button | //*[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'pdf')]/ancestor::a"
-                ]
-                
-                pdf_buttons = []
-                for selector in pdf_button_selectors:
-                    try:
-                        buttons = self.driver.find_elements(By.XPATH, selector)
-                        pdf_buttons.extend(buttons)
-                    except:
-                        continue
+                try:
+                    pdf_buttons = self._find_candidates(css=self._PDF_BTN_CSS, phrases=self._PDF_BTN_PHRASES,
+                                                       phrase_target='button, a')
+                except:
+                    pdf_buttons = []
                 
                 # Also look for buttons that might switch view modes (image -> PDF)
                 if viewer_area:
                     try:
                         # Look for buttons near the viewer
-                        viewer_buttons = viewer_area.find_elements(By.XPATH,
-                            ".//ancestor::*[contains(@class, 'toolbar')]//button | "
-                            ".//preceding-sibling::*//button | "
-                            ".//following-sibling::*//button"
-                        )
-                        pdf_buttons.extend(viewer_buttons)
+                        pdf_buttons.extend(self._find_candidates(xpath=self._VIEWER_BUTTONS_XPATH, context=viewer_area))
                     except:
                         pass
                 
-                # Remove duplicates and filter visible buttons
-                seen = set()
-                unique_buttons = []
-                for btn in pdf_buttons:
-                    try:
-                        btn_id = id(btn)
-                        if btn_id not in seen and btn.is_displayed():
-                            seen.add(btn_id)
-                            unique_buttons.append(btn)
-                    except:
-                        continue
-                
-                for btn in unique_buttons:
+                for cand in self._dedupe_candidates(pdf_buttons):
+                    btn = cand['el']
                     try:
-                        btn_text = btn.text.lower()
-                        btn_title = (btn.get_attribute('title') or btn.get_attribute('aria-label') or '').lower()
-                        btn_class = (btn.get_attribute('class') or '').lower()
+                        btn_text = cand['text'].lower()
+                        btn_title = (cand['title'] or cand['aria']).lower()
+                        btn_class = cand['cls'].lower()
                         
                         # Check if this button is related to PDF
                         if 'pdf' in btn_text or 'pdf' in btn_title or 'pdf' in btn_class:
-                            print(f"    Found PDF conversion button: {btn_text or btn_title or btn_class}")
+                            logger.debug("    Found PDF conversion button: %s", btn_text or btn_title or btn_class)
                             
                             # Set up download path
-                            url_part = url.split('/')[-1].replace('.html', '').replace('/', '_')
                             pdf_path = self.output_dir / f"loc_{url_part}.pdf"
                             
-                            # Click the button
-                            self.driver.execute_script("arguments[0].scrollIntoView(true);", btn)
-                            time.sleep(0.5)
-                            self.driver.execute_script("arguments[0].click();", btn)
-                            time.sleep(4)  # Wait for PDF conversion/download
+                            # Click the button, then wait for the PDF download, PDF view or PDF links
+                            self.driver.execute_script(self._SCROLL_CLICK_JS, btn)
+                            self._wait_until(lambda d: pdf_path.exists() or 'pdf' in d.current_url.lower()
+                                             or d.execute_script(self._PDF_LINKS_JS))
                             
                             # Check if PDF was downloaded
                             if pdf_path.exists():
-                                print(f"    PDF downloaded: {pdf_path}")
+                                logger.debug("    PDF downloaded: %s", pdf_path)
                                 content = self.extract_text_from_pdf(pdf_path)
                                 if content:
                                     return content
@@ -638,99 +1380,54 @@ class LoCScraperImproved:
                             # Check if URL changed to PDF view
                             current_url = self.driver.current_url
                             if 'pdf' in current_url.lower() or '.pdf' in current_url or 'st=pdf' in current_url:
-                                print(f"    Switched to PDF view: {current_url}")
-                                # Try to download the PDF from this URL
-                                if self.download_file(current_url, pdf_path):
-                                    content = self.extract_text_from_pdf(pdf_path)
-                                    if content:
-                                        return content
+                                logger.debug("    Switched to PDF view: %s", current_url)
+                                # Read the PDF Chrome loaded, or download it from this URL
+                                content = self._selenium_pdf_text(current_url, pdf_path)
+                                if content:
+                                    return content
                             
                             # Check for download links that appeared after clicking
-                            time.sleep(2)
-                            download_links = self.driver.find_elements(By.XPATH,
-                                "//a[contains(@href, '.pdf')] | "
-                                "//a[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'download')] | "
-                                "//a[contains(@href, 'st=pdf')]"
-                            )
-                            for link in download_links:
-                                href = link.get_attribute('href')
+                            for href in self.driver.execute_script(self._PDF_LINKS_JS) or []:
                                 if href and ('.pdf' in href.lower() or 'st=pdf' in href.lower()):
-                                    print(f"    Found PDF download link: {href}")
-                                    if self.download_file(href, pdf_path):
-                                        content = self.extract_text_from_pdf(pdf_path)
-                                        if content:
-                                            return content
+                                    logger.debug("    Found PDF download link: %s", href)
+                                    content = self.download_pdf_text(href, pdf_path)
+                                    if content:
+                                        return content
                             
                             # If we're now on a PDF page, try to get the PDF content directly
                             if 'pdf' in current_url.lower():
                                 # The page might now show PDF - try to extract it
                                 try:
-                                    pdf_iframe = self.driver.find_element(By.XPATH, "//iframe[contains(@src, '.pdf')]")
+                                    pdf_iframe = self.driver.find_element(By.XPATH, self._PDF_IFRAME_XPATH)
                                     iframe_src = pdf_iframe.get_attribute('src')
                                     if iframe_src:
-                                        print(f"    Found PDF iframe: {iframe_src}")
-                                        if self.download_file(iframe_src, pdf_path):
-                                            content = self.extract_text_from_pdf(pdf_path)
-                                            if content:
-                                                return content
+                                        logger.debug("    Found PDF iframe: %s", iframe_src)
+                                        content = self._selenium_pdf_text(iframe_src, pdf_path)
+                                        if content:
+                                            return content
                                 except:
                                     pass
                             
                             break
                     except Exception as e:
-                        print(f"    Error clicking PDF button: {e}")
+                        logger.debug("    Error clicking PDF button: %s", e)
                         continue
                         
             except Exception as e:
-                print(f"    PDF button method failed: {e}")
+                logger.debug("    PDF button method failed: %s", e)
             
             # Method 2: Try the download dropdown + Go button (existing method)
             
             # Find the download dropdown (select element)
-            print(f"  Looking for download dropdown...")
+            logger.info("  Looking for download dropdown...")
             try:
-                # Try multiple selectors for the dropdown
-                select_selectors = [
-                    "select[name*='format']",
-                    "select[id*='format']",
-                    "select[class*='format']",
-                    "select",
-                ]
-                
-                download_select = None
-                for selector in select_selectors:
-                    try:
-                        elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                        for elem in elements:
-                            # Check if it's near "Download" text
-                            parent = elem.find_element(By.XPATH, "./..")
-                            if 'download' in parent.text.lower():
-                                download_select = elem
-                                break
-                        if download_select:
-                            break
-                    except:
-                        continue
+                download_select, go_button = self._find_download_controls()
                 
                 if not download_select:
-                    # Try finding by text near "Download"
-                    download_labels = self.driver.find_elements(By.XPATH, 
-                        "//*[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'download')]"
-                    )
-                    for label in download_labels:
-                        try:
-                            # Find select near this label
-                            select = label.find_element(By.XPATH, "./following-sibling::select | ./../select")
-                            download_select = select
-                            break
-                        except:
-                            continue
-                
-                if not download_select:
-                    print(f"    Could not find download dropdown")
+                    logger.debug("    Could not find download dropdown")
                     return None
                 
-                print(f"    Found download dropdown")
+                logger.debug("    Found download dropdown")
                 
                 # Select the format option
                 select_obj = Select(download_select)
@@ -746,14 +1443,14 @@ class LoCScraperImproved:
                     try:
                         select_obj.select_by_visible_text(option_text)
                         selected = True
-                        print(f"    Selected format: {option_text}")
+                        logger.debug("    Selected format: %s", option_text)
                         break
                     except:
                         try:
                             # Try by value
                             select_obj.select_by_value(option_text.lower())
                             selected = True
-                            print(f"    Selected format by value: {option_text}")
+                            logger.debug("    Selected format by value: %s", option_text)
                             break
                         except:
                             continue
@@ -763,77 +1460,33 @@ class LoCScraperImproved:
                     try:
                         if format_type == 'text' and len(select_obj.options) > 1:
                             select_obj.select_by_index(1)  # Usually text is second option
-                            print(f"    Selected format by index")
+                            logger.debug("    Selected format by index")
                         else:
                             select_obj.select_by_index(0)
                     except:
                         pass
                 
-                time.sleep(1)  # Wait for selection to register
-                
-                # Find and click the "Go" button
-                print(f"    Looking for Go button...")
-                go_button = None
-                
-                # Try multiple ways to find Go button
-                go_selectors = [
-                    "//button[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'go')]",
-                    "//input[@type='submit' and contains(translate(@value, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'go')]",
-                    "//a[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'go')]",
-                    "//button[@type='submit']",
-                ]
-                
-                for selector in go_selectors:
-                    try:
-                        buttons = self.driver.find_elements(By.XPATH, selector)
-                        for btn in buttons:
-                            if btn.is_displayed() and btn.is_enabled():
-                                # Check if it's near the download dropdown
-                                try:
-                                    btn_parent = btn.find_element(By.XPATH, "./..")
-                                    if download_select in btn_parent.find_elements(By.TAG_NAME, "*"):
-                                        go_button = btn
-                                        break
-                                except:
-                                    # Just take the first visible Go button
-                                    go_button = btn
-                                    break
-                        if go_button:
-                            break
-                    except:
-                        continue
-                
-                if not go_button:
-                    # Try finding button near the select element
-                    try:
-                        select_parent = download_select.find_element(By.XPATH, "./..")
-                        buttons = select_parent.find_elements(By.TAG_NAME, "button")
-                        for btn in buttons:
-                            if btn.is_displayed():
-                                go_button = btn
-                                break
-                    except:
-                        pass
-                
+                # Click the "Go" button found alongside the dropdown
                 if not go_button:
-                    print(f"    Could not find Go button")
+                    logger.debug("    Could not find Go button")
                     return None
                 
-                print(f"    Found Go button, clicking...")
+                logger.debug("    Found Go button, clicking...")
                 
                 # Set up download directory before clicking
-                url_part = url.split('/')[-1].replace('.html', '').replace('/', '_')
                 download_path = self.output_dir / f"loc_{url_part}_{format_type}.txt"
                 if format_type == 'pdf':
                     download_path = self.output_dir / f"loc_{url_part}.pdf"
                 
-                # Click the Go button
+                # Click the Go button once the page has enabled it after the selection
+                self._wait_until(EC.element_to_be_clickable(go_button))
                 self.driver.execute_script("arguments[0].click();", go_button)
-                time.sleep(3)  # Wait for download to start
+                # Wait for download to start (file appears)
+                self._wait_until(lambda d: download_path.exists(), timeout=5)
                 
                 # Check if download started (file appears)
                 if download_path.exists():
-                    print(f"    File downloaded: {download_path}")
+                    logger.debug("    File downloaded: %s", download_path)
                     if format_type == 'pdf':
                         return self.extract_text_from_pdf(download_path)
                     else:
@@ -844,34 +1497,103 @@ class LoCScraperImproved:
                         download_url = go_button.get_attribute('href') or go_button.get_attribute('onclick')
                         if download_url and 'http' in download_url:
                             # Extract URL from onclick or href
-                            import re
-                            url_match = re.search(r'https?://[^\s\'"]+', download_url)
+                            url_match = _RE_HTTP_URL.search(download_url)
                             if url_match:
                                 download_url = url_match.group()
-                                print(f"    Found download URL: {download_url}")
-                                if self.download_file(download_url, download_path):
-                                    if format_type == 'pdf':
-                                        return self.extract_text_from_pdf(download_path)
-                                    else:
-                                        return download_path.read_text(encoding='utf-8', errors='ignore')
+                                logger.debug("    Found download URL: %s", download_url)
+                                if format_type == 'pdf':
+                                    return self.download_pdf_text(download_url, download_path) or None
+                                return self.download_text(download_url, download_path)
                     except:
                         pass
                     
-                    print(f"    Download may have failed or requires manual interaction")
+                    logger.debug("    Download may have failed or requires manual interaction")
                     return None
                     
             except Exception as e:
-                print(f"    Error interacting with download interface: {e}")
+                logger.warning("    Error interacting with download interface: %s", e)
                 return None
                 
         except Exception as e:
-            print(f"  Selenium download failed: {e}")
+            logger.warning("  Selenium download failed: %s", e)
+            return None
+    
+    def _cache_path(self, url: str) -> Path:
+        """Where the scraped document for url is cached."""
+        return self.cache_dir / f"{_url_part(url)}.json"
+    
+    def _load_cached_document(self, url: str) -> Optional[Dict]:
+        """
+        Return the document an earlier run scraped from url, if any.
+        
+        Args:
+            url: URL to the LoC resource page
+            
+        Returns:
+            The cached document data, or None if there is no usable cache entry
+        """
+        if not self.use_cache:
+            return None
+        cache_path = self._cache_path(url)
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                doc_data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        # Another URL with the same last segment, or a document that came back empty
+        if doc_data.get('url') != url or len(doc_data.get('content') or '') <= 50:
             return None
+        logger.info("  Using cached document: %s", cache_path)
+        return doc_data
+    
+    def _save_cached_document(self, doc_data: Dict) -> None:
+        """Cache a scraped document for later runs."""
+        if not self.use_cache:
+            return
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        cache_path = self._cache_path(doc_data['url'])
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            json.dump(doc_data, f, ensure_ascii=False)
+    
+    def _fetch_predicted_fulltext(self, url: str) -> Optional[str]:
+        """
+        Download a Lincoln Papers transcription straight from its predictable tile.loc.gov URL.
+        
+        Args:
+            url: URL to the LoC resource page
+            
+        Returns:
+            The transcription text, or None if url isn't a Lincoln Papers
+            item or the text file isn't there
+        """
+        match = _RE_MAL_PAGE.search(url)
+        if not match:
+            return None
+        mal_id = match.group(1)
+        text_url = self.MAL_FULLTEXT_URL.format(prefix=mal_id[:3], mal_id=mal_id)
+        
+        logger.info("  Trying predicted fulltext URL: %s", text_url)
+        try:
+            response = self._get(text_url, timeout=5)
+        except requests.RequestException as e:
+            logger.debug("    Predicted fulltext URL failed: %s", e)
+            return None
+        # A missing file can come back as an HTML error page
+        if response.status_code != 200 or 'text/plain' not in response.headers.get('Content-Type', ''):
+            logger.debug("    No text at predicted fulltext URL (HTTP %s)", response.status_code)
+            return None
+        
+        text = response.content.decode('utf-8', errors='ignore')
+        return text if len(text.strip()) > 50 else None
     
     def scrape_document(self, url: str) -> Optional[Dict]:
         """
         Scrape a document by downloading its files.
-        Uses Selenium to interact with download dropdown and Go button.
+        
+        Documents scraped by an earlier run are returned from the cache. Otherwise
+        tries the predictable Lincoln Papers transcription URL, then the JSON
+        API's fulltext_file; only if those yield nothing does it use Selenium to
+        interact with the download dropdown and Go button.
         
         Args:
             url: URL to the LoC resource page
@@ -879,51 +1601,33 @@ class LoCScraperImproved:
         Returns:
             Dictionary with document data
         """
-        print(f"\nScraping: {url}")
+        logger.info("\nScraping: %s", url)
+        
+        cached = self._load_cached_document(url)
+        if cached:
+            return cached
         
         try:
             content = ""
             file_format_used = None
             title = "Untitled Document"
+            # Parsed item page (from the browser or the HTML fallback), reused for metadata
+            page = None
             
-            # Try Selenium first if available (handles JavaScript and download UI)
-            if self.driver:
-                try:
-                    print(f"  Using Selenium to download...")
-                    # Try text format first
-                    content = self.download_via_selenium(url, format_type='text')
-                    if content:
-                        file_format_used = 'text'
-                        print(f"  Successfully downloaded text format ({len(content)} chars)")
-                    else:
-                        # Try PDF format
-                        print(f"  Text download failed, trying PDF...")
-                        content = self.download_via_selenium(url, format_type='pdf')
-                        if content:
-                            file_format_used = 'pdf'
-                            print(f"  Successfully downloaded PDF format ({len(content)} chars)")
-                    
-                    # Get title from page
-                    try:
-                        title_elem = self.driver.find_element(By.TAG_NAME, "h1")
-                        title = title_elem.text.strip()
-                    except:
-                        try:
-                            title = self.driver.title
-                        except:
-                            pass
-                    
-                except Exception as e:
-                    print(f"  Selenium failed: {e}, trying fallback methods...")
+            # Lincoln Papers transcriptions live at a URL derived from the item ID,
+            # so try that single GET before the JSON API
+            content = self._fetch_predicted_fulltext(url) or ""
+            if content:
+                file_format_used = 'text'
+                logger.info("  Downloaded text from predicted fulltext URL (%s chars)", len(content))
             
-            # Fallback: Try JSON API fulltext_file URL (most reliable for text)
+            # Try JSON API fulltext_file URL next (most reliable for text, and a
+            # single HTTP round-trip - most documents never need the browser)
             if not content:
                 try:
-                    print(f"  Trying JSON API to get fulltext_file URL...")
-                    api_url = url.rstrip('/') + '/?fo=json'
-                    api_response = self._fetch_with_retry(api_url)
-                    if api_response.headers.get('content-type', '').startswith('application/json'):
-                        api_data = api_response.json()
+                    logger.info("  Trying JSON API to get fulltext_file URL...")
+                    api_data = self._fetch_json(url)
+                    if api_data:
                         
                         # Look for fulltext_file URL in multiple places
                         fulltext_file = None
@@ -947,183 +1651,196 @@ class LoCScraperImproved:
                                 fulltext_file = resource_obj.get('fulltext_file')
                         
                         if fulltext_file and '.txt' in fulltext_file:
-                            print(f"  Found fulltext_file URL: {fulltext_file}")
+                            logger.info("  Found fulltext_file URL: %s", fulltext_file)
                             # Download the text file directly
                             # Extract ID from URL (e.g., mal.4361800 from https://www.loc.gov/resource/mal.4361800/)
-                            url_parts = url.rstrip('/').split('/')
-                            url_part = url_parts[-1] if url_parts[-1] else url_parts[-2]
-                            url_part = url_part.replace('.html', '').replace('/', '_')
+                            url_part = _url_part(url)
                             if not url_part or url_part == 'loc':
                                 # Try to extract from fulltext_file URL itself
-                                import re
-                                match = re.search(r'mal[.\d]+', fulltext_file)
+                                match = _RE_MAL_ID.search(fulltext_file)
                                 if match:
                                     url_part = match.group()
                             text_path = self.output_dir / f"loc_{url_part}.txt"
                             
-                            if self.download_file(fulltext_file, text_path):
-                                content = text_path.read_text(encoding='utf-8', errors='ignore')
-                                if content and len(content) > 50:
-                                    file_format_used = 'text'
-                                    print(f"  Downloaded text from fulltext_file ({len(content)} chars)")
-                                    
-                                    # Also get title from JSON
-                                    item = api_data.get('item', {})
-                                    if item:
-                                        title = item.get('title', title)
+                            content = self.download_text(fulltext_file, text_path)
+                            if content and len(content) > 50:
+                                file_format_used = 'text'
+                                logger.info("  Downloaded text from fulltext_file (%s chars)", len(content))
+                                
+                                # Also get title from JSON
+                                item = api_data.get('item', {})
+                                if item:
+                                    title = item.get('title', title)
                 except Exception as e:
-                    print(f"  JSON API fulltext_file method failed: {e}")
+                    logger.info("  JSON API fulltext_file method failed: %s", e)
+            
+            # Fall back to Selenium if available (handles JavaScript and download UI)
+            if self.selenium_enabled and not content:
+                with self._driver_checkout() as driver:
+                    if driver:
+                        try:
+                            logger.info("  Using Selenium to download...")
+                            # Try text format first
+                            content = self.download_via_selenium(url, format_type='text')
+                            if content:
+                                file_format_used = 'text'
+                                logger.info("  Successfully downloaded text format (%s chars)", len(content))
+                            else:
+                                # Try PDF format
+                                logger.info("  Text download failed, trying PDF...")
+                                content = self.download_via_selenium(url, format_type='pdf')
+                                if content:
+                                    file_format_used = 'pdf'
+                                    logger.info("  Successfully downloaded PDF format (%s chars)", len(content))
+                    
+                            # Keep the page for metadata before the driver goes back to the pool
+                            # (reuses the parse from the text view if the page hasn't changed since)
+                            page = self._parse_page_source()
+                            
+                            # Get title from the parsed page rather than further driver calls
+                            title = self._page_title(page)
+                    
+                        except Exception as e:
+                            logger.warning("  Selenium failed: %s, trying HTML fallback...", e)
             
             # Final fallback: Try HTML extraction
             if not content:
                 try:
                     response = self._fetch_with_retry(url)
-                    soup = BeautifulSoup(response.content, 'html.parser')
+                    page = self._parse_html(response.content)
                     
                     if not title or title == "Untitled Document":
-                        title_elem = soup.find('h1') or soup.find('title')
-                        title = title_elem.text.strip() if title_elem else "Untitled Document"
+                        title = self._page_title(page) or "Untitled Document"
                     
                     # Try to extract from page
-                    content = self._extract_content_from_page(soup)
+                    content = self._extract_content_from_page(page)
                     file_format_used = 'html'
                 except Exception as e:
-                    print(f"  HTML extraction also failed: {e}")
+                    logger.warning("  HTML extraction also failed: %s", e)
             
-            # Extract metadata
-            if self.driver:
-                try:
-                    page_source = self.driver.page_source
-                    soup = BeautifulSoup(page_source, 'html.parser')
-                except:
-                    soup = None
-            else:
+            # Extract metadata, only fetching the page if neither Selenium nor the
+            # HTML fallback already parsed it
+            if page is None:
                 try:
                     response = self._fetch_with_retry(url)
-                    soup = BeautifulSoup(response.content, 'html.parser')
+                    page = self._parse_html(response.content)
                 except:
-                    soup = None
+                    page = None
             
-            metadata = self.extract_metadata(soup, url) if soup else {
+            # The direct transcription download carries no title
+            if page is not None and (not title or title == "Untitled Document"):
+                title = self._page_title(page) or "Untitled Document"
+            
+            metadata = self.extract_metadata(page, url) if page is not None else {
                 'date': None, 'place': None, 'from': None, 'to': None, 'document_type': None
             }
             
             # Save raw text file
             if content:
-                url_part = url.split('/')[-1].replace('.html', '').replace('/', '_')
-                text_output = self.output_dir / f"loc_{url_part}.txt"
+                text_output = self.output_dir / f"loc_{_url_part(url)}.txt"
                 text_output.write_text(content, encoding='utf-8')
-                print(f"  Saved text content to: {text_output}")
+                logger.info("  Saved text content to: %s", text_output)
             
-            return {
+            doc_data = {
                 'title': title,
                 'content': content,
                 'url': url,
                 'file_format': file_format_used,
                 **metadata
             }
+            # Only documents with text are cached, so failures are retried next run
+            if content and len(content) > 50:
+                self._save_cached_document(doc_data)
+            return doc_data
             
         except Exception as e:
-            print(f"  Error scraping {url}: {type(e).__name__}: {str(e)[:100]}")
+            logger.warning("  Error scraping %s: %s: %s", url, type(e).__name__, str(e)[:100])
             return None
     
-    def _extract_text_from_text_view(self, soup: BeautifulSoup) -> str:
-        """Extract text content from text-with-images view."""
-        # Look for transcription/text content in text view mode
-        text_selectors = [
-            '.transcription',
-            '.text-content',
-            '.text-view',
-            '[itemprop="text"]',
-            '.item-description',
-            '.document-text',
-            '.manuscript-text',
-            'main',
-            'article',
-            # Look for divs containing transcribed text
-            'div[class*="text"]',
-            'div[class*="transcript"]',
-            'div[class*="content"]'
-        ]
-        
-        for selector in text_selectors:
-            try:
-                elements = soup.select(selector)
-                for elem in elements:
-                    text = elem.get_text(separator='\n', strip=True)
-                    # Filter out navigation and UI text
-                    if len(text) > 200 and not any(skip in text.lower() for skip in ['menu', 'navigation', 'skip to', 'cookie']):
-                        return text
-            except:
-                continue
+    def _extract_text_from_text_view(self, page) -> str:
+        """Extract text content from text-with-images view (page comes from _parse_html)."""
+        # Look for transcription/text content in text view mode (all selectors in one pass)
+        try:
+            for _, elem in self._ranked_matches(page, self._TEXT_VIEW_SELECTORS):
+                text = self._node_text(elem, '\n', strip=True)
+                # Filter out navigation and UI text
+                if len(text) > 200 and not _RE_UI_BLOCK.search(text):
+                    return text
+        except:
+            pass
         
         # Look for pre-formatted text blocks (common in text views)
-        pre_blocks = soup.find_all('pre')
+        pre_blocks = self._select(page, 'pre')
         if pre_blocks:
-            text = '\n'.join([pre.get_text(strip=True) for pre in pre_blocks])
+            text = '\n'.join([self._node_text(pre, strip=True) for pre in pre_blocks])
             if len(text) > 100:
                 return text
         
         # Get all text but filter out common UI elements
-        all_text = soup.get_text(separator='\n', strip=True)
+        all_text = self._node_text(page, '\n', strip=True)
         # Split into lines and filter
         lines = [line.strip() for line in all_text.split('\n') if line.strip()]
         # Remove short lines that are likely UI elements
-        filtered_lines = [line for line in lines if len(line) > 10 and not any(
-            skip in line.lower() for skip in ['cookie', 'menu', 'skip', 'navigation', 'back to top']
-        )]
+        filtered_lines = [line for line in lines if len(line) > 10 and not _RE_UI_LINE.search(line)]
         
         return '\n'.join(filtered_lines)
     
-    def _extract_content_from_page(self, soup: BeautifulSoup) -> str:
-        """Extract text content from HTML page as fallback."""
+    def _extract_content_from_page(self, page) -> str:
+        """Extract text content from HTML page as fallback (page comes from _parse_html)."""
         # First try the text view extraction method
-        text = self._extract_text_from_text_view(soup)
+        text = self._extract_text_from_text_view(page)
         if text and len(text) > 100:
             return text
         
-        # Fallback: look for transcription areas
-        content_selectors = [
-            '.transcription',
-            '.text-content',
-            '[itemprop="text"]',
-            '.item-description',
-            'main',
-            'article'
-        ]
-        
-        for selector in content_selectors:
-            elem = soup.select_one(selector)
+        # Fallback: look for transcription areas (the first match of each selector,
+        # taken from a single pass over the page)
+        nodes = self._select(page, ', '.join(self._CONTENT_SELECTORS))
+        matches = self._css_matcher(page)
+        for selector in self._CONTENT_SELECTORS:
+            elem = next((node for node in nodes if matches(node, selector)), None)
             if elem:
-                text = elem.get_text(separator='\n', strip=True)
+                text = self._node_text(elem, '\n', strip=True)
                 if len(text) > 100:
                     return text
         
         # Fallback: get all paragraph text
-        paragraphs = soup.find_all('p')
-        text = '\n'.join([p.get_text(strip=True) for p in paragraphs])
+        paragraphs = self._select(page, 'p')
+        text = '\n'.join([self._node_text(p, strip=True) for p in paragraphs])
         return text
     
+    def scrape_items(self, urls: List[str]) -> List[Optional[Dict]]:
+        """
+        Scrape documents concurrently on a thread pool.
+        
+        Scraping is I/O-bound (page fetches, file downloads), so documents are
+        processed in parallel on self.concurrency threads. Each thread uses its
+        own HTTP session, at most MAX_CONCURRENT_LOC_REQUESTS requests are in
+        flight to LoC at once, and documents needing the Selenium fallback
+        share a pool of at most MAX_DRIVERS browsers.
+        
+        Args:
+            urls: LoC resource URLs
+            
+        Returns:
+            Scraped document (or None on failure) for each URL, in input order
+        """
+        # Log lines go through tqdm.write so they don't break up the progress bar
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool, logging_redirect_tqdm():
+            return list(tqdm(pool.map(self.scrape_document, urls),
+                             total=len(urls), desc="Scraping LoC documents"))
+    
     def scrape_all_documents(self, urls: List[str]) -> List[Dict]:
-        """Scrape multiple documents."""
-        results = []
+        """
+        Scrape multiple documents, reusing the same pooled drivers.
         
-        try:
-            for url in tqdm(urls, desc="Scraping LoC documents"):
-                doc_data = self.scrape_document(url)
-                if doc_data:
-                    results.append(doc_data)
-                time.sleep(2)  # Be respectful
-        finally:
-            # Clean up Selenium driver
-            if self.driver:
-                self.driver.quit()
-        
-        return results
+        The drivers are left open so the scraper can be reused; call close()
+        (or use the scraper as a context manager) when done.
+        """
+        return [doc_data for doc_data in self.scrape_items(urls) if doc_data]
 
 
 if __name__ == "__main__":
-    scraper = LoCScraperImproved()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     
     loc_urls = [
         "https://www.loc.gov/item/mal0440500/",  # Election night 1860
@@ -1137,7 +1854,8 @@ if __name__ == "__main__":
     print("Improved LoC Scraper - Testing")
     print("=" * 70)
     
-    documents = scraper.scrape_all_documents(loc_urls)
+    with LoCScraperImproved() as scraper:
+        documents = scraper.scrape_all_documents(loc_urls)
     
     print(f"\n{'='*70}")
     print(f"Successfully scraped {len(documents)} out of {len(loc_urls)} documents")
@@ -9,6 +9,7 @@ This script orchestrates the entire Part 1 process:
 Run this script to complete Part 1 of the project.
 """
 
+import logging
 import sys
 from pathlib import Path
 
@@ -45,7 +46,6 @@ def main():
     print("STEP 2: Scraping Library of Congress Documents")
     print("=" * 70)
     
-    loc_scraper = LoCScraperImproved()
     loc_urls = [
         "https://www.loc.gov/item/mal0440500/",  # Election night 1860
         "https://www.loc.gov/resource/mal.0882800",  # Fort Sumter Decision
@@ -53,7 +53,8 @@ def main():
         "https://www.loc.gov/resource/mal.4361300",  # Second Inaugural Address
         "https://www.loc.gov/resource/mal.4361800/",  # Last Public Address
     ]
-    loc_documents = loc_scraper.scrape_all_documents(loc_urls)
+    with LoCScraperImproved() as loc_scraper:
+        loc_documents = loc_scraper.scrape_all_documents(loc_urls)
     
     print(f"\n[OK] Scraped {len(loc_documents)} out of {len(loc_urls)} documents")
     
@@ -86,5 +87,6 @@ def main():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     main()
 
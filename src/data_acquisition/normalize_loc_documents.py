@@ -7,11 +7,30 @@ into the required JSON schema, saving to data/normalized/loc_dataset.json
 
 import sys
 import json
+import logging
 import re
-import requests
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+
+# Try to import selectolax for fast HTML-to-text extraction, fall back to BeautifulSoup
+try:
+    from selectolax.parser import HTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+    print("Warning: selectolax not installed. Install with: pip install selectolax")
+
+# Try to import orjson for fast parsing of LoC API dumps, fall back to the json module
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    print("Warning: orjson not installed. Install with: pip install orjson")
 
 # Add project root to path
 script_dir = Path(__file__).parent
@@ -19,6 +38,112 @@ project_root = script_dir.parent.parent
 sys.path.insert(0, str(project_root))
 
 from src.data_acquisition.normalizer import DataNormalizer
+from src.data_acquisition.http_session import create_session
+
+# Per-file progress; files are processed concurrently, so each line names its file
+logger = logging.getLogger(__name__)
+
+# Files processed at once by normalize_loc_files (each one waits on the LoC API)
+MAX_WORKERS = 8
+
+# One keep-alive session per worker thread (requests.Session isn't guaranteed
+# thread-safe); create_session caches responses on disk across runs
+_local = threading.local()
+# Metadata by item URL, for files that map to the same item
+_metadata_cache = {}
+_metadata_lock = threading.Lock()
+
+
+def _get_session():
+    """Return the calling thread's HTTP session."""
+    session = getattr(_local, 'session', None)
+    if session is None:
+        session = create_session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=MAX_WORKERS)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        _local.session = session
+    return session
+
+# Navigation/boilerplate lines dropped by clean_html_and_metadata (matched from the line start)
+_SKIP_PATTERNS = [
+    r'^Library of Congress$',
+    r'^Exhibitions$',
+    r'^Ask a Librarian$',
+    r'^Digital Collections$',
+    r'^Library Catalogs$',
+    r'^The Library of Congress$',
+    r'^> Online Exhibition$',
+    r'^Back to Exhibition$',
+    r'^Connect with the Library$',
+    r'^All ways to connect$',
+    r'^Subscribe & Comment$',
+    r'^RSS & E-Mail$',
+    r'^Download & Play$',
+    r'^\(external link\)$',
+    r'^Inspector General$',
+    r'^Accessibility$',
+    r'^External Link Disclaimer$',
+    r'^Speech Enabled$',
+    r'^mal-\d+$',  # Document IDs like "mal-0440500"
+    r'^Abraham Lincoln Papers at the Library of Congress',
+    r'^Selected and converted\.$',
+    r'^American Memory, Library of Congress\.$',
+    r'^Washington, DC, \d+\.$',
+    r'^Preceding element provides',
+    r'^For more information about',
+    r'^Manuscript Division',
+    r'^Copyright status',
+    r'^The National Digital Library Program',
+    r'^This transcription is intended',
+    r'^\d{4}/\d{2}/\d{2}$',  # Dates like "1999/05/20"
+    r'^\d{4}$',  # Just year numbers
+    r'^0001$',  # Page numbers
+]
+
+# Control characters orjson rejects but json.loads(strict=False) tolerates (tab/newline/CR kept)
+_CTRL_TABLE = {i: None for i in range(32) if i not in (9, 10, 13)}
+_CTRL_BYTES = bytes(_CTRL_TABLE)
+
+# Where LoC JSON API responses keep transcriptions: one fulltext per page,
+# then the single-field alternatives (resource, resources[], item.resources[])
+_FULLTEXT_PATHS = (
+    ('resource', 'fulltext'),
+    ('resources', '*', 'fulltext'),
+    ('item', 'resources', '*', 'fulltext'),
+)
+
+
+def _partition_skip_patterns(patterns: List[str]):
+    """
+    Split the anchored skip patterns by how cheaply they can be tested.
+    
+    Returns:
+        (casefolded whole lines, casefolded line prefixes, compiled regex for
+        the remaining patterns or None)
+    """
+    exact, prefixes, regexes = set(), [], []
+    for pattern in patterns:
+        body = pattern[1:]  # Every pattern is anchored with ^
+        whole_line = body.endswith('$')
+        if whole_line:
+            body = body[:-1]
+        # Literal if nothing but escaped characters is special
+        if any(c in '.^$*+?{}[]\\|()' for c in re.sub(r'\\\W', '', body)):
+            regexes.append(pattern)
+            continue
+        literal = re.sub(r'\\(\W)', r'\1', body).casefold()
+        if whole_line:
+            exact.add(literal)
+        else:
+            prefixes.append(literal)
+    combined = re.compile('|'.join(f'(?:{p})' for p in regexes), re.IGNORECASE) if regexes else None
+    return frozenset(exact), tuple(prefixes), combined
+
+
+# Literal skip patterns become a set lookup / prefix test; only the few real
+# regexes (IDs, dates) go through the regex engine, as one alternation
+_SKIP_LINES, _SKIP_PREFIXES, _RE_SKIP_LINE = _partition_skip_patterns(_SKIP_PATTERNS)
 
 
 def extract_id_from_filename(filename: str) -> Optional[str]:
@@ -35,6 +160,16 @@ def extract_id_from_filename(filename: str) -> Optional[str]:
     return base if base else None
 
 
+# Known URL mappings
+_KNOWN_URLS = {
+    'mal0440500': 'https://www.loc.gov/item/mal0440500/',
+    'mal.0882800': 'https://www.loc.gov/resource/mal.0882800/',
+    'mal.4361300': 'https://www.loc.gov/resource/mal.4361300/',
+    'mal.4361800': 'https://www.loc.gov/resource/mal.4361800/',
+    'trans-nicolay-copy': 'https://www.loc.gov/exhibits/gettysburg-address/ext/trans-nicolay-copy.html',
+}
+
+
 def get_url_from_id(doc_id: str) -> str:
     """
     Reconstruct LoC URL from document ID.
@@ -44,17 +179,9 @@ def get_url_from_id(doc_id: str) -> str:
         mal.0882800 -> https://www.loc.gov/resource/mal.0882800/
         trans-nicolay-copy -> https://www.loc.gov/exhibits/gettysburg-address/ext/trans-nicolay-copy.html
     """
-    # Known URL mappings
-    url_mapping = {
-        'mal0440500': 'https://www.loc.gov/item/mal0440500/',
-        'mal.0882800': 'https://www.loc.gov/resource/mal.0882800/',
-        'mal.4361300': 'https://www.loc.gov/resource/mal.4361300/',
-        'mal.4361800': 'https://www.loc.gov/resource/mal.4361800/',
-        'trans-nicolay-copy': 'https://www.loc.gov/exhibits/gettysburg-address/ext/trans-nicolay-copy.html',
-    }
-    
-    if doc_id in url_mapping:
-        return url_mapping[doc_id]
+    url = _KNOWN_URLS.get(doc_id)
+    if url is not None:
+        return url
     
     # Try to infer URL pattern
     if doc_id.startswith('mal'):
@@ -72,12 +199,20 @@ def fetch_metadata_from_api(url: str) -> Dict:
     """
     Fetch metadata from LoC JSON API.
     
+    Responses are cached on disk (see create_session) and in memory per URL.
+    
     Returns:
         Dictionary with title, date, place, from, to, document_type
     """
+    with _metadata_lock:
+        cached = _metadata_cache.get(url)
+    if cached is not None:
+        # Callers adjust the returned dict, so hand out a copy
+        return dict(cached)
+    
     try:
         api_url = url.rstrip('/') + '/?fo=json'
-        response = requests.get(api_url, timeout=10)
+        response = _get_session().get(api_url, timeout=10)
         if response.status_code == 200:
             data = response.json()
             item = data.get('item', {})
@@ -98,7 +233,7 @@ def fetch_metadata_from_api(url: str) -> Dict:
             elif 'note' in title_lower:
                 document_type = 'Note'
             
-            return {
+            metadata = {
                 'title': title,
                 'date': date,
                 'place': place,
@@ -106,8 +241,11 @@ def fetch_metadata_from_api(url: str) -> Dict:
                 'to': to_field,
                 'document_type': document_type
             }
+            with _metadata_lock:
+                _metadata_cache[url] = metadata
+            return dict(metadata)
     except Exception as e:
-        print(f"    Warning: Could not fetch metadata from API: {e}")
+        logger.warning("    Could not fetch metadata from API for %s: %s", url, e)
     
     return {
         'title': 'Untitled Document',
@@ -119,137 +257,188 @@ def fetch_metadata_from_api(url: str) -> Dict:
     }
 
 
+def _is_skip_line(line: str) -> bool:
+    """Whether a stripped line matches one of the skip patterns."""
+    folded = line.casefold()
+    if folded in _SKIP_LINES or folded.startswith(_SKIP_PREFIXES):
+        return True
+    return bool(_RE_SKIP_LINE and _RE_SKIP_LINE.match(line))
+
+
 def clean_html_and_metadata(content: str) -> str:
     """
     Remove HTML tags, navigation elements, and metadata from content.
     """
-    # Remove HTML tags using BeautifulSoup
-    soup = BeautifulSoup(content, 'html.parser')
-    text = soup.get_text(separator='\n', strip=True)
-    
-    # Remove common navigation/metadata patterns
-    lines = text.split('\n')
-    cleaned_lines = []
-    
-    skip_patterns = [
-        r'^Library of Congress$',
-        r'^Exhibitions$',
-        r'^Ask a Librarian$',
-        r'^Digital Collections$',
-        r'^Library Catalogs$',
-        r'^The Library of Congress$',
-        r'^> Online Exhibition$',
-        r'^Back to Exhibition$',
-        r'^Connect with the Library$',
-        r'^All ways to connect$',
-        r'^Subscribe & Comment$',
-        r'^RSS & E-Mail$',
-        r'^Download & Play$',
-        r'^\(external link\)$',
-        r'^Inspector General$',
-        r'^Accessibility$',
-        r'^External Link Disclaimer$',
-        r'^Speech Enabled$',
-        r'^mal-\d+$',  # Document IDs like "mal-0440500"
-        r'^Abraham Lincoln Papers at the Library of Congress',
-        r'^Selected and converted\.$',
-        r'^American Memory, Library of Congress\.$',
-        r'^Washington, DC, \d+\.$',
-        r'^Preceding element provides',
-        r'^For more information about',
-        r'^Manuscript Division',
-        r'^Copyright status',
-        r'^The National Digital Library Program',
-        r'^This transcription is intended',
-        r'^\d{4}/\d{2}/\d{2}$',  # Dates like "1999/05/20"
-        r'^\d{4}$',  # Just year numbers
-        r'^0001$',  # Page numbers
-    ]
-    
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-        
-        # Skip lines matching skip patterns
-        should_skip = False
-        for pattern in skip_patterns:
-            if re.match(pattern, line, re.IGNORECASE):
-                should_skip = True
-                break
-        
-        if not should_skip:
-            cleaned_lines.append(line)
+    if SELECTOLAX_AVAILABLE:
+        # Text straight from the parser, without building BeautifulSoup tag objects;
+        # script/style bodies are dropped as BeautifulSoup's get_text does
+        tree = HTMLParser(content)
+        tree.strip_tags(['script', 'style'])
+        root = tree.root
+        text = root.text(separator='\n', strip=True) if root is not None else ''
+    else:
+        # Remove HTML tags using BeautifulSoup (lxml parser, html.parser if lxml rejects the input)
+        try:
+            soup = BeautifulSoup(content, 'lxml')
+        except Exception:
+            soup = BeautifulSoup(content, 'html.parser')
+        text = soup.get_text(separator='\n', strip=True)
     
-    return '\n'.join(cleaned_lines)
+    # Remove blank lines and common navigation/metadata patterns in one pass
+    stripped = (line.strip() for line in text.splitlines())
+    return '\n'.join(line for line in stripped if line and not _is_skip_line(line))
+
+
+def _walk(data, path):
+    """Yield the non-blank strings at a key path into parsed JSON ('*' = every list element)."""
+    if not path:
+        if isinstance(data, str) and data.strip():
+            yield data
+        return
+    key, rest = path[0], path[1:]
+    if key == '*':
+        if isinstance(data, list):
+            for element in data:
+                yield from _walk(element, rest)
+    elif isinstance(data, dict):
+        yield from _walk(data.get(key), rest)
+
 
+def _page_fulltexts(data: dict) -> List[str]:
+    """Return the stripped, non-blank 'fulltext' strings of data['page'] (the usual LoC shape)."""
+    pages = data.get('page')
+    if not isinstance(pages, list):
+        return []
+    parts = []
+    for page in pages:
+        fulltext = page.get('fulltext') if isinstance(page, dict) else None
+        if isinstance(fulltext, str):
+            fulltext = fulltext.strip()
+            if fulltext:
+                parts.append(fulltext)
+    return parts
 
-def extract_text_from_json(content: str) -> str:
+
+def extract_text_from_json(content):
     """
     Extract actual text content from JSON metadata.
     
     If content is JSON, tries to extract 'fulltext' from 'page' array.
     Otherwise returns the content as-is.
+    
+    Args:
+        content: File content as str, or as raw bytes (UTF-8) so that JSON
+            dumps go straight to the parser without being decoded first
     """
+    is_bytes = isinstance(content, bytes)
+    # Only a JSON object can hold fulltext - plain transcriptions skip the parse
+    if not content.lstrip().startswith(b'{' if is_bytes else '{'):
+        return content
+    
     # Try to parse as JSON
-    try:
-        # Handle potential control character issues
-        data = json.loads(content, strict=False)
+    data = None
+    if ORJSON_AVAILABLE:
+        try:
+            if is_bytes:
+                data = orjson.loads(content.translate(None, _CTRL_BYTES))
+            else:
+                data = orjson.loads(content.translate(_CTRL_TABLE))
+        except orjson.JSONDecodeError:
+            pass  # e.g. raw newlines inside strings - let json.loads decide
+    if data is None:
+        try:
+            # Handle potential control character issues (and undecodable bytes)
+            text = content.decode('utf-8', errors='ignore') if is_bytes else content
+            data = json.loads(text, strict=False)
+        except (json.JSONDecodeError, ValueError):
+            # Not JSON or invalid JSON, return as-is
+            return content
+    
+    # Check if it's a LoC JSON API response
+    if isinstance(data, dict):
+        # Fulltext from the page array (most common location) - join all parts
+        # (in case there are multiple pages), and only use substantial text
+        extracted = '\n\n'.join(_page_fulltexts(data))
+        if len(extracted) > 100:
+            return extracted
         
-        # Check if it's a LoC JSON API response
-        if isinstance(data, dict):
-            # Try to get fulltext from page array (most common location)
-            page = data.get('page', [])
-            if isinstance(page, list) and len(page) > 0:
-                # Look for fulltext in page items - usually the last item with 'fulltext' key
-                fulltext_parts = []
-                for page_item in page:
-                    if isinstance(page_item, dict):
-                        fulltext = page_item.get('fulltext')
-                        if fulltext and isinstance(fulltext, str) and len(fulltext.strip()) > 0:
-                            fulltext_parts.append(fulltext.strip())
-                
-                if fulltext_parts:
-                    # Join all fulltext parts (in case there are multiple pages)
-                    extracted = '\n\n'.join(fulltext_parts)
-                    if len(extracted) > 100:  # Only use if we got substantial text
-                        return extracted
-            
-            # Also check resource.fulltext (alternative location)
-            resource = data.get('resource', {})
-            if isinstance(resource, dict):
-                fulltext = resource.get('fulltext')
-                if fulltext and isinstance(fulltext, str) and len(fulltext.strip()) > 100:
+        # Alternative locations hold the whole text in one field
+        for path in _FULLTEXT_PATHS:
+            for fulltext in _walk(data, path):
+                if len(fulltext.strip()) > 100:
                     return fulltext.strip()
-            
-            # Check resources array
-            resources = data.get('resources', [])
-            if isinstance(resources, list) and len(resources) > 0:
-                for res in resources:
-                    if isinstance(res, dict):
-                        fulltext = res.get('fulltext')
-                        if fulltext and isinstance(fulltext, str) and len(fulltext.strip()) > 100:
-                            return fulltext.strip()
-            
-            # Check item.resources
-            item = data.get('item', {})
-            if isinstance(item, dict):
-                resources = item.get('resources', [])
-                if isinstance(resources, list) and len(resources) > 0:
-                    for res in resources:
-                        if isinstance(res, dict):
-                            fulltext = res.get('fulltext')
-                            if fulltext and isinstance(fulltext, str) and len(fulltext.strip()) > 100:
-                                return fulltext.strip()
-        
-    except (json.JSONDecodeError, ValueError) as e:
-        # Not JSON or invalid JSON, return as-is
-        pass
     
     # Return original content if not JSON or no fulltext found
     return content
 
 
+def _process_file(file_path: Path) -> Optional[Dict]:
+    """
+    Read, clean and look up the metadata of one raw LoC file.
+    
+    Args:
+        file_path: Path to a loc_*.txt file
+        
+    Returns:
+        Document dictionary for DataNormalizer, or None if the file was skipped
+    """
+    filename = file_path.name
+    logger.info("Processing: %s", filename)
+    
+    # Extract ID and get URL
+    doc_id = extract_id_from_filename(filename)
+    if not doc_id:
+        logger.warning("  %s: Could not extract ID from filename, skipping", filename)
+        return None
+    
+    url = get_url_from_id(doc_id)
+    logger.info("  %s: URL: %s", filename, url)
+    
+    # Read file content (as bytes - JSON dumps are parsed without decoding the whole file)
+    try:
+        raw_content = file_path.read_bytes()
+        logger.info("  %s: Raw content length: %s bytes", filename, f"{len(raw_content):,}")
+        
+        # Extract text from JSON if needed
+        content = extract_text_from_json(raw_content)
+        if isinstance(content, bytes):
+            content = content.decode('utf-8', errors='ignore')
+        
+        # Clean HTML and metadata
+        content = clean_html_and_metadata(content)
+        logger.info("  %s: Extracted content length: %s characters", filename, f"{len(content):,}")
+        
+        if len(content) < len(raw_content) * 0.1:
+            logger.warning("  %s: Extracted content is much shorter than raw content", filename)
+    except Exception as e:
+        logger.warning("  %s: Error reading file: %s", filename, e)
+        return None
+    
+    # Fetch metadata from API
+    logger.info("  %s: Fetching metadata...", filename)
+    metadata = fetch_metadata_from_api(url)
+    
+    # Special handling for Gettysburg Address
+    if 'trans-nicolay-copy' in doc_id or 'gettysburg' in url.lower():
+        metadata['title'] = 'Gettysburg Address - "Nicolay Copy"'
+        metadata['document_type'] = 'Speech'
+    
+    logger.info("  %s: [OK] Processed", filename)
+    
+    # Create document dictionary
+    return {
+        'title': metadata['title'],
+        'content': content,
+        'url': url,
+        'date': metadata['date'],
+        'place': metadata['place'],
+        'from': metadata['from'],
+        'to': metadata['to'],
+        'document_type': metadata['document_type'],
+        'file_format': 'text'
+    }
+
+
 def normalize_loc_files():
     """
     Read LoC files from data/raw/loc/ and normalize them.
@@ -274,63 +463,10 @@ def normalize_loc_files():
     
     print(f"\nFound {len(loc_files)} LoC document(s)\n")
     
-    # Process each file
-    documents = []
-    for file_path in sorted(loc_files):
-        filename = file_path.name
-        print(f"Processing: {filename}")
-        
-        # Extract ID and get URL
-        doc_id = extract_id_from_filename(filename)
-        if not doc_id:
-            print(f"  Warning: Could not extract ID from filename, skipping")
-            continue
-        
-        url = get_url_from_id(doc_id)
-        print(f"  URL: {url}")
-        
-        # Read file content
-        try:
-            raw_content = file_path.read_text(encoding='utf-8', errors='ignore')
-            print(f"  Raw content length: {len(raw_content):,} characters")
-            
-            # Extract text from JSON if needed
-            content = extract_text_from_json(raw_content)
-            
-            # Clean HTML and metadata
-            content = clean_html_and_metadata(content)
-            print(f"  Extracted content length: {len(content):,} characters")
-            
-            if len(content) < len(raw_content) * 0.1:
-                print(f"  Warning: Extracted content is much shorter than raw content")
-        except Exception as e:
-            print(f"  Error reading file: {e}")
-            continue
-        
-        # Fetch metadata from API
-        print(f"  Fetching metadata...")
-        metadata = fetch_metadata_from_api(url)
-        
-        # Special handling for Gettysburg Address
-        if 'trans-nicolay-copy' in doc_id or 'gettysburg' in url.lower():
-            metadata['title'] = 'Gettysburg Address - "Nicolay Copy"'
-            metadata['document_type'] = 'Speech'
-        
-        # Create document dictionary
-        doc_data = {
-            'title': metadata['title'],
-            'content': content,
-            'url': url,
-            'date': metadata['date'],
-            'place': metadata['place'],
-            'from': metadata['from'],
-            'to': metadata['to'],
-            'document_type': metadata['document_type'],
-            'file_format': 'text'
-        }
-        
-        documents.append(doc_data)
-        print(f"  [OK] Processed\n")
+    # Process the files concurrently (mostly waiting on the LoC API), keeping their order
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        documents = [doc for doc in executor.map(_process_file, sorted(loc_files)) if doc]
+    print(f"Processed {len(documents)} of {len(loc_files)} file(s)\n")
     
     # Normalize using DataNormalizer
     print(f"{'='*70}")
@@ -350,5 +486,6 @@ def normalize_loc_files():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     normalize_loc_files()
 
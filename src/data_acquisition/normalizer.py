@@ -17,11 +17,20 @@ Required Schema:
 }
 """
 
+import gzip
 import json
 from pathlib import Path
 from typing import List, Dict, Optional
 from datetime import datetime
 
+# Try to import orjson for fast dataset serialization, fall back to the json module
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    print("Warning: orjson not installed. Install with: pip install orjson")
+
 
 class DataNormalizer:
     """
@@ -49,6 +58,27 @@ class DataNormalizer:
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
     
+    def _read_book_text(self, book_data: Dict) -> str:
+        """
+        Get a book's text, reading it from the scraper's text_path if needed.
+        
+        Args:
+            book_data: Raw book data from scraper
+            
+        Returns:
+            Book text (empty string if unavailable)
+        """
+        if 'text_content' in book_data:
+            return book_data['text_content']
+        
+        text_path = book_data.get('text_path')
+        if not text_path:
+            return ''
+        if text_path.endswith('.gz'):
+            with gzip.open(text_path, 'rt', encoding='utf-8', errors='replace') as f:
+                return f.read()
+        return Path(text_path).read_text(encoding='utf-8', errors='replace')
+    
     def normalize_gutenberg_book(self, book_data: Dict, index: int) -> Dict:
         """
         Normalize a Project Gutenberg book into the required schema.
@@ -71,7 +101,7 @@ class DataNormalizer:
             "place": None,
             "from": None,
             "to": None,
-            "content": book_data.get('text_content', '')
+            "content": self._read_book_text(book_data)
         }
     
     def normalize_loc_document(self, doc_data: Dict, index: int) -> Dict:
@@ -149,12 +179,17 @@ class DataNormalizer:
         """
         output_path = self.output_dir / filename
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(dataset, f, indent=2, ensure_ascii=False)
+        if ORJSON_AVAILABLE:
+            # Same layout as json.dump(indent=2, ensure_ascii=False), encoded in one call
+            output_path.write_bytes(orjson.dumps(dataset, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(dataset, f, indent=2, ensure_ascii=False)
         
+        total_chars = sum(len(entry['content']) for entry in dataset if entry.get('content'))
         print(f"\nSaved normalized dataset: {output_path}")
         print(f"  Total entries: {len(dataset)}")
-        print(f"  Total characters: {sum(len(entry.get('content', '')) for entry in dataset):,}")
+        print(f"  Total characters: {total_chars:,}")
 
 
 if __name__ == "__main__":
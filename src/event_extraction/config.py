@@ -5,7 +5,7 @@ Defines the 5 key events we need to extract information about.
 """
 
 # The 5 key events from the assessment
-KEY_EVENTS = [
+KEY_EVENTS = (
     {
         "id": "election_night_1860",
         "name": "Election Night 1860",
@@ -30,8 +30,34 @@ KEY_EVENTS = [
         "id": "fords_theatre",
         "name": "Ford's Theatre Assassination",
         "keywords": ["Ford's Theatre", "assassination", "April 14 1865", "John Wilkes Booth", "shot", "theater", "theatre", "Booth", "killed", "murdered"]
-    }
-]
+    },
+)
+
+
+def _keyword_terms(keywords_lower: tuple) -> frozenset:
+    """
+    Expand lowercased keywords into the terms chunks are searched for.
+    
+    Each keyword contributes itself and its individual words; terms of 3
+    characters or fewer are dropped as too noisy.
+    
+    Args:
+        keywords_lower: Lowercased event keywords
+        
+    Returns:
+        Frozen set of search terms
+    """
+    terms = set()
+    for kw in keywords_lower:
+        terms.update(kw.split())
+        terms.add(kw)
+    return frozenset(term for term in terms if len(term) > 3)
+
+
+# Keywords never change at runtime, so lowercase and expand them once here
+# instead of on every DocumentChunker.find_relevant_chunks call
+for _event in KEY_EVENTS:
+    _event['_tokens'] = _keyword_terms(tuple(kw.lower() for kw in _event['keywords']))
 
 # Expected output schema for event extraction
 EXTRACTION_SCHEMA = {
@@ -8,10 +8,27 @@ Books are too long for single LLM calls, so we need to:
 3. Process only relevant chunks to save tokens and improve quality
 """
 
-from typing import List, Dict
+from itertools import islice
+from typing import Iterator, List, Dict
 import re
 from pathlib import Path
 
+# Blank line(s) between paragraphs (\s also covers the \r of CRLF files and tab-only lines)
+_RE_PARAGRAPH_BREAK = re.compile(r'\n\s*\n')
+
+# Compiled keyword alternations, keyed by search-term set. Module-level so they
+# outlive the short-lived chunkers the extractor creates per document.
+_KEYWORD_MATCHERS = {}
+
+
+def _iter_paragraphs(text: str) -> Iterator[str]:
+    """Yield the paragraphs of text one at a time (same pieces as _RE_PARAGRAPH_BREAK.split)."""
+    start = 0
+    for match in _RE_PARAGRAPH_BREAK.finditer(text):
+        yield text[start:match.start()]
+        start = match.end()
+    yield text[start:]
+
 
 class DocumentChunker:
     """
@@ -55,10 +72,14 @@ class DocumentChunker:
             }]
         
         chunks = []
-        # Split by paragraphs first (preserve context)
-        paragraphs = re.split(r'\n\s*\n', text)
+        # Split by paragraphs first (preserve context), walking them lazily so a
+        # whole book is never held a second time as a list of paragraphs
+        paragraphs = _iter_paragraphs(text)
         
-        current_chunk = ""
+        # The current chunk is kept as a list of pieces (joined once per chunk)
+        # plus its running length, so growing it never copies the text so far
+        current_parts = []
+        current_len = 0
         chunk_start = 0
         chunk_index = 0
         
@@ -68,24 +89,31 @@ class DocumentChunker:
                 continue
             
             # If adding this paragraph would exceed chunk size, save current chunk
-            if len(current_chunk) + len(para) > self.chunk_size and current_chunk:
+            if current_len + len(para) > self.chunk_size and current_parts:
+                current_chunk = "".join(current_parts)
                 chunks.append({
                     'chunk_id': f"{document_id}_chunk_{chunk_index}",
                     'text': current_chunk.strip(),
                     'start_char': chunk_start,
-                    'end_char': chunk_start + len(current_chunk),
+                    'end_char': chunk_start + current_len,
                     'chunk_index': chunk_index
                 })
                 
-                # Start new chunk with overlap
-                overlap_text = current_chunk[-self.overlap:] if len(current_chunk) > self.overlap else current_chunk
-                current_chunk = overlap_text + "\n\n" + para
-                chunk_start = chunk_start + len(current_chunk) - len(overlap_text) - len(para) - 2
+                # Start new chunk with overlap (it begins where the overlap did)
+                overlap_text = current_chunk[-self.overlap:] if current_len > self.overlap else current_chunk
+                chunk_start += current_len - len(overlap_text)
+                current_parts = [overlap_text, "\n\n", para]
+                current_len = len(overlap_text) + 2 + len(para)
                 chunk_index += 1
             else:
-                current_chunk += "\n\n" + para if current_chunk else para
+                if current_parts:
+                    current_parts.append("\n\n")
+                    current_len += 2
+                current_parts.append(para)
+                current_len += len(para)
         
         # Add final chunk
+        current_chunk = "".join(current_parts)
         if current_chunk.strip():
             chunks.append({
                 'chunk_id': f"{document_id}_chunk_{chunk_index}",
@@ -97,41 +125,58 @@ class DocumentChunker:
         
         return chunks
     
-    def find_relevant_chunks(self, chunks: List[Dict], event_keywords: List[str]) -> List[Dict]:
+    def find_relevant_chunks(self, chunks: List[Dict], event_keywords, min_matches: int = 1) -> List[Dict]:
         """
         Filter chunks that likely contain information about an event.
         
         Args:
             chunks: List of chunk dictionaries
-            event_keywords: Keywords to search for
+            event_keywords: Keywords to search for, or an already expanded
+                frozenset of search terms (see config.KEY_EVENTS '_tokens')
+            min_matches: Keyword occurrences a chunk needs to be kept (1 = any mention)
             
         Returns:
             Filtered list of chunks containing keywords
         """
         relevant = []
-        keywords_lower = [kw.lower() for kw in event_keywords]
-        
-        # Also create partial keyword matches (e.g., "election" matches "election night")
-        partial_keywords = []
-        for kw in keywords_lower:
-            # Split compound keywords and add individual words
-            words = kw.split()
-            partial_keywords.extend(words)
-            # Add the full keyword
-            partial_keywords.append(kw)
-        
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_keywords = []
-        for kw in partial_keywords:
-            if kw not in seen and len(kw) > 3:  # Only words longer than 3 chars
-                seen.add(kw)
-                unique_keywords.append(kw)
+        
+        if isinstance(event_keywords, frozenset):
+            key = event_keywords
+        else:
+            keywords_lower = [kw.lower() for kw in event_keywords]
+            
+            # Also create partial keyword matches (e.g., "election" matches "election night")
+            partial_keywords = []
+            for kw in keywords_lower:
+                # Split compound keywords and add individual words
+                words = kw.split()
+                partial_keywords.extend(words)
+                # Add the full keyword
+                partial_keywords.append(kw)
+            
+            # Only words longer than 3 chars
+            key = frozenset(kw for kw in partial_keywords if len(kw) > 3)
+        
+        if not key:
+            return relevant
+        
+        # One case-insensitive alternation finds any keyword in a single pass per chunk
+        matcher = _KEYWORD_MATCHERS.get(key)
+        if matcher is None:
+            matcher = re.compile('|'.join(re.escape(kw) for kw in sorted(key)), re.IGNORECASE)
+            _KEYWORD_MATCHERS[key] = matcher
+        
+        if min_matches <= 1:
+            for chunk in chunks:
+                # Check if any keyword appears in this chunk (more lenient matching)
+                if matcher.search(chunk['text']):
+                    relevant.append(chunk)
+            return relevant
         
         for chunk in chunks:
-            text_lower = chunk['text'].lower()
-            # Check if any keyword appears in this chunk (more lenient matching)
-            if any(keyword in text_lower for keyword in unique_keywords):
+            # Count occurrences, stopping as soon as the chunk has enough
+            hits = islice(matcher.finditer(chunk['text']), min_matches)
+            if sum(1 for _ in hits) >= min_matches:
                 relevant.append(chunk)
         
         return relevant
@@ -147,11 +192,17 @@ class DocumentChunker:
         Returns:
             Combined text
         """
-        combined = ""
+        separator = "\n\n---\n\n"
+        parts = []
+        combined_len = 0
         for chunk in chunks:
-            if len(combined) + len(chunk['text']) > max_length:
+            if combined_len + len(chunk['text']) > max_length:
                 break
-            combined += "\n\n---\n\n" + chunk['text'] if combined else chunk['text']
+            if parts:
+                parts.append(separator)
+                combined_len += len(separator)
+            parts.append(chunk['text'])
+            combined_len += len(chunk['text'])
         
-        return combined
+        return "".join(parts)
 
@@ -5,16 +5,22 @@ Uses LLMs to extract event information from document chunks.
 Uses instructor library with Pydantic models for type-safe structured outputs.
 """
 
+import asyncio
+import hashlib
+import json
 import os
+import re
 import time
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Set, Tuple
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dotenv import load_dotenv
 
 # Try to import OpenAI and instructor, but handle gracefully if not available
 try:
-    from openai import OpenAI
+    import httpx
+    from openai import OpenAI, AsyncOpenAI
     OPENAI_AVAILABLE = True
 except ImportError:
     OPENAI_AVAILABLE = False
@@ -36,12 +42,184 @@ load_dotenv(dotenv_path=env_path)
 # Import our Pydantic models
 # Handle import path - try relative first, then absolute
 try:
-    from .models import EventExtraction
+    from .models import EventExtraction, BatchedEventExtraction
+    from .response_cache import ResponseCache, make_cache_key
 except ImportError:
     # Fallback for when running as script
     import sys
     sys.path.insert(0, str(project_root))
-    from src.event_extraction.models import EventExtraction
+    from src.event_extraction.models import EventExtraction, BatchedEventExtraction
+    from src.event_extraction.response_cache import ResponseCache, make_cache_key
+
+SYSTEM_PROMPT = "You are an expert historian extracting structured information from historical texts."
+
+# Lower temperature for more consistent extraction (also part of the response cache key)
+TEMPERATURE = 0.3
+
+# Connection pool limits shared by all requests of one extractor (keep-alive
+# connections are reused instead of paying a TLS handshake per request)
+MAX_CONNECTIONS = 64
+MAX_KEEPALIVE_CONNECTIONS = 32
+HTTP_TIMEOUT = 60.0
+
+# OpenAI Batch API: requests and bytes per input file (the API caps files at
+# 200 MB; kept below that for headroom), and how often to check on a batch
+BATCH_MAX_REQUESTS = 50_000
+BATCH_MAX_BYTES = 190 * 1024 * 1024
+BATCH_POLL_INTERVAL = 60.0
+BATCH_DONE_STATUSES = ('completed', 'failed', 'expired', 'cancelled')
+
+# Tokens reserved per chunk for the structured response
+COMPLETION_TOKEN_ESTIMATE = 500
+
+# Keyword occurrences a chunk needs to be sent to the LLM, on every extraction
+# path; chunks with a single passing mention rarely yield claims
+MIN_KEYWORD_MATCHES = 2
+
+# Appended to the extraction prompt when several chunks share one request
+BATCH_INSTRUCTIONS = """
+
+BATCHED INPUT:
+The text above consists of {num_chunks} separate chunks, each starting with a
+"=== CHUNK i ===" marker. Analyze every chunk independently and return a
+"results" list with exactly {num_chunks} objects in the format above, one per
+chunk and in chunk order (use empty claims for chunks that do not mention the event).
+"""
+
+_RE_RETRY_AFTER = re.compile(r'try again in ([\d.]+)([sm]?)')
+# Substrings (of the lowercased error message) that mark a rate-limit error
+_RATE_LIMIT_HINTS = ('rate_limit', '429', 'rate limit')
+
+
+@lru_cache(maxsize=None)
+def _batch_response_format(response_model) -> Dict:
+    """JSON-schema response_format for Batch API requests (generated once per model class)."""
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": response_model.__name__,
+            "schema": response_model.model_json_schema()
+        }
+    }
+
+
+def _split_batch_lines(request_lines: List[Dict]):
+    """
+    Serialize Batch API requests and group them into input files.
+    
+    Args:
+        request_lines: Batch API request dictionaries
+        
+    Yields:
+        Lists of JSONL lines, each within BATCH_MAX_REQUESTS and BATCH_MAX_BYTES
+    """
+    group, group_bytes = [], 0
+    for request in request_lines:
+        line = json.dumps(request, ensure_ascii=False) + '\n'
+        line_bytes = len(line.encode('utf-8'))
+        if group and (len(group) >= BATCH_MAX_REQUESTS or group_bytes + line_bytes > BATCH_MAX_BYTES):
+            yield group
+            group, group_bytes = [], 0
+        group.append(line)
+        group_bytes += line_bytes
+    if group:
+        yield group
+
+
+def _http_limits():
+    """Connection pool limits for the OpenAI HTTP clients."""
+    return httpx.Limits(
+        max_connections=MAX_CONNECTIONS,
+        max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS
+    )
+
+
+def _rate_limit_wait(error: Exception, attempt: int, retry_delay: float) -> Optional[float]:
+    """
+    Work out how long to wait before retrying a failed LLM call.
+    
+    Args:
+        error: Exception raised by the API call
+        attempt: Zero-based attempt number
+        retry_delay: Base delay for exponential backoff
+        
+    Returns:
+        Seconds to wait, or None if the error is not a rate limit (429)
+    """
+    error_str = str(error).lower()
+    if not any(hint in error_str for hint in _RATE_LIMIT_HINTS):
+        return None
+    
+    # Use the wait time from the error message if available, otherwise exponential backoff
+    wait_match = _RE_RETRY_AFTER.search(error_str)
+    if wait_match:
+        try:
+            wait_val = float(wait_match.group(1))
+            wait_time = wait_val if wait_match.group(2) == 's' else wait_val / 1000
+            return max(wait_time, 0.5)  # Minimum 0.5 seconds
+        except ValueError:
+            pass
+    return retry_delay * (2 ** attempt)
+
+
+class RateLimiter:
+    """
+    Proactive request/token rate limiter for async LLM calls.
+    
+    Follows the openai-cookbook parallel processor: request and token
+    capacities refill continuously at the per-minute limits, and a call is
+    only dispatched once both cover it, so requests are paced instead of
+    bouncing off 429s. No lock is needed - the check and the deduction run
+    without an await in between, so they are atomic on the event loop.
+    """
+    
+    def __init__(self, max_requests_per_minute: float, max_tokens_per_minute: float):
+        """
+        Initialize the limiter with full capacity.
+        
+        Args:
+            max_requests_per_minute: Request limit of the account/model
+            max_tokens_per_minute: Token limit of the account/model
+        """
+        self.max_requests_per_minute = max_requests_per_minute
+        self.max_tokens_per_minute = max_tokens_per_minute
+        self.available_requests = max_requests_per_minute
+        self.available_tokens = max_tokens_per_minute
+        self.last_update_time = time.monotonic()
+    
+    def _refill(self):
+        """Add the capacity accrued since the last update (capped at one minute's worth)."""
+        now = time.monotonic()
+        elapsed = now - self.last_update_time
+        self.last_update_time = now
+        self.available_requests = min(
+            self.available_requests + elapsed * self.max_requests_per_minute / 60.0,
+            self.max_requests_per_minute
+        )
+        self.available_tokens = min(
+            self.available_tokens + elapsed * self.max_tokens_per_minute / 60.0,
+            self.max_tokens_per_minute
+        )
+    
+    async def acquire(self, token_estimate: int):
+        """
+        Wait until one request and token_estimate tokens are available, then take them.
+        
+        Args:
+            token_estimate: Estimated prompt + completion tokens of the call
+        """
+        # A single call larger than the whole budget would otherwise wait forever
+        token_estimate = min(token_estimate, self.max_tokens_per_minute)
+        while True:
+            self._refill()
+            if self.available_requests >= 1 and self.available_tokens >= token_estimate:
+                self.available_requests -= 1
+                self.available_tokens -= token_estimate
+                return
+            # Sleep until the scarcer of the two capacities has refilled enough
+            request_wait = (1 - self.available_requests) * 60.0 / self.max_requests_per_minute
+            token_wait = (token_estimate - self.available_tokens) * 60.0 / self.max_tokens_per_minute
+            await asyncio.sleep(max(request_wait, token_wait, 0.001))
 
 
 class LLMEventExtractor:
@@ -55,20 +233,43 @@ class LLMEventExtractor:
     4. Handles errors and retries
     """
     
-    def __init__(self, model: str = "gpt-4o-mini", api_key: Optional[str] = None):
+    def __init__(self,
+                 model: str = "gpt-4o-mini",
+                 api_key: Optional[str] = None,
+                 max_requests_per_minute: float = 500,
+                 max_tokens_per_minute: float = 200_000,
+                 use_cache: bool = True):
         """
         Initialize the LLM extractor with instructor support.
         
         Args:
             model: Model name (e.g., "gpt-4o-mini", "gpt-4", "claude-3-sonnet")
             api_key: OpenAI API key (if None, reads from OPENAI_API_KEY env var)
+            max_requests_per_minute: Request rate limit for async extraction (RPM)
+            max_tokens_per_minute: Token rate limit for async extraction (TPM)
+            use_cache: Reuse stored responses for repeated requests (data/cache/llm_responses.sqlite)
         """
         self.model = model
+        self.rate_limiter = RateLimiter(max_requests_per_minute, max_tokens_per_minute)
+        self.response_cache = ResponseCache() if use_cache else None
+        # Read the prompt template once instead of reopening the file for every chunk
+        self._template = self._load_prompt_template()
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
+        # Async client for extract_from_document_async, created lazily per event loop
+        self._async_client = None
+        self._async_http = None
+        self._async_loop = None
+        # Event loop kept open by run() so the async connection pool survives between documents
+        self._loop = None
+        self._http = None
+        # Unpatched client for the Files/Batches endpoints (see extract_from_documents_batch)
+        self._base_client = None
         
         if OPENAI_AVAILABLE and INSTRUCTOR_AVAILABLE and self.api_key:
             # Create OpenAI client and patch it with instructor
-            base_client = OpenAI(api_key=self.api_key)
+            self._http = httpx.Client(limits=_http_limits(), timeout=HTTP_TIMEOUT)
+            base_client = OpenAI(api_key=self.api_key, http_client=self._http)
+            self._base_client = base_client
             self.client = instructor.patch(base_client)
         else:
             self.client = None
@@ -112,18 +313,24 @@ class LLMEventExtractor:
         max_retries = 3
         retry_delay = 1.0
         
+        # Reuse the stored response if this exact request was answered before
+        cache_key = self._cache_key(prompt, EventExtraction)
+        extraction: Optional[EventExtraction] = self._load_cached(cache_key, EventExtraction)
+        
         for attempt in range(max_retries):
             try:
-                # Use instructor to get structured, validated output
-                extraction: EventExtraction = self.client.chat.completions.create(
-                    model=self.model,
-                    messages=[
-                        {"role": "system", "content": "You are an expert historian extracting structured information from historical texts."},
-                        {"role": "user", "content": prompt}
-                    ],
-                    response_model=EventExtraction,  # Instructor validates against Pydantic model
-                    temperature=0.3,  # Lower temperature for more consistent extraction
-                )
+                if extraction is None:
+                    # Use instructor to get structured, validated output
+                    extraction = self.client.chat.completions.create(
+                        model=self.model,
+                        messages=[
+                            {"role": "system", "content": SYSTEM_PROMPT},
+                            {"role": "user", "content": prompt}
+                        ],
+                        response_model=EventExtraction,  # Instructor validates against Pydantic model
+                        temperature=TEMPERATURE,  # Lower temperature for more consistent extraction
+                    )
+                    self._store_cached(cache_key, extraction)
                 
                 # Ensure event and author are set correctly (they should be from prompt, but double-check)
                 extraction.event = event_id
@@ -138,39 +345,253 @@ class LLMEventExtractor:
                 return result
                 
             except Exception as e:
-                error_str = str(e)
                 # Check if it's a rate limit error (429)
-                if 'rate_limit' in error_str.lower() or '429' in error_str or 'rate limit' in error_str.lower():
-                    if attempt < max_retries - 1:
-                        # Extract wait time from error if available, otherwise use exponential backoff
-                        wait_time = retry_delay * (2 ** attempt)
-                        # Try to extract wait time from error message
-                        if 'try again in' in error_str.lower():
-                            try:
-                                import re
-                                wait_match = re.search(r'try again in ([\d.]+)([sm]?)', error_str.lower())
-                                if wait_match:
-                                    wait_val = float(wait_match.group(1))
-                                    unit = wait_match.group(2)
-                                    wait_time = wait_val if unit == 's' else wait_val / 1000
-                                    wait_time = max(wait_time, 0.5)  # Minimum 0.5 seconds
-                            except:
-                                pass
-                        
-                        time.sleep(wait_time)
-                        continue
-                    else:
-                        # Final attempt failed, return None
-                        return None
-                else:
+                wait_time = _rate_limit_wait(e, attempt, retry_delay)
+                if wait_time is None:
                     # Not a rate limit error, don't retry
                     if attempt == 0:  # Only print error on first attempt
                         print(f"  [ERROR] LLM extraction failed: {type(e).__name__}")
                     return None
+                if attempt < max_retries - 1:
+                    time.sleep(wait_time)
+                    continue
+                # Final attempt failed, return None
+                return None
+        
+        return None
+    
+    def _cache_key(self, prompt: str, response_model) -> Optional[str]:
+        """Return the response cache key of a request, or None when caching is off."""
+        if self.response_cache is None:
+            return None
+        return make_cache_key(self.model, SYSTEM_PROMPT, prompt, TEMPERATURE, response_model)
+    
+    def _load_cached(self, cache_key: Optional[str], response_model):
+        """Return the cached response_model instance for cache_key, or None on a miss."""
+        if cache_key is None:
+            return None
+        cached = self.response_cache.get(cache_key)
+        if cached is None:
+            return None
+        try:
+            return response_model.model_validate_json(cached)
+        except Exception:
+            # Stale entry that no longer validates - ask the API again
+            return None
+    
+    def _store_cached(self, cache_key: Optional[str], response):
+        """Store a validated response under cache_key (no-op when caching is off)."""
+        if cache_key is not None:
+            self.response_cache.set(cache_key, response.model_dump_json())
+    
+    def _get_async_client(self):
+        """
+        Return the instructor-patched AsyncOpenAI client for the running event loop.
+        
+        The client's connection pool is tied to the loop it was first used on, so a
+        new client is made whenever a fresh loop is used (use run() to keep one).
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_loop is not loop:
+            self._async_http = httpx.AsyncClient(limits=_http_limits(), timeout=HTTP_TIMEOUT)
+            self._async_client = instructor.patch(
+                AsyncOpenAI(api_key=self.api_key, http_client=self._async_http)
+            )
+            self._async_loop = loop
+        return self._async_client
+    
+    def run(self, coro):
+        """
+        Run a coroutine (e.g. extract_from_document_async) on the extractor's event loop.
+        
+        Unlike asyncio.run, the loop stays open between calls, so the async client
+        and its keep-alive connections are reused from one document to the next.
+        
+        Args:
+            coro: Coroutine to run
+            
+        Returns:
+            The coroutine's result
+        """
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(coro)
+    
+    def close(self):
+        """Close the HTTP connection pools and the event loop used by run()."""
+        if self._loop is not None and not self._loop.is_closed():
+            # After a Ctrl-C, run() leaves its tasks pending on the loop; cancel and
+            # drain them first, or running the loop again below would resume them
+            pending = asyncio.all_tasks(self._loop)
+            for task in pending:
+                task.cancel()
+            if pending:
+                self._loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            if self._async_http is not None and self._async_loop is self._loop:
+                self._loop.run_until_complete(self._async_http.aclose())
+            self._loop.close()
+        self._async_client = None
+        self._async_http = None
+        self._async_loop = None
+        if self._http is not None:
+            self._http.close()
+            self._http = None
+    
+    async def _complete_async(self, prompt: str, response_model, completion_tokens: int,
+                              cacheable=None):
+        """
+        Send one prompt through the async client, pacing and retrying like extract_event_info.
+        
+        Args:
+            prompt: User prompt
+            response_model: Pydantic model instructor validates the response against
+            completion_tokens: Tokens to reserve for the response
+            cacheable: Optional check a response must pass to be stored in (or
+                read back from) the response cache
+            
+        Returns:
+            Validated response_model instance, or None if the call fails
+        """
+        # Reuse the stored response if this exact request was answered before
+        cache_key = self._cache_key(prompt, response_model)
+        cached = self._load_cached(cache_key, response_model)
+        if cached is not None and (cacheable is None or cacheable(cached)):
+            return cached
+        
+        client = self._get_async_client()
+        
+        max_retries = 3
+        retry_delay = 1.0
+        
+        # Rough token estimate (~4 characters per token) plus room for the completion
+        token_estimate = (len(SYSTEM_PROMPT) + len(prompt)) // 4 + completion_tokens
+        
+        for attempt in range(max_retries):
+            try:
+                # Wait for request/token capacity instead of running into 429s
+                await self.rate_limiter.acquire(token_estimate)
+                response = await client.chat.completions.create(
+                    model=self.model,
+                    messages=[
+                        {"role": "system", "content": SYSTEM_PROMPT},
+                        {"role": "user", "content": prompt}
+                    ],
+                    response_model=response_model,
+                    temperature=TEMPERATURE,
+                )
+                if cacheable is None or cacheable(response):
+                    self._store_cached(cache_key, response)
+                return response
+            except Exception as e:
+                wait_time = _rate_limit_wait(e, attempt, retry_delay)
+                if wait_time is None:
+                    if attempt == 0:
+                        print(f"  [ERROR] LLM extraction failed: {type(e).__name__}")
+                    return None
+                if attempt < max_retries - 1:
+                    await asyncio.sleep(wait_time)
+                    continue
+                return None
         
         return None
     
-    def _load_prompt_template(self) -> str:
+    async def extract_event_info_async(self,
+                                       chunk_text: str,
+                                       event_id: str,
+                                       event_name: str,
+                                       document_title: str,
+                                       author: str) -> Optional[Dict]:
+        """
+        Async version of extract_event_info (same prompt, retries and result).
+        
+        Args:
+            chunk_text: Text chunk to analyze
+            event_id: Event identifier (e.g., "fort_sumter")
+            event_name: Human-readable event name
+            document_title: Title of the source document
+            author: Author of the document
+            
+        Returns:
+            Dictionary with extracted information, or None if extraction fails
+        """
+        if not self.client:
+            print(f"  [SKIP] LLM client not available. Set OPENAI_API_KEY in .env file")
+            return None
+        
+        prompt = self._build_extraction_prompt(
+            chunk_text, event_id, event_name, document_title, author
+        )
+        extraction: EventExtraction = await self._complete_async(
+            prompt, EventExtraction, COMPLETION_TOKEN_ESTIMATE
+        )
+        if extraction is None:
+            return None
+        
+        extraction.event = event_id
+        extraction.author = author
+        
+        result = extraction.model_dump()
+        result['source_document'] = document_title
+        
+        return result
+    
+    async def extract_batch_async(self,
+                                  chunks: List[Dict],
+                                  event_id: str,
+                                  event_name: str,
+                                  document_title: str,
+                                  author: str) -> List[Dict]:
+        """
+        Extract event information from several chunks with a single request.
+        
+        If the model does not return exactly one result per chunk, the results
+        cannot be matched to their chunks, so each chunk is sent again on its own.
+        
+        Args:
+            chunks: Chunk dictionaries to analyze together
+            event_id: Event identifier (e.g., "fort_sumter")
+            event_name: Human-readable event name
+            document_title: Title of the source document
+            author: Author of the document
+            
+        Returns:
+            List with one extraction dictionary per chunk, in chunk order (None for
+            chunks whose request failed)
+        """
+        if not self.client:
+            print(f"  [SKIP] LLM client not available. Set OPENAI_API_KEY in .env file")
+            return [None] * len(chunks)
+        
+        prompt = self._build_batched_prompt(chunks, event_id, event_name, document_title, author)
+        # A response with the wrong number of results is not cached, so reruns
+        # ask again instead of always falling back to one request per chunk
+        batch: BatchedEventExtraction = await self._complete_async(
+            prompt, BatchedEventExtraction, COMPLETION_TOKEN_ESTIMATE * len(chunks),
+            cacheable=lambda response: len(response.results) == len(chunks)
+        )
+        if batch is None:
+            return [None] * len(chunks)
+        
+        if len(batch.results) != len(chunks):
+            results = []
+            for chunk in chunks:
+                results.append(await self.extract_event_info_async(
+                    chunk['text'], event_id, event_name, document_title, author
+                ))
+            return results
+        
+        results = []
+        for extraction in batch.results:
+            extraction.event = event_id
+            extraction.author = author
+            result = extraction.model_dump()
+            result['source_document'] = document_title
+            results.append(result)
+        
+        return results
+    
+    @staticmethod
+    def _load_prompt_template() -> str:
         """
         Load the prompt template from the separate prompt file.
         
@@ -211,10 +632,8 @@ class LLMEventExtractor:
         Returns:
             Formatted prompt string
         """
-        template = self._load_prompt_template()
-        
         # Format the template with the provided variables
-        prompt = template.format(
+        prompt = self._template.format(
             event_id=event_id,
             event_name=event_name,
             document_title=document_title,
@@ -224,6 +643,61 @@ class LLMEventExtractor:
         
         return prompt
     
+    def _build_batched_prompt(self,
+                              chunks: List[Dict],
+                              event_id: str,
+                              event_name: str,
+                              document_title: str,
+                              author: str) -> str:
+        """
+        Build one extraction prompt covering several chunks, separated by numbered markers.
+        
+        Args:
+            chunks: Chunk dictionaries to analyze together
+            event_id: Event identifier
+            event_name: Human-readable event name
+            document_title: Document title
+            author: Author name
+            
+        Returns:
+            Formatted prompt string
+        """
+        chunk_text = '\n\n'.join(
+            f"=== CHUNK {i} ===\n{chunk['text']}" for i, chunk in enumerate(chunks, 1)
+        )
+        prompt = self._build_extraction_prompt(
+            chunk_text, event_id, event_name, document_title, author
+        )
+        return prompt + BATCH_INSTRUCTIONS.format(num_chunks=len(chunks))
+    
+    def _find_relevant_chunks(self,
+                              document_text: str,
+                              document_id: str,
+                              event_keywords,
+                              min_keyword_matches: int = MIN_KEYWORD_MATCHES) -> List[Dict]:
+        """
+        Chunk a document and keep only the chunks mentioning the event keywords.
+        
+        Args:
+            document_text: Full document text
+            document_id: Document identifier
+            event_keywords: Keywords to search for (list, or precomputed frozenset of terms)
+            min_keyword_matches: Keyword occurrences a chunk needs to be sent to the LLM
+            
+        Returns:
+            Relevant chunk dictionaries, in document order
+        """
+        import sys
+        from pathlib import Path
+        script_dir = Path(__file__).parent
+        project_root = script_dir.parent.parent
+        sys.path.insert(0, str(project_root))
+        from src.event_extraction.document_chunker import DocumentChunker
+        
+        chunker = DocumentChunker(chunk_size=2000, overlap=200)
+        chunks = chunker.chunk_document(document_text, document_id)
+        return chunker.find_relevant_chunks(chunks, event_keywords, min_matches=min_keyword_matches)
+    
     def extract_from_document(self,
                             document_text: str,
                             document_id: str,
@@ -231,7 +705,8 @@ class LLMEventExtractor:
                             author: str,
                             event_id: str,
                             event_name: str,
-                            event_keywords: List[str]) -> List[Dict]:
+                            event_keywords,
+                            min_keyword_matches: int = MIN_KEYWORD_MATCHES) -> List[Dict]:
         """
         Extract event information from an entire document.
         
@@ -248,21 +723,15 @@ class LLMEventExtractor:
             author: Author name
             event_id: Event identifier
             event_name: Event name
-            event_keywords: Keywords to search for
+            event_keywords: Keywords to search for (list, or precomputed frozenset of terms)
+            min_keyword_matches: Keyword occurrences a chunk needs to be sent to the LLM
             
         Returns:
             List of extraction results (one per relevant chunk)
         """
-        import sys
-        from pathlib import Path
-        script_dir = Path(__file__).parent
-        project_root = script_dir.parent.parent
-        sys.path.insert(0, str(project_root))
-        from src.event_extraction.document_chunker import DocumentChunker
-        
-        chunker = DocumentChunker(chunk_size=2000, overlap=200)
-        chunks = chunker.chunk_document(document_text, document_id)
-        relevant_chunks = chunker.find_relevant_chunks(chunks, event_keywords)
+        relevant_chunks = self._find_relevant_chunks(
+            document_text, document_id, event_keywords, min_keyword_matches
+        )
         
         if not relevant_chunks:
             return []
@@ -303,8 +772,9 @@ class LLMEventExtractor:
                                       author: str,
                                       event_id: str,
                                       event_name: str,
-                                      event_keywords: List[str],
-                                      max_workers: int = 3) -> List[Dict]:
+                                      event_keywords,
+                                      max_workers: int = 3,
+                                      min_keyword_matches: int = MIN_KEYWORD_MATCHES) -> List[Dict]:
         """
         Extract event information from an entire document using parallel processing.
         
@@ -317,22 +787,16 @@ class LLMEventExtractor:
             author: Author name
             event_id: Event identifier
             event_name: Event name
-            event_keywords: Keywords to search for
+            event_keywords: Keywords to search for (list, or precomputed frozenset of terms)
             max_workers: Number of concurrent workers (default: 3, balanced for speed and rate limits)
+            min_keyword_matches: Keyword occurrences a chunk needs to be sent to the LLM
             
         Returns:
             List of extraction results (one per relevant chunk)
         """
-        import sys
-        from pathlib import Path
-        script_dir = Path(__file__).parent
-        project_root = script_dir.parent.parent
-        sys.path.insert(0, str(project_root))
-        from src.event_extraction.document_chunker import DocumentChunker
-        
-        chunker = DocumentChunker(chunk_size=2000, overlap=200)
-        chunks = chunker.chunk_document(document_text, document_id)
-        relevant_chunks = chunker.find_relevant_chunks(chunks, event_keywords)
+        relevant_chunks = self._find_relevant_chunks(
+            document_text, document_id, event_keywords, min_keyword_matches
+        )
         
         if not relevant_chunks:
             return []
@@ -393,4 +857,318 @@ class LLMEventExtractor:
             print(f"        Processed {total_chunks} chunks" + " " * 20)  # Clear the progress line
         
         return results
-
+    
+    async def extract_from_document_async(self,
+                                          document_text: str,
+                                          document_id: str,
+                                          document_title: str,
+                                          author: str,
+                                          event_id: str,
+                                          event_name: str,
+                                          event_keywords,
+                                          max_concurrency: int = 8,
+                                          chunks_per_request: int = 4,
+                                          min_keyword_matches: int = MIN_KEYWORD_MATCHES,
+                                          semaphore: Optional[asyncio.Semaphore] = None,
+                                          show_progress: bool = True) -> List[Dict]:
+        """
+        Extract event information from an entire document with concurrent async requests.
+        
+        Relevant chunks are packed chunks_per_request at a time into one request
+        (see extract_batch_async) and all requests are sent at once; a semaphore
+        keeps at most max_concurrency of them in flight, the rate limiter paces
+        them to the configured RPM/TPM, and any remaining rate-limit (429)
+        responses are retried with backoff.
+        
+        Args:
+            document_text: Full document text
+            document_id: Document identifier
+            document_title: Document title
+            author: Author name
+            event_id: Event identifier
+            event_name: Event name
+            event_keywords: Keywords to search for (list, or precomputed frozenset of terms)
+            max_concurrency: Maximum number of requests in flight (size to the account's rate limits)
+            chunks_per_request: Chunks sent together in one request (1 = one request per chunk);
+                keep chunks_per_request * chunk size well inside the model's context window
+            min_keyword_matches: Keyword occurrences a chunk needs to be sent to the LLM
+            semaphore: Shared semaphore bounding requests across several documents
+                (overrides max_concurrency)
+            show_progress: Print per-chunk progress (turn off when documents run concurrently)
+            
+        Returns:
+            List of extraction results (one per relevant chunk with claims, in document order)
+            
+        Raises:
+            RuntimeError: If any chunk could not be extracted (its request failed
+                rather than finding nothing); the chunks that were answered are in
+                the response cache, so a retry only re-sends the failed ones
+        """
+        relevant_chunks = self._find_relevant_chunks(
+            document_text, document_id, event_keywords, min_keyword_matches
+        )
+        
+        if not relevant_chunks:
+            return []
+        
+        total_chunks = len(relevant_chunks)
+        chunks_per_request = max(1, chunks_per_request)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(max_concurrency)
+        completed = 0
+        
+        async def extract_batch(batch: List[Dict]) -> List[Dict]:
+            nonlocal completed
+            try:
+                async with semaphore:
+                    if len(batch) == 1:
+                        result = await self.extract_event_info_async(
+                            batch[0]['text'],
+                            event_id,
+                            event_name,
+                            document_title,
+                            author
+                        )
+                        return [result]
+                    return await self.extract_batch_async(
+                        batch, event_id, event_name, document_title, author
+                    )
+            finally:
+                completed += len(batch)
+                if show_progress:
+                    print(f"        Processing chunk {completed}/{total_chunks}...", end='\r')
+        
+        batches = [
+            relevant_chunks[start:start + chunks_per_request]
+            for start in range(0, total_chunks, chunks_per_request)
+        ]
+        outcomes = await asyncio.gather(
+            *(extract_batch(batch) for batch in batches),
+            return_exceptions=True
+        )
+        
+        if show_progress:
+            print(f"        Processed {total_chunks} chunks" + " " * 20)  # Clear the progress line
+        
+        failed = sum(
+            len(batch) if not isinstance(outcome, list) else outcome.count(None)
+            for batch, outcome in zip(batches, outcomes)
+        )
+        if failed:
+            raise RuntimeError(f"{failed} of {total_chunks} chunks could not be extracted")
+        
+        # Keep chunks that produced claims
+        return [
+            result
+            for outcome in outcomes
+            for result in outcome if result.get('claims')
+        ]
+    
+    def _batch_request_line(self, custom_id: str, prompt: str) -> Dict:
+        """
+        Build one Batch API request line for an extraction prompt.
+        
+        The Batch API runs without instructor, so the response shape is requested
+        with a JSON-schema response_format and validated when the results come back.
+        
+        Args:
+            custom_id: Identifier the result line is matched back by
+            prompt: Extraction prompt for one chunk
+            
+        Returns:
+            Request dictionary (one line of the batch input file)
+        """
+        return {
+            "custom_id": custom_id,
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {
+                "model": self.model,
+                "messages": [
+                    {"role": "system", "content": SYSTEM_PROMPT},
+                    {"role": "user", "content": prompt}
+                ],
+                "temperature": TEMPERATURE,
+                "response_format": _batch_response_format(EventExtraction)
+            }
+        }
+    
+    def _run_batch(self, lines: List[str], input_path: Path, poll_interval: float) -> Dict[str, str]:
+        """
+        Upload one batch input file, wait for the batch, and read back its output.
+        
+        The batch id is saved next to the input file until the output has been read,
+        so an interrupted run resumes waiting on the submitted batch instead of paying
+        for it again.
+        
+        Args:
+            lines: Serialized request lines (from _split_batch_lines)
+            input_path: Where to write the JSONL input file
+            poll_interval: Seconds between status checks
+            
+        Returns:
+            Dictionary of custom_id -> message content for every successful request
+            
+        Raises:
+            RuntimeError: If the batch failed (e.g. the input file was rejected)
+        """
+        # Named by content, so a rerun finds it even if earlier batches have since
+        # been answered and the remaining requests are numbered differently
+        digest = hashlib.sha256(''.join(lines).encode('utf-8')).hexdigest()[:16]
+        id_path = input_path.parent / f"batch_{digest}.id"
+        
+        if id_path.exists():
+            batch = self._base_client.batches.retrieve(id_path.read_text().strip())
+            print(f"  Resuming batch {batch.id} ({len(lines)} requests, {batch.status})")
+        else:
+            with open(input_path, 'w', encoding='utf-8') as f:
+                f.writelines(lines)
+            with open(input_path, 'rb') as f:
+                input_file = self._base_client.files.create(file=f, purpose="batch")
+            batch = self._base_client.batches.create(
+                input_file_id=input_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h"
+            )
+            id_path.write_text(batch.id)
+            print(f"  Submitted batch {batch.id} ({len(lines)} requests)")
+        
+        while batch.status not in BATCH_DONE_STATUSES:
+            time.sleep(poll_interval)
+            batch = self._base_client.batches.retrieve(batch.id)
+            counts = batch.request_counts
+            if counts is not None:
+                print(f"    {batch.id}: {batch.status} ({counts.completed}/{counts.total} done)", end='\r')
+        print(f"    {batch.id}: {batch.status}" + " " * 30)
+        
+        if batch.status == 'failed':
+            id_path.unlink()
+            errors = batch.errors.data if batch.errors and batch.errors.data else []
+            details = "; ".join(f"{error.code}: {error.message}" for error in errors)
+            raise RuntimeError(f"Batch {batch.id} failed: {details or 'no error details'}")
+        if batch.status in ('expired', 'cancelled'):
+            print(f"    [WARNING] Batch {batch.id} {batch.status}; unanswered chunks will be sent on the next run")
+        if batch.error_file_id:
+            failed = batch.request_counts.failed if batch.request_counts is not None else "Some"
+            print(f"    [WARNING] {failed} requests failed; details in file {batch.error_file_id}")
+        
+        contents = {}
+        if not batch.output_file_id:
+            id_path.unlink()
+            return contents
+        
+        output = self._base_client.files.content(batch.output_file_id)
+        for raw_line in output.text.splitlines():
+            if not raw_line.strip():
+                continue
+            line = json.loads(raw_line)
+            response = line.get('response') or {}
+            if response.get('status_code') != 200:
+                continue
+            try:
+                contents[line['custom_id']] = response['body']['choices'][0]['message']['content']
+            except (KeyError, IndexError, TypeError):
+                continue
+        id_path.unlink()
+        return contents
+    
+    def extract_from_documents_batch(self,
+                                     documents: List[Dict],
+                                     work_dir: Path,
+                                     poll_interval: float = BATCH_POLL_INTERVAL,
+                                     min_keyword_matches: int = MIN_KEYWORD_MATCHES) -> Tuple[List[Dict], Set[Tuple[str, str]]]:
+        """
+        Extract event information for many documents through the OpenAI Batch API.
+        
+        Meant for the offline bulk run: requests cost half as much and do not
+        count against the RPM/TPM limits, but results can take up to 24 hours.
+        Chunks already in the response cache are answered from it and not sent.
+        
+        Only documents whose relevant chunks were all answered are returned. The
+        rest (requests that expired, were cancelled or failed) are left for the
+        next run, which reads the chunks answered so far from the cache.
+        
+        Args:
+            documents: Dictionaries with document_text, document_id, document_title,
+                author, event_id, event_name and event_keywords (as for extract_from_document)
+            work_dir: Directory for the batch input files and the ids of submitted batches
+            poll_interval: Seconds between batch status checks
+            min_keyword_matches: Keyword occurrences a chunk needs to be sent to the LLM
+            
+        Returns:
+            Tuple of the extraction results (one per relevant chunk with claims, in
+            document order) and the set of (document_id, event_id) pairs they cover
+        """
+        if not self.client:
+            print(f"  [SKIP] LLM client not available. Set OPENAI_API_KEY in .env file")
+            return [], set()
+        
+        work_dir = Path(work_dir)
+        work_dir.mkdir(parents=True, exist_ok=True)
+        
+        # custom_id -> (event_id, author, document_title, cache key, id of the request
+        # that answers it, (document_id, event_id) pair), in document order
+        requests_meta = {}
+        pairs = set()
+        extractions = {}
+        request_lines = []
+        queued = {}  # prompt -> custom_id it was sent under (identical chunks are sent once)
+        for doc in documents:
+            pair = (doc['document_id'], doc['event_id'])
+            pairs.add(pair)
+            relevant_chunks = self._find_relevant_chunks(
+                doc['document_text'], doc['document_id'], doc['event_keywords'], min_keyword_matches
+            )
+            for idx, chunk in enumerate(relevant_chunks):
+                custom_id = f"{doc['document_id']}::{doc['event_id']}::{idx}"
+                prompt = self._build_extraction_prompt(
+                    chunk['text'], doc['event_id'], doc['event_name'], doc['document_title'], doc['author']
+                )
+                cache_key = self._cache_key(prompt, EventExtraction)
+                answered_by = queued.setdefault(prompt, custom_id)
+                requests_meta[custom_id] = (
+                    doc['event_id'], doc['author'], doc['document_title'], cache_key, answered_by, pair
+                )
+                if answered_by != custom_id:
+                    continue
+                
+                cached = self._load_cached(cache_key, EventExtraction)
+                if cached is not None:
+                    extractions[custom_id] = cached
+                else:
+                    request_lines.append(self._batch_request_line(custom_id, prompt))
+        
+        print(f"  {len(requests_meta)} relevant chunks: {len(extractions)} cached, "
+              f"{len(request_lines)} sent to the Batch API")
+        
+        for batch_num, lines in enumerate(_split_batch_lines(request_lines), 1):
+            input_path = work_dir / f"batch_input_{batch_num}.jsonl"
+            contents = self._run_batch(lines, input_path, poll_interval)
+            for custom_id, content in contents.items():
+                try:
+                    extraction = EventExtraction.model_validate_json(content)
+                except Exception:
+                    continue  # Malformed response - no instructor retry on this path
+                self._store_cached(requests_meta[custom_id][3], extraction)
+                extractions[custom_id] = extraction
+        
+        # A pair is done once every one of its chunks has an answer
+        done_pairs = set(pairs)
+        for _, _, _, _, answered_by, pair in requests_meta.values():
+            if answered_by not in extractions:
+                done_pairs.discard(pair)
+        
+        results = []
+        for event_id, author, document_title, _, answered_by, pair in requests_meta.values():
+            extraction = extractions.get(answered_by)
+            if pair not in done_pairs or not extraction.claims:
+                continue
+            # Copy, since identical chunks share one response object
+            extraction = extraction.model_copy()
+            extraction.event = event_id
+            extraction.author = author
+            result = extraction.model_dump()
+            result['source_document'] = document_title
+            results.append(result)
+        
+        return results, done_pairs
@@ -10,6 +10,7 @@ For each (document, event) pair, it uses LLM to extract:
 Run this script to complete Part 2 of the project.
 """
 
+import asyncio
 import sys
 import json
 from pathlib import Path
@@ -23,6 +24,11 @@ from src.event_extraction.config import KEY_EVENTS
 from src.event_extraction.llm_extractor import LLMEventExtractor
 from src.event_extraction.document_chunker import DocumentChunker
 
+# Requests in flight across all documents (429s are retried with backoff)
+MAX_CONCURRENT_REQUESTS = 8
+# (document, event) pairs chunked and extracted at the same time
+MAX_CONCURRENT_DOCUMENTS = 8
+
 
 def load_datasets():
     """Load the normalized datasets from Part 1."""
@@ -58,9 +64,113 @@ def extract_author_from_title(title: str) -> str:
     return "Unknown Author"
 
 
-def main():
+def save_extractions(extractions, processed_pairs, output_file: Path, done_file: Path, progress_file: Path):
+    """
+    Write the consolidated extraction results and drop the JSONL progress log.
+    
+    Args:
+        extractions: All extraction results
+        processed_pairs: (document_id, event_id) pairs already extracted
+        output_file: Pretty-printed JSON array read by the later parts
+        done_file: JSON list of the processed pairs (read when resuming)
+        progress_file: Append-only JSONL log of the current run
+    """
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(extractions, f, indent=2, ensure_ascii=False)
+    save_processed_pairs(processed_pairs, done_file)
+    progress_file.unlink(missing_ok=True)
+
+
+def save_processed_pairs(processed_pairs, done_file: Path):
+    """
+    Write the (document_id, event_id) pairs already extracted.
+    
+    Args:
+        processed_pairs: Pairs already extracted
+        done_file: JSON list of the processed pairs (read when resuming)
+    """
+    with open(done_file, 'w', encoding='utf-8') as f:
+        json.dump(sorted(processed_pairs), f)
+
+
+def log_pair(progress_log, extractions, doc_id: str, event_id: str):
+    """
+    Append one (document, event) pair's results to the JSONL progress log.
+    
+    The pair's extractions are followed by a "done" record, so that pairs with
+    no relevant sections are not extracted again when resuming.
+    
+    Args:
+        progress_log: Open JSONL progress log
+        extractions: The pair's extraction results
+        doc_id: Document identifier
+        event_id: Event identifier
+    """
+    for extraction in extractions:
+        progress_log.write(json.dumps(extraction, ensure_ascii=False) + '\n')
+    progress_log.write(json.dumps({'done': True, 'document_id': doc_id, 'event': event_id}) + '\n')
+
+
+async def extract_pairs(extractor: LLMEventExtractor, jobs, all_extractions, processed_pairs, progress_log):
+    """
+    Extract every (document, event) pair concurrently.
+    
+    All pairs share one request semaphore (and the extractor's rate limiter),
+    so the API budget is used across documents and events instead of one
+    document at a time. Fewer pairs than that run at once, which bounds how
+    many chunked documents are held in memory.
+    
+    Args:
+        extractor: Initialized LLMEventExtractor
+        jobs: (event, document_id, title, content, author) tuples
+        all_extractions: List the results are appended to
+        processed_pairs: Set each finished (document_id, event_id) pair is added to
+        progress_log: Open JSONL file each pair's results are appended to
+    """
+    request_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    pair_semaphore = asyncio.Semaphore(MAX_CONCURRENT_DOCUMENTS)
+    
+    async def extract_pair(event, doc_id, title, content, author):
+        async with pair_semaphore:
+            try:
+                extractions = await extractor.extract_from_document_async(
+                    content,
+                    doc_id,
+                    title,
+                    author,
+                    event['id'],
+                    event['name'],
+                    event['_tokens'],
+                    semaphore=request_semaphore,
+                    show_progress=False
+                )
+            except Exception as e:
+                print(f"    [ERROR] {doc_id} / {event['id']}: {type(e).__name__}: {str(e)[:50]}")
+                return  # Not marked done, so the pair is retried on the next run
+        
+        all_extractions.extend(extractions)
+        processed_pairs.add((doc_id, event['id']))
+        
+        # Save incrementally after each pair (so we don't lose progress)
+        log_pair(progress_log, extractions, doc_id, event['id'])
+        progress_log.flush()
+        
+        if extractions:
+            print(f"    [{event['id']}] {title[:60]}: found {len(extractions)} relevant sections")
+        else:
+            print(f"    [{event['id']}] {title[:60]}: no relevant sections found")
+    
+    await asyncio.gather(*(extract_pair(*job) for job in jobs))
+
+
+def main(use_batch_api: bool = False, poll_interval: float = 60.0):
     """
     Main function to run Part 2: Event Extraction.
+    
+    Args:
+        use_batch_api: Send all chunks through the OpenAI Batch API (half the cost,
+            no rate limits, but results can take up to 24 hours)
+        poll_interval: Seconds between Batch API status checks
     """
     print("=" * 70)
     print("ML Evals Engineer - Lincoln Project")
@@ -89,6 +199,7 @@ def main():
     output_dir = project_root / "data" / "extracted"
     output_dir.mkdir(parents=True, exist_ok=True)
     output_file = output_dir / "event_extractions.json"
+    done_file = output_dir / "event_extractions_done.json"
     
     # Load existing results if resuming
     all_extractions = []
@@ -99,80 +210,74 @@ def main():
             with open(output_file, 'r', encoding='utf-8') as f:
                 existing = json.load(f)
                 all_extractions = existing
-                # Build set of already processed (document, event) pairs
-                for ext in existing:
-                    doc_id = ext.get('source_document', '')
-                    event_id = ext.get('event', '')
-                    if doc_id and event_id:
-                        # Extract document ID from source_document (might be title)
-                        # We'll use a simpler approach: track by checking if we have extractions
-                        pass
                 print(f"  Loaded {len(all_extractions)} existing extractions (will append new results)")
         except Exception as e:
             print(f"  Warning: Could not load existing results: {e}")
             all_extractions = []
     
-    # Process each event
-    print(f"\n[STEP 3] Extracting information for {len(KEY_EVENTS)} events...")
+    # Pairs extracted by earlier runs, including those that found nothing
+    if done_file.exists():
+        with open(done_file, 'r', encoding='utf-8') as f:
+            processed_pairs = {tuple(pair) for pair in json.load(f)}
+    
+    # Results of an earlier run that stopped before consolidating its progress log
+    progress_file = output_file.with_suffix('.jsonl')
+    if progress_file.exists():
+        recovered = []
+        with open(progress_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # Blank or half-written line from the interrupted run
+                if record.get('done'):
+                    processed_pairs.add((record['document_id'], record['event']))
+                else:
+                    recovered.append(record)
+        all_extractions.extend(recovered)
+        save_extractions(all_extractions, processed_pairs, output_file, done_file, progress_file)
+        print(f"  Recovered {len(recovered)} extractions from {progress_file.name}")
+    
+    legacy_pairs = set()
+    if not processed_pairs:
+        # Results saved before pairs were recorded by document ID only carry the
+        # document title (source_document)
+        for ext in all_extractions:
+            source_document = ext.get('source_document', '')
+            event_id = ext.get('event', '')
+            if source_document and event_id:
+                legacy_pairs.add((source_document, event_id))
+    
+    if processed_pairs or legacy_pairs:
+        print(f"  {len(processed_pairs) + len(legacy_pairs)} (document, event) pairs already done will be skipped")
     
+    # Each document's results are appended here as they come in, instead of
+    # rewriting the whole JSON file after every document
+    progress_log = open(progress_file, 'a', encoding='utf-8')
+    
+    # Process each event
+    # Collect every (document, event) pair that still needs extracting
+    jobs = []
     for event in KEY_EVENTS:
         event_id = event['id']
-        event_name = event['name']
-        event_keywords = event['keywords']
         
-        print(f"\n{'='*70}")
-        print(f"Processing Event: {event_name}")
-        print(f"{'='*70}")
-        
-        # Process Gutenberg books
-        print(f"\n  Processing {len(gutenberg_data)} Gutenberg books...")
         for book in gutenberg_data:
             book_id = book['id']
             book_title = book['title']
             book_content = book.get('content', '')
-            author = extract_author_from_title(book_title)
             
             if not book_content or len(book_content) < 100:
                 print(f"    [SKIP] {book_id}: No content")
                 continue
             
-            print(f"    Processing: {book_title[:60]}...")
-            try:
-                # Use parallel processing for faster extraction
-                extractions = extractor.extract_from_document_parallel(
-                    book_content,
-                    book_id,
-                    book_title,
-                    author,
-                    event_id,
-                    event_name,
-                    event_keywords,
-                    max_workers=3  # 3 workers for balanced speed and rate limit safety
-                )
-                
-                all_extractions.extend(extractions)
-                
-                # Save incrementally after each document (so we don't lose progress)
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    json.dump(all_extractions, f, indent=2, ensure_ascii=False)
-                
-                if extractions:
-                    print(f"      Found {len(extractions)} relevant sections")
-                else:
-                    print(f"      No relevant sections found (keywords: {', '.join(event_keywords[:3])}...)")
-            except KeyboardInterrupt:
-                print(f"\n[INTERRUPTED] Stopping extraction...")
-                # Save what we have so far
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    json.dump(all_extractions, f, indent=2, ensure_ascii=False)
-                print(f"  Progress saved to: {output_file}")
-                raise
-            except Exception as e:
-                print(f"      [ERROR] {type(e).__name__}: {str(e)[:50]}")
+            if (book_id, event_id) in processed_pairs or (book_title, event_id) in legacy_pairs:
+                print(f"    [SKIP] {book_id}: Already extracted for {event_id}")
+                processed_pairs.add((book_id, event_id))
                 continue
+            
+            author = extract_author_from_title(book_title)
+            jobs.append((event, book_id, book_title, book_content, author))
         
-        # Process LoC documents
-        print(f"\n  Processing {len(loc_data)} LoC documents...")
         for doc in loc_data:
             doc_id = doc['id']
             doc_title = doc['title']
@@ -183,46 +288,60 @@ def main():
                 print(f"    [SKIP] {doc_id}: No content")
                 continue
             
-            print(f"    Processing: {doc_title[:60]}...")
-            try:
-                # Use parallel processing for faster extraction
-                extractions = extractor.extract_from_document_parallel(
-                    doc_content,
-                    doc_id,
-                    doc_title,
-                    author,
-                    event_id,
-                    event_name,
-                    event_keywords,
-                    max_workers=3  # 3 workers for balanced speed and rate limit safety
-                )
-                
-                all_extractions.extend(extractions)
-                
-                # Save incrementally after each document (so we don't lose progress)
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    json.dump(all_extractions, f, indent=2, ensure_ascii=False)
-                
-                if extractions:
-                    print(f"      Found {len(extractions)} relevant sections")
-                else:
-                    print(f"      No relevant sections found")
-            except KeyboardInterrupt:
-                print(f"\n[INTERRUPTED] Stopping extraction...")
-                # Save what we have so far
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    json.dump(all_extractions, f, indent=2, ensure_ascii=False)
-                print(f"  Progress saved to: {output_file}")
-                raise
-            except Exception as e:
-                print(f"      [ERROR] {type(e).__name__}: {str(e)[:50]}")
+            if (doc_id, event_id) in processed_pairs or (doc_title, event_id) in legacy_pairs:
+                print(f"    [SKIP] {doc_id}: Already extracted for {event_id}")
+                processed_pairs.add((doc_id, event_id))
                 continue
+            
+            jobs.append((event, doc_id, doc_title, doc_content, author))
     
-    # Save results
-    print(f"\n[STEP 4] Saving extraction results...")
-    output_file = output_dir / "event_extractions.json"
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(all_extractions, f, indent=2, ensure_ascii=False)
+    if legacy_pairs:
+        # Record the skipped pairs by document ID from now on
+        save_processed_pairs(processed_pairs, done_file)
+    
+    mode = "via the Batch API" if use_batch_api else "processed concurrently"
+    print(f"\n[STEP 3] Extracting information for {len(KEY_EVENTS)} events "
+          f"({len(jobs)} document/event pairs, {mode})...")
+    
+    try:
+        if use_batch_api:
+            documents = [
+                {
+                    'document_text': content,
+                    'document_id': doc_id,
+                    'document_title': title,
+                    'author': author,
+                    'event_id': event['id'],
+                    'event_name': event['name'],
+                    'event_keywords': event['_tokens'],
+                }
+                for event, doc_id, title, content, author in jobs
+            ]
+            extractions, done_pairs = extractor.extract_from_documents_batch(
+                documents, output_dir / "batch", poll_interval=poll_interval
+            )
+            all_extractions.extend(extractions)
+            for extraction in extractions:
+                progress_log.write(json.dumps(extraction, ensure_ascii=False) + '\n')
+            # Pairs with unanswered chunks are left for the next run
+            for doc_id, event_id in sorted(done_pairs):
+                log_pair(progress_log, [], doc_id, event_id)
+            processed_pairs.update(done_pairs)
+            progress_log.flush()
+            if len(done_pairs) < len(jobs):
+                print(f"  {len(jobs) - len(done_pairs)} pairs not fully answered; rerun to send them again")
+        else:
+            extractor.run(extract_pairs(extractor, jobs, all_extractions, processed_pairs, progress_log))
+    except KeyboardInterrupt:
+        print(f"\n[INTERRUPTED] Stopping extraction...")
+        raise
+    finally:
+        # Stop the in-flight extractions before saving, so nothing is appended afterwards
+        extractor.close()
+        # Save what we have so far, also when the run stopped on an error
+        print(f"\n[STEP 4] Saving extraction results...")
+        progress_log.close()
+        save_extractions(all_extractions, processed_pairs, output_file, done_file, progress_file)
     
     print(f"\n{'='*70}")
     print("PART 2 COMPLETE - Summary")
@@ -234,5 +353,13 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    import argparse
+    parser = argparse.ArgumentParser(description="Run Part 2 event extraction")
+    parser.add_argument("--batch-api", action="store_true",
+                        help="Use the OpenAI Batch API (50%% cheaper, results within 24 hours)")
+    parser.add_argument("--poll-interval", type=float, default=60.0,
+                        help="Seconds between Batch API status checks (default: 60)")
+    args = parser.parse_args()
+    
+    main(use_batch_api=args.batch_api, poll_interval=args.poll_interval)
 
@@ -47,3 +47,11 @@ class EventExtraction(BaseModel):
     )
 
 
+class BatchedEventExtraction(BaseModel):
+    """
+    Extractions for several chunks answered in a single LLM request.
+    """
+    results: List[EventExtraction] = Field(
+        default_factory=list,
+        description="One extraction per chunk, in the order the chunks were given"
+    )
@@ -0,0 +1,106 @@
+"""
+LLM Response Cache
+
+Stores validated LLM responses in a sqlite database under data/cache/ so that
+re-running the extraction (or re-sending a chunk that is already answered)
+reads the stored response instead of calling the API again.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+script_dir = Path(__file__).parent
+project_root = script_dir.parent.parent
+
+DEFAULT_CACHE_PATH = project_root / "data" / "cache" / "llm_responses.sqlite"
+
+
+@lru_cache(maxsize=None)
+def _schema_fingerprint(response_model) -> str:
+    """Serialized JSON schema of a response model (generated once per model class)."""
+    return json.dumps(response_model.model_json_schema(), sort_keys=True)
+
+
+def make_cache_key(model: str,
+                   system_prompt: str,
+                   prompt: str,
+                   temperature: float,
+                   response_model) -> str:
+    """
+    Build the cache key for one chat completion request.
+
+    Args:
+        model: Model name
+        system_prompt: System message
+        prompt: User message
+        temperature: Sampling temperature
+        response_model: Pydantic model the response is validated against
+
+    Returns:
+        Hex SHA-256 digest of everything that determines the response
+    """
+    # Whitespace is collapsed so that chunks differing only in line wrapping or
+    # spacing (e.g. the same passage in two editions) share one entry
+    prompt = " ".join(prompt.split())
+    # The schema is part of the key so changing the Pydantic model invalidates old entries
+    schema = _schema_fingerprint(response_model)
+    payload = "\x1f".join([model, system_prompt, prompt, repr(temperature), schema])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """
+    Thread-safe sqlite store of LLM responses (as JSON) keyed by request hash.
+    """
+
+    def __init__(self, path: Path = None):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: Path of the sqlite file (defaults to data/cache/llm_responses.sqlite)
+        """
+        self.path = Path(path or DEFAULT_CACHE_PATH)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Shared by the extractor's worker threads, serialized by the lock
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, response TEXT NOT NULL)"
+            )
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a stored response.
+
+        Args:
+            key: Key from make_cache_key
+
+        Returns:
+            Response JSON, or None on a miss
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, response_json: str):
+        """
+        Store a response.
+
+        Args:
+            key: Key from make_cache_key
+            response_json: Validated response serialized as JSON
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, response) VALUES (?, ?)",
+                (key, response_json)
+            )